@@ -21,34 +21,66 @@ Building Blocks (for advanced usage):
     cluster = StandardCluster(self, "gke", config=profile.get_cluster_config(), ...)
 """
 
+# Building Blocks
+from .cache import StandardCache
+
 # Composite (Recommended for most users)
 from .composites import StandardPlatform
 
 # Configuration
-from .config import ClusterConfig, NetworkConfig
+from .config import (
+    CacheConfig,
+    ClusterConfig,
+    DatabaseConfig,
+    FrozenDict,
+    IngressBackend,
+    NetworkConfig,
+)
+from .database import StandardDatabase
 from .gke import StandardCluster
-
-# Building Blocks
+from .ingress import StandardIngress
 from .networking import StandardVPC
 
 # Profiles (Golden Paths)
-from .profiles import DevProfile, PlatformProfile, ProdProfile, StagingProfile
+from .profiles import (
+    DevProfile,
+    PlatformProfile,
+    ProdProfile,
+    StagingProfile,
+    clear_config_cache,
+    get_profile,
+)
+from .provider import StandardProvider
+from .registry import StandardRegistry
 from .security import StandardIdentity, StandardSecrets
+from .services import StandardServices
 
 __all__ = [
     # Composite
     "StandardPlatform",
     # Building Blocks
+    "StandardProvider",
     "StandardVPC",
     "StandardCluster",
     "StandardSecrets",
     "StandardIdentity",
+    "StandardRegistry",
+    "StandardIngress",
+    "StandardCache",
+    "StandardDatabase",
+    "StandardServices",
     # Config
     "NetworkConfig",
     "ClusterConfig",
+    "IngressBackend",
+    "CacheConfig",
+    "DatabaseConfig",
+    "FrozenDict",
     # Profiles
     "PlatformProfile",
     "DevProfile",
     "StagingProfile",
     "ProdProfile",
+    "get_profile",
+    "clear_config_cache",
 ]
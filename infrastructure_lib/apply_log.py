@@ -0,0 +1,508 @@
+"""
+Apply-log analyzer and local timing database.
+
+Parses `terraform apply` output of StandardPlatform stacks and records how
+long every resource took to create, update or delete, so apply-time
+estimates rest on measured data:
+
+- Machine-readable UI logs (`terraform apply -json`): apply_start,
+  apply_complete and apply_errored messages with timestamps
+- Human-readable output (`terraform apply` / `cdktf deploy`): "Creating...",
+  "Creation complete after 7m32s" lines (no wall-clock times); ANSI colors,
+  cdktf stack prefixes and construct paths are ignored
+
+Each parsed log is one run, appended to a JSON Lines timing database on local
+disk (the same log is only recorded once). The report lists the slowest
+resources and per resource type, profile and action: samples, p50/p95/max
+and the trend of the latest run against the earlier ones.
+
+The profile (dev, staging, prod) is taken from --profile, the stack name or
+the resource IDs ({prefix}-{env}-... names), otherwise "unknown".
+
+Usage:
+    terraform apply -json | tee apply.jsonl
+    python -m infrastructure_lib.apply_log apply.jsonl --stack shop-prod   # record + report
+    python -m infrastructure_lib.apply_log                                  # report only
+    python -m infrastructure_lib.apply_log deploy.log --no-record --json
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import re
+import sys
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, Union
+
+DEFAULT_DB = "apply_timings.jsonl"
+PROFILES = ("dev", "staging", "prod")
+UNKNOWN_PROFILE = "unknown"
+ACTIONS = ("create", "update", "delete", "replace")
+
+COMPLETE = "complete"
+ERRORED = "errored"
+
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+# "<addr> (<construct path>): Creating..." / "<addr>: Creation complete after 7m32s [id=...]"
+TEXT_EVENT = re.compile(
+    r"(?P<addr>(?:module\.[\w-]+\.)*[a-z0-9_]+\.[\w-]+(?:\[[^\]]+\])?)(?: \([^)]*\))?: "
+    r"(?P<event>Creating|Modifying|Destroying|"
+    r"Creation complete|Modifications complete|Destruction complete)"
+    r"(?:\.\.\.| after (?P<elapsed>[\dhms.]+))(?: \[id=(?P<id>[^\]]*)\])?"
+)
+TEXT_EVENTS = {
+    "Creating": ("create", False),
+    "Modifying": ("update", False),
+    "Destroying": ("delete", False),
+    "Creation complete": ("create", True),
+    "Modifications complete": ("update", True),
+    "Destruction complete": ("delete", True),
+}
+DURATION = re.compile(r"(?:(\d+)h)?(?:(\d+)m)?(?:(\d+(?:\.\d+)?)s)?")
+ENV_IN_ID = re.compile(r"-(dev|staging|prod)-")
+
+
+@dataclass
+class ResourceTiming:
+    """Provisioning time of one resource action in one apply run."""
+
+    address: str
+    resource_type: str
+    action: str
+    status: str
+    seconds: Optional[float] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+
+@dataclass
+class ApplyRun:
+    """Resource timings parsed from one apply log."""
+
+    run_id: str
+    stack: str
+    profile: str
+    recorded_at: str
+    started_at: Optional[str] = None
+    resources: list[ResourceTiming] = field(default_factory=list)
+
+    @property
+    def order_key(self) -> str:
+        """Chronological sort key (apply start, or recording time for text logs)."""
+        return self.started_at or self.recorded_at
+
+
+@dataclass
+class TimingStats:
+    """Durations of one resource type, profile and action over all runs."""
+
+    resource_type: str
+    profile: str
+    action: str
+    samples: int
+    p50: float
+    p95: float
+    max: float
+    runs: int
+    trend_pct: Optional[float] = None
+
+
+@dataclass
+class SlowResource:
+    """Durations of one resource address over all runs."""
+
+    stack: str
+    address: str
+    resource_type: str
+    action: str
+    samples: int
+    p50: float
+    max: float
+
+
+# --- Parsing ---
+
+
+def parse_duration(text: str) -> float:
+    """Seconds of a Terraform duration ("7m32s", "1h2m", "45s")."""
+    match = DURATION.fullmatch(text)
+    if not text or match is None:
+        raise ValueError(f"Invalid duration '{text}'")
+    hours, minutes, seconds = match.groups()
+    return int(hours or 0) * 3600 + int(minutes or 0) * 60 + float(seconds or 0)
+
+
+def resource_type_of(address: str) -> str:
+    """Resource type of an address (module.x.google_compute_network.vpc[0] -> google_compute_network)."""
+    parts = re.sub(r"\[[^\]]*\]", "", address).split(".")
+    return parts[-2] if len(parts) >= 2 else address
+
+
+def _utc(timestamp: Optional[str]) -> Optional[str]:
+    """ISO timestamp normalized to UTC (None if missing or unparsable)."""
+    if not timestamp:
+        return None
+    # fromisoformat before Python 3.11 takes neither "Z" nor more than 6 fractional digits
+    value = re.sub(r"(\.\d{6})\d+", r"\1", timestamp.replace("Z", "+00:00"))
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def _seconds_between(start: Optional[str], end: Optional[str]) -> Optional[float]:
+    if start is None or end is None:
+        return None
+    return (datetime.fromisoformat(end) - datetime.fromisoformat(start)).total_seconds()
+
+
+def parse_json_log(lines: Iterable[str]) -> tuple[list[ResourceTiming], list[str]]:
+    """
+    Parse a `terraform apply -json` log.
+
+    Returns:
+        (timings, resource IDs) - resources that started but never finished
+        are reported as errored without a duration
+
+    Raises:
+        ValueError: If a line is not a JSON object
+    """
+    started: dict[tuple[str, str], ResourceTiming] = {}
+    timings: list[ResourceTiming] = []
+    ids: list[str] = []
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"line {number}: not a JSON log message ({e})") from e
+        if not isinstance(message, dict):
+            raise ValueError(f"line {number}: not a JSON log message")
+        kind = message.get("type")
+        if kind not in ("apply_start", "apply_complete", "apply_errored"):
+            continue
+        hook = message.get("hook") or {}
+        resource = hook.get("resource") or {}
+        address, action = resource.get("addr"), hook.get("action")
+        if not address or action not in ACTIONS:
+            continue
+        timestamp = _utc(message.get("@timestamp"))
+        key = (address, action)
+
+        if kind == "apply_start":
+            started[key] = ResourceTiming(
+                address=address,
+                resource_type=resource.get("resource_type") or resource_type_of(address),
+                action=action,
+                status=ERRORED,
+                started_at=timestamp,
+            )
+            continue
+
+        timing = started.pop(key, None) or ResourceTiming(
+            address, resource.get("resource_type") or resource_type_of(address), action, ERRORED
+        )
+        timing.status = COMPLETE if kind == "apply_complete" else ERRORED
+        timing.finished_at = timestamp
+        elapsed = hook.get("elapsed_seconds")
+        timing.seconds = (
+            float(elapsed)
+            if elapsed is not None
+            else _seconds_between(timing.started_at, timing.finished_at)
+        )
+        if hook.get("id_value"):
+            ids.append(str(hook["id_value"]))
+        timings.append(timing)
+
+    timings.extend(started.values())
+    return timings, ids
+
+
+def parse_text_log(lines: Iterable[str]) -> tuple[list[ResourceTiming], list[str]]:
+    """
+    Parse human-readable `terraform apply` or `cdktf deploy` output.
+
+    Returns:
+        (timings, resource IDs) - resources that started but never finished
+        are reported as errored without a duration
+    """
+    started: dict[tuple[str, str], ResourceTiming] = {}
+    timings: list[ResourceTiming] = []
+    ids: list[str] = []
+    for line in lines:
+        match = TEXT_EVENT.search(ANSI_ESCAPE.sub("", line))
+        if match is None:
+            continue
+        address = match["addr"]
+        action, finished = TEXT_EVENTS[match["event"]]
+        key = (address, action)
+        if match["id"]:
+            ids.append(match["id"])
+        if not finished:
+            started[key] = ResourceTiming(address, resource_type_of(address), action, ERRORED)
+            continue
+        timing = started.pop(key, None) or ResourceTiming(
+            address, resource_type_of(address), action, ERRORED
+        )
+        timing.status = COMPLETE
+        timing.seconds = parse_duration(match["elapsed"]) if match["elapsed"] else None
+        timings.append(timing)
+
+    timings.extend(started.values())
+    return timings, ids
+
+
+def infer_profile(stack: str, resource_ids: Iterable[str] = ()) -> str:
+    """Profile from the stack name tokens, then from {prefix}-{env}- resource names."""
+    tokens = set(re.split(r"[^a-z0-9]+", stack.lower()))
+    for profile in PROFILES:
+        if profile in tokens:
+            return profile
+    for resource_id in resource_ids:
+        match = ENV_IN_ID.search(f"-{resource_id}-".replace("/", "-"))
+        if match:
+            return match.group(1)
+    return UNKNOWN_PROFILE
+
+
+def parse_apply_log(
+    path: Union[str, Path], stack: Optional[str] = None, profile: Optional[str] = None
+) -> ApplyRun:
+    """
+    Parse an apply log (JSON UI or plain text, detected from the first line).
+
+    Args:
+        path: Log file
+        stack: Stack name (default: file name without extension)
+        profile: Profile name (default: inferred, see infer_profile)
+
+    Raises:
+        ValueError: If a JSON log contains malformed lines
+    """
+    path = Path(path)
+    content = path.read_text(encoding="utf-8", errors="replace")
+    lines = content.splitlines()
+    first = next((line.strip() for line in lines if line.strip()), "")
+    if first.startswith("{"):
+        timings, ids = parse_json_log(lines)
+    else:
+        timings, ids = parse_text_log(lines)
+
+    stack = stack or path.name.split(".")[0]
+    starts = [t.started_at for t in timings if t.started_at]
+    return ApplyRun(
+        run_id=hashlib.sha256(content.encode()).hexdigest()[:16],
+        stack=stack,
+        profile=profile or infer_profile(stack, ids),
+        recorded_at=datetime.now(timezone.utc).isoformat(),
+        started_at=min(starts) if starts else None,
+        resources=timings,
+    )
+
+
+# --- Timing database ---
+
+
+def load_runs(path: Union[str, Path]) -> list[ApplyRun]:
+    """
+    Load recorded runs (missing database = no runs).
+
+    Raises:
+        ValueError: If a line is not a recorded run
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+    runs = []
+    for number, line in enumerate(path.read_text().splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+            resources = [ResourceTiming(**r) for r in data.pop("resources")]
+            runs.append(ApplyRun(**data, resources=resources))
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"{path}:{number}: invalid timing record ({e})") from e
+    return runs
+
+
+def record_run(path: Union[str, Path], run: ApplyRun) -> bool:
+    """Append a run to the database. Returns False if the same log was already recorded."""
+    path = Path(path)
+    if any(r.run_id == run.run_id for r in load_runs(path)):
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as f:
+        f.write(json.dumps(asdict(run), sort_keys=True) + "\n")
+    return True
+
+
+# --- Analysis ---
+
+
+def _durations(timings: Iterable[ResourceTiming]) -> list[float]:
+    return sorted(t.seconds for t in timings if t.status == COMPLETE and t.seconds is not None)
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0-100) of a non-empty ascending list."""
+    return sorted_values[max(math.ceil(q / 100 * len(sorted_values)), 1) - 1]
+
+
+def timing_stats(runs: list[ApplyRun]) -> list[TimingStats]:
+    """
+    Duration percentiles per resource type, profile and action, slowest p95 first.
+
+    trend_pct compares the median of the latest run containing the group with
+    the median of all earlier runs (None with a single run).
+    """
+    groups: dict[tuple[str, str, str], list[tuple[str, list[ResourceTiming]]]] = {}
+    for run in sorted(runs, key=lambda r: r.order_key):
+        by_group: dict[tuple[str, str, str], list[ResourceTiming]] = {}
+        for timing in run.resources:
+            key = (timing.resource_type, run.profile, timing.action)
+            by_group.setdefault(key, []).append(timing)
+        for key, timings in by_group.items():
+            if _durations(timings):
+                groups.setdefault(key, []).append((run.run_id, timings))
+
+    stats = []
+    for (resource_type, profile, action), per_run in groups.items():
+        durations = _durations(t for _, timings in per_run for t in timings)
+        trend = None
+        if len(per_run) > 1:
+            latest = _durations(per_run[-1][1])
+            earlier = _durations(t for _, timings in per_run[:-1] for t in timings)
+            baseline = _percentile(earlier, 50)
+            if baseline > 0:
+                trend = (_percentile(latest, 50) - baseline) / baseline * 100
+        stats.append(
+            TimingStats(
+                resource_type=resource_type,
+                profile=profile,
+                action=action,
+                samples=len(durations),
+                p50=_percentile(durations, 50),
+                p95=_percentile(durations, 95),
+                max=durations[-1],
+                runs=len(per_run),
+                trend_pct=trend,
+            )
+        )
+    return sorted(stats, key=lambda s: (-s.p95, s.resource_type, s.profile, s.action))
+
+
+def slowest_resources(runs: list[ApplyRun], top: int = 10) -> list[SlowResource]:
+    """The top resource addresses by median duration over all runs."""
+    by_address: dict[tuple[str, str, str], list[ResourceTiming]] = {}
+    for run in runs:
+        for timing in run.resources:
+            by_address.setdefault((run.stack, timing.address, timing.action), []).append(timing)
+
+    slow = []
+    for (stack, address, action), timings in by_address.items():
+        durations = _durations(timings)
+        if durations:
+            slow.append(
+                SlowResource(
+                    stack=stack,
+                    address=address,
+                    resource_type=timings[0].resource_type,
+                    action=action,
+                    samples=len(durations),
+                    p50=_percentile(durations, 50),
+                    max=durations[-1],
+                )
+            )
+    return sorted(slow, key=lambda s: (-s.p50, s.stack, s.address))[:top]
+
+
+# --- Output ---
+
+
+def format_duration(seconds: float) -> str:
+    """Terraform-style duration (452 -> 7m32s)."""
+    minutes, secs = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h{minutes}m{secs}s"
+    return f"{minutes}m{secs}s" if minutes else f"{secs}s"
+
+
+def format_report(slowest: list[SlowResource], stats: list[TimingStats], runs: int) -> str:
+    """Render the slowest resources and per-type statistics as plain-text tables."""
+    if not stats:
+        return f"No completed resource timings in {runs} run(s)."
+
+    width = max((len(s.address) for s in slowest), default=len("ADDRESS"))
+    header = f"{'STACK':<20} {'ADDRESS':<{width}} {'ACTION':<7} {'RUNS':>4} {'P50':>8} {'MAX':>8}"
+    lines = [f"Slowest resources ({runs} run(s))", header, "-" * len(header)]
+    for slow in slowest:
+        lines.append(
+            f"{slow.stack:<20} {slow.address:<{width}} {slow.action:<7} {slow.samples:>4} "
+            f"{format_duration(slow.p50):>8} {format_duration(slow.max):>8}"
+        )
+
+    width = max(len(s.resource_type) for s in stats)
+    header = (
+        f"{'RESOURCE TYPE':<{width}} {'PROFILE':<8} {'ACTION':<7} {'N':>4} "
+        f"{'P50':>8} {'P95':>8} {'MAX':>8} {'TREND':>7}"
+    )
+    lines += ["", "By resource type and profile", header, "-" * len(header)]
+    for s in stats:
+        trend = "-" if s.trend_pct is None else f"{s.trend_pct:+.0f}%"
+        lines.append(
+            f"{s.resource_type:<{width}} {s.profile:<8} {s.action:<7} {s.samples:>4} "
+            f"{format_duration(s.p50):>8} {format_duration(s.p95):>8} "
+            f"{format_duration(s.max):>8} {trend:>7}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point. Records the given logs, then reports on the database."""
+    parser = argparse.ArgumentParser(description="Apply-log analyzer and timing database")
+    parser.add_argument("logs", nargs="*", help="terraform apply logs (-json or plain text)")
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"Timing database (default: {DEFAULT_DB})")
+    parser.add_argument("--stack", help="Stack name of the logs (default: log file name)")
+    parser.add_argument("--profile", choices=PROFILES, help="Profile (default: inferred)")
+    parser.add_argument(
+        "--no-record", action="store_true", help="Report on the logs without recording them"
+    )
+    parser.add_argument("--top", type=int, default=10, help="Slowest resources to list")
+    parser.add_argument("--json", action="store_true", help="Output JSON instead of tables")
+    args = parser.parse_args(argv)
+
+    parsed = [parse_apply_log(log, args.stack, args.profile) for log in args.logs]
+    if args.no_record:
+        runs = parsed
+    else:
+        for run in parsed:
+            if not record_run(args.db, run):
+                print(f"{run.stack}: log already recorded ({run.run_id})", file=sys.stderr)
+        runs = load_runs(args.db)
+
+    slowest = slowest_resources(runs, args.top)
+    stats = timing_stats(runs)
+    if args.json:
+        report: dict[str, Any] = {
+            "runs": len(runs),
+            "slowest": [asdict(s) for s in slowest],
+            "by_type": [asdict(s) for s in stats],
+        }
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(slowest, stats, len(runs)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""
+In-VPC cache construct with Memorystore for Redis.
+
+Provides:
+- StandardCache: Redis instance reachable only over private services access
+"""
+
+from typing import Optional
+
+from cdktf import ITerraformDependable
+from cdktf_cdktf_provider_google.redis_instance import RedisInstance
+from constructs import Construct
+
+from .config import CacheConfig
+
+
+class StandardCache(Construct):
+    """
+    Memorystore for Redis next to the cluster, on private IPs only.
+
+    Creates a Redis instance in PRIVATE_SERVICE_ACCESS mode, allocated from the
+    VPC's private services range (StandardVPC with private_services_access=True).
+    STANDARD_HA instances get replicas in another zone; with read_replicas the
+    replicas also serve reads through the read endpoint.
+
+    Args:
+        scope: CDK scope
+        id: Construct ID
+        config: CacheConfig instance
+        network_id: VPC network ID
+        reserved_ip_range: Name of the private services range
+        depends_on: Resources to wait for (pass the service networking connection)
+        labels: Optional resource labels
+
+    Attributes:
+        instance: The RedisInstance resource
+        host: Primary endpoint IP
+        port: Primary endpoint port
+        read_endpoint: Read replica endpoint IP (read_replicas only)
+
+    Example:
+        profile = ProdProfile("my-project", "europe-west1", "prod", "myapp")
+        vpc = StandardVPC(self, "vpc",
+            config=profile.get_network_config(private_services_access=True)
+        )
+        cache = StandardCache(self, "cache",
+            config=profile.get_cache_config(),
+            network_id=vpc.network_id,
+            reserved_ip_range=vpc.private_services_range.name,
+            depends_on=[vpc.private_services_connection]
+        )
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        config: CacheConfig,
+        network_id: str,
+        reserved_ip_range: str,
+        depends_on: Optional[list[ITerraformDependable]] = None,
+        labels: Optional[dict[str, str]] = None,
+    ):
+        super().__init__(scope, id)
+
+        if not reserved_ip_range:
+            raise ValueError("reserved_ip_range is required (private services access range name)")
+
+        # Default labels
+        resource_labels = {
+            "environment": config.env,
+            "managed-by": "cdktf",
+        }
+        if labels:
+            resource_labels.update(labels)
+
+        self.instance = RedisInstance(
+            self,
+            "redis",
+            name=config.instance_name,
+            project=config.project_id,
+            region=config.region,
+            tier=config.tier,
+            memory_size_gb=config.memory_size_gb,
+            redis_version=config.redis_version,
+            # Private services access: no public endpoint, peered into the VPC
+            connect_mode="PRIVATE_SERVICE_ACCESS",
+            authorized_network=network_id,
+            reserved_ip_range=reserved_ip_range,
+            replica_count=config.replica_count,
+            read_replicas_mode="READ_REPLICAS_ENABLED" if config.read_replicas else None,
+            labels=resource_labels,
+            depends_on=depends_on,
+        )
+
+    @property
+    def host(self) -> str:
+        """Get the primary endpoint IP."""
+        return self.instance.host
+
+    @property
+    def port(self) -> float:
+        """Get the primary endpoint port."""
+        return self.instance.port
+
+    @property
+    def read_endpoint(self) -> str:
+        """Get the read replica endpoint IP."""
+        return self.instance.read_endpoint
@@ -0,0 +1,195 @@
+"""
+Offline capacity report for platform profiles and fleet specs.
+
+For every platform, computes the cluster capacity range implied by
+min_nodes/max_nodes (plus the on-demand fallback pool of spot_fallback
+clusters) and the machine type catalog, validates the machine type and
+flags risky combinations.
+
+Usage:
+    python -m infrastructure_lib.capacity                 # built-in profiles
+    python -m infrastructure_lib.capacity fleet.json      # fleet spec
+    python -m infrastructure_lib.capacity fleet.json --json
+"""
+
+import argparse
+import ipaddress
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Optional
+
+from .config import ClusterConfig, NetworkConfig
+from .fleet import PlatformSpec, default_fleet, load_fleet
+from .machine_types import get_machine_type, suggest_machine_types
+
+# GKE reserves a /24 of the pod range per node at the default 110 max pods
+POD_RANGE_PREFIX_PER_NODE = 24
+
+
+@dataclass
+class CapacityReport:
+    """Capacity range and findings for a single platform."""
+
+    name: str
+    env: str
+    machine_type: str
+    min_nodes: int
+    max_nodes: int
+    min_vcpus: float = 0
+    max_vcpus: float = 0
+    min_memory_gb: float = 0
+    max_memory_gb: float = 0
+    min_pods: int = 0
+    max_pods: int = 0
+    errors: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True if no errors were found."""
+        return not self.errors
+
+
+def max_nodes_for_pod_range(pod_cidr: str) -> int:
+    """Number of nodes the pod secondary range can hold (one /24 per node)."""
+    prefix = ipaddress.ip_network(pod_cidr, strict=False).prefixlen
+    return 2 ** max(POD_RANGE_PREFIX_PER_NODE - prefix, 0)
+
+
+def build_capacity_report(
+    name: str, config: ClusterConfig, network: Optional[NetworkConfig] = None
+) -> CapacityReport:
+    """
+    Compute the capacity report for a cluster configuration.
+
+    Args:
+        name: Platform name used in the report
+        config: ClusterConfig to evaluate
+        network: Optional NetworkConfig, enables pod range checks
+
+    Returns:
+        CapacityReport instance
+    """
+    # The on-demand fallback pool can run next to a full spot pool
+    max_nodes = config.max_nodes + config.fallback_node_limit
+    report = CapacityReport(
+        name=name,
+        env=config.env,
+        machine_type=config.machine_type,
+        min_nodes=config.min_nodes,
+        max_nodes=max_nodes,
+    )
+
+    if config.autopilot:
+        # Autopilot sizes nodes per pod: there is no node pool to evaluate
+        report.machine_type = "autopilot"
+        report.min_nodes = report.max_nodes = 0
+        return report
+
+    machine = get_machine_type(config.machine_type)
+    if machine is None:
+        suggestions = suggest_machine_types(config.machine_type)
+        hint = f" (did you mean: {', '.join(suggestions)}?)" if suggestions else ""
+        report.errors.append(f"Unknown machine type '{config.machine_type}'{hint}")
+        return report
+
+    report.min_vcpus = machine.vcpus * config.min_nodes
+    report.max_vcpus = machine.vcpus * max_nodes
+    report.min_memory_gb = machine.memory_gb * config.min_nodes
+    report.max_memory_gb = machine.memory_gb * max_nodes
+    report.min_pods = machine.max_pods * config.min_nodes
+    report.max_pods = machine.max_pods * max_nodes
+
+    if not machine.supports_disk(config.disk_type):
+        report.errors.append(
+            f"{machine.name} does not support disk type '{config.disk_type}' "
+            f"(supported: {', '.join(machine.disk_types)})"
+        )
+
+    if config.env == "prod":
+        if machine.shared_core:
+            report.errors.append(
+                f"HA-critical prod on shared-core machine type {machine.name} "
+                "(CPU is burstable, not guaranteed)"
+            )
+        if config.spot_instances:
+            report.warnings.append("prod uses spot instances (nodes can be reclaimed at any time)")
+        if config.min_nodes < 3:
+            report.warnings.append(
+                f"prod min_nodes={config.min_nodes} is below the HA minimum of 3"
+            )
+
+    if network is not None:
+        # The cluster's regional subnet (additional regions have their own pod range)
+        pod_cidr = next(
+            (s.pod_cidr for s in network.subnets if s.region == config.region), network.pod_cidr
+        )
+        pod_range_nodes = max_nodes_for_pod_range(pod_cidr)
+        if max_nodes > pod_range_nodes:
+            report.warnings.append(
+                f"max_nodes={max_nodes} exceeds pod range {pod_cidr} "
+                f"capacity of {pod_range_nodes} nodes"
+            )
+
+    return report
+
+
+def fleet_capacity_report(specs: list[PlatformSpec]) -> list[CapacityReport]:
+    """
+    Build a capacity report for every cluster in a fleet.
+
+    Additional regions of a multi-region platform are reported as
+    {platform}/{region}.
+    """
+    reports = []
+    for spec in specs:
+        network = spec.get_network_config()
+        for region, config in spec.get_cluster_configs().items():
+            name = spec.name if region == spec.region else f"{spec.name}/{region}"
+            reports.append(build_capacity_report(name, config, network))
+    return reports
+
+
+def format_capacity_report(reports: list[CapacityReport]) -> str:
+    """Render reports as a plain-text table followed by findings."""
+    header = (
+        f"{'PLATFORM':<24} {'MACHINE':<16} {'NODES':>7} {'VCPU':>13} "
+        f"{'MEMORY (GB)':>15} {'PODS':>11}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in reports:
+        lines.append(
+            f"{r.name:<24} {r.machine_type:<16} {f'{r.min_nodes}-{r.max_nodes}':>7} "
+            f"{f'{r.min_vcpus:g}-{r.max_vcpus:g}':>13} "
+            f"{f'{r.min_memory_gb:g}-{r.max_memory_gb:g}':>15} "
+            f"{f'{r.min_pods}-{r.max_pods}':>11}"
+        )
+    for r in reports:
+        for message in r.errors:
+            lines.append(f"ERROR   {r.name}: {message}")
+        for message in r.warnings:
+            lines.append(f"WARNING {r.name}: {message}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point. Returns 1 if any platform has errors."""
+    parser = argparse.ArgumentParser(description="Offline capacity report for platforms")
+    parser.add_argument("fleet", nargs="?", help="Fleet spec JSON (default: built-in profiles)")
+    parser.add_argument("--json", action="store_true", help="Output JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    specs = load_fleet(args.fleet) if args.fleet else default_fleet()
+    reports = fleet_capacity_report(specs)
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in reports], indent=2))
+    else:
+        print(format_capacity_report(reports))
+
+    return 0 if all(r.ok for r in reports) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+Compact synthesized output.
+
+cdktf writes every resource with a "//" metadata block (construct path and
+unique ID) and pretty-prints the JSON. Compact mode rewrites each stack's
+cdk.tf.json without the per-block metadata, minified, and optionally writes a
+gzipped copy (cdk.tf.json.gz) for artifact uploads. The top-level stack
+metadata block is kept because the cdktf CLI reads it; terraform ignores
+"//" keys either way, so plans are unchanged.
+
+Usage:
+    python -m infrastructure_lib.compact cdktf.out
+    python -m infrastructure_lib.compact cdktf.out --gzip --json
+
+Or opt in from the app, after app.synth():
+    compact_output(app.outdir, gzip=True)
+"""
+
+import argparse
+import gzip as gzip_lib
+import json
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .synth_diff import METADATA_KEY, strip_metadata
+
+GZIP_SUFFIX = ".gz"
+
+
+@dataclass
+class SizeReport:
+    """Size of one stack's cdk.tf.json before and after compaction (bytes)."""
+
+    stack: str
+    original_bytes: int
+    compact_bytes: int
+    gzip_bytes: Optional[int] = None
+
+    @property
+    def saved_percent(self) -> float:
+        """Reduction of the written artifact (gzip if enabled) in percent."""
+        final = self.gzip_bytes if self.gzip_bytes is not None else self.compact_bytes
+        if not self.original_bytes:
+            return 0.0
+        return 100.0 * (self.original_bytes - final) / self.original_bytes
+
+
+def compact_synth(synth: dict[str, Any]) -> dict[str, Any]:
+    """Drop per-block "//" metadata, keeping the top-level stack metadata."""
+    compact = strip_metadata(synth)
+    if METADATA_KEY in synth:
+        compact = {METADATA_KEY: synth[METADATA_KEY], **compact}
+    return compact
+
+
+def dumps_compact(synth: dict[str, Any]) -> str:
+    """Serialize synthesized JSON without whitespace."""
+    return json.dumps(compact_synth(synth), separators=(",", ":"))
+
+
+def compact_file(path: Union[str, Path], gzip: bool = False) -> SizeReport:
+    """
+    Rewrite a cdk.tf.json in place in compact form.
+
+    Args:
+        path: Path to a cdk.tf.json file
+        gzip: Also write a gzipped copy next to it (cdk.tf.json.gz)
+
+    Returns:
+        SizeReport for the file
+    """
+    path = Path(path)
+    original = path.read_bytes()
+    compact = dumps_compact(json.loads(original)).encode("utf-8")
+    path.write_bytes(compact)
+
+    gzip_bytes = None
+    if gzip:
+        # mtime=0 keeps the archive byte-identical across runs (cache-friendly uploads)
+        compressed = gzip_lib.compress(compact, compresslevel=9, mtime=0)
+        path.with_name(path.name + GZIP_SUFFIX).write_bytes(compressed)
+        gzip_bytes = len(compressed)
+
+    return SizeReport(path.parent.name, len(original), len(compact), gzip_bytes)
+
+
+def compact_output(outdir: Union[str, Path], gzip: bool = False) -> list[SizeReport]:
+    """
+    Compact every stack of a synthesized cdktf.out directory.
+
+    Raises:
+        ValueError: If no synthesized stacks are found
+    """
+    outdir = Path(outdir)
+    stacks_dir = outdir / "stacks" if (outdir / "stacks").is_dir() else outdir
+    files = sorted(stacks_dir.glob("*/cdk.tf.json"))
+    if not files:
+        raise ValueError(f"No synthesized stacks found in {outdir}")
+    return [compact_file(f, gzip=gzip) for f in files]
+
+
+def format_size_report(reports: list[SizeReport]) -> str:
+    """Render a size comparison table."""
+    has_gzip = any(r.gzip_bytes is not None for r in reports)
+    header = f"{'STACK':<30} {'ORIGINAL':>10} {'COMPACT':>10}"
+    if has_gzip:
+        header += f" {'GZIP':>10}"
+    header += f" {'SAVED':>7}"
+    lines = [header]
+
+    for r in reports:
+        line = f"{r.stack:<30} {r.original_bytes:>10,} {r.compact_bytes:>10,}"
+        if has_gzip:
+            line += f" {r.gzip_bytes or 0:>10,}"
+        line += f" {r.saved_percent:>6.1f}%"
+        lines.append(line)
+
+    if len(reports) > 1:
+        total = SizeReport(
+            "TOTAL",
+            sum(r.original_bytes for r in reports),
+            sum(r.compact_bytes for r in reports),
+            sum(r.gzip_bytes or 0 for r in reports) if has_gzip else None,
+        )
+        lines.append(format_size_report([total]).splitlines()[1])
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Compact synthesized CDKTF output in place")
+    parser.add_argument("outdir", help="cdktf.out directory")
+    parser.add_argument("--gzip", action="store_true", help="Also write cdk.tf.json.gz")
+    parser.add_argument("--json", action="store_true", help="Output JSON instead of text")
+    args = parser.parse_args(argv)
+
+    reports = compact_output(args.outdir, gzip=args.gzip)
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in reports], indent=2))
+    else:
+        print(format_size_report(reports))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
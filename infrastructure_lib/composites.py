@@ -9,10 +9,16 @@ from typing import Optional
 
 from constructs import Construct
 
-from .gke import StandardCluster
+from .cache import StandardCache
+from .config import IngressBackend
+from .database import StandardDatabase
+from .gke import NODE_TAG, StandardCluster
+from .ingress import StandardIngress
 from .networking import StandardVPC
-from .profiles import DevProfile, PlatformProfile, ProdProfile, StagingProfile
+from .profiles import get_profile
+from .registry import StandardRegistry
 from .security import StandardIdentity, StandardSecrets
+from .services import StandardServices
 
 
 class StandardPlatform(Construct):
@@ -20,6 +26,9 @@ class StandardPlatform(Construct):
     Complete platform infrastructure in a single construct.
 
     Creates: VPC + Subnet + NAT + GKE Cluster + (optional) Secrets + (optional) Workload Identity
+             + (optional) Artifact Registry + (optional) Ingress load balancer
+             + (optional) Memorystore cache + (optional) Cloud SQL database
+             + API enablement for everything above
 
     This is the recommended way to use x-infra-kit for most use cases.
 
@@ -27,18 +36,40 @@ class StandardPlatform(Construct):
         scope: CDK scope
         id: Construct ID
         project_id: GCP project ID (required)
-        region: GCP region (required)
+        region: GCP region (required); primary region of multi-region platforms
         env: Environment - dev, staging, or prod (required)
         prefix: Resource naming prefix (required)
         secret_ids: List of secret IDs to create in Secret Manager
         workload_identity: Dict with {sa_id, k8s_namespace, k8s_sa_name, roles}
-        **cluster_overrides: Override any ClusterConfig parameter
+        registry: Dict with {repository_id, docker_hub_cache} (both optional);
+                  also enables image streaming unless overridden
+        ingress: Dict with {backends, domains, zones}; backends are IngressBackend instances
+                 or dicts with IngressBackend fields; zones defaults to the cluster
+                 zones (required with autopilot, whose pods span the region's zones)
+        cache: Dict of CacheConfig overrides ({} for profile defaults);
+               also enables private services access on the VPC
+        database: Dict of DatabaseConfig overrides ({} for profile defaults);
+                  also enables private services access on the VPC
+        enable_services: Enable the APIs the platform uses (default: True)
+        additional_regions: More regions to serve from the same VPC; each gets a
+                            subnet, router, NAT and cluster with non-overlapping
+                            ranges (cache and database stay in region)
+        psc_google_apis: Reach Google APIs through a Private Service Connect endpoint
+                         ("all-apis" or "vpc-sc") with private DNS for
+                         *.googleapis.com and *.pkg.dev (default: None)
+        **cluster_overrides: Override any ClusterConfig parameter (all clusters)
 
     Attributes:
         vpc: StandardVPC instance
-        cluster: StandardCluster instance
+        cluster: StandardCluster instance (primary region)
+        clusters: Dict of region to StandardCluster (all regions)
         secrets: StandardSecrets instance (if secret_ids provided)
         identity: StandardIdentity instance (if workload_identity provided)
+        registry: StandardRegistry instance (if registry provided)
+        ingress: StandardIngress instance (if ingress provided)
+        cache: StandardCache instance (if cache provided)
+        database: StandardDatabase instance (if database provided)
+        services: StandardServices instance (if enable_services)
 
     Example:
         # Minimal usage
@@ -62,6 +93,13 @@ class StandardPlatform(Construct):
                 "k8s_sa_name": "app-sa",
                 "roles": ["roles/secretmanager.secretAccessor"]
             },
+            registry={"docker_hub_cache": True},
+            ingress={
+                "backends": [{"name": "web", "neg_name": "web-neg", "port": 8080}],
+                "domains": ["shop.example.com"]
+            },
+            cache={"memory_size_gb": 10},
+            database={"read_replicas": 2},
             max_nodes=20,
             machine_type="n2-standard-8"
         )
@@ -79,6 +117,13 @@ class StandardPlatform(Construct):
         # OPTIONAL
         secret_ids: Optional[list[str]] = None,
         workload_identity: Optional[dict] = None,
+        registry: Optional[dict] = None,
+        ingress: Optional[dict] = None,
+        cache: Optional[dict] = None,
+        database: Optional[dict] = None,
+        enable_services: bool = True,
+        additional_regions: Optional[list[str]] = None,
+        psc_google_apis: Optional[str] = None,
         **cluster_overrides,
     ):
         super().__init__(scope, id)
@@ -90,31 +135,33 @@ class StandardPlatform(Construct):
         self.prefix = prefix
 
         # 1. Select profile based on environment
-        profile: PlatformProfile
-        if env == "prod":
-            profile = ProdProfile(project_id, region, env, prefix)
-        elif env == "staging":
-            profile = StagingProfile(project_id, region, env, prefix)
-        else:
-            profile = DevProfile(project_id, region, env, prefix)
+        profile = get_profile(project_id, region, env, prefix)
 
         # 2. Create VPC and Networking
-        network_config = profile.get_network_config()
+        network_overrides: dict = {"additional_regions": list(additional_regions or [])}
+        if cache is not None or database is not None:
+            network_overrides["private_services_access"] = True
+        if psc_google_apis is not None:
+            network_overrides["psc_google_apis"] = psc_google_apis
+        network_config = profile.get_network_config(**network_overrides)
         self.vpc = StandardVPC(self, "networking", config=network_config)
 
-        # 3. Create GKE Cluster (with optional overrides)
-        cluster_config = profile.get_cluster_config(
-            pod_range_name=network_config.pod_range_name,
-            service_range_name=network_config.service_range_name,
-            **cluster_overrides,
-        )
-        self.cluster = StandardCluster(
-            self,
-            "compute",
-            config=cluster_config,
-            network_id=self.vpc.network.id,
-            subnet_id=self.vpc.subnet.id,
-        )
+        # 3. Create GKE Cluster per region (with optional overrides)
+        if registry is not None:
+            cluster_overrides.setdefault("image_streaming", True)
+        cluster_configs = profile.get_cluster_configs(network_config, **cluster_overrides)
+        self.clusters: dict[str, StandardCluster] = {
+            cluster_region: StandardCluster(
+                self,
+                "compute" if cluster_region == region else f"compute_{cluster_region}",
+                config=config,
+                network_id=self.vpc.network.id,
+                subnet_id=self.vpc.subnet_id_for(cluster_region),
+            )
+            for cluster_region, config in cluster_configs.items()
+        }
+        self.cluster = self.clusters[region]
+        cluster_config = cluster_configs[region]
 
         # 4. Create Secrets (optional)
         self._secrets = None
@@ -143,6 +190,78 @@ class StandardPlatform(Construct):
                 roles=workload_identity.get("roles", []),
             )
 
+        # 6. Create Artifact Registry (optional)
+        self._registry = None
+        if registry is not None:
+            self._registry = StandardRegistry(
+                self,
+                "registry",
+                project_id=project_id,
+                region=region,
+                repository_id=registry.get("repository_id", f"{prefix}-{env}"),
+                docker_hub_cache=registry.get("docker_hub_cache", False),
+            )
+
+        # 7. Create Ingress load balancer (optional)
+        self._ingress = None
+        if ingress is not None:
+            backends = [
+                b if isinstance(b, IngressBackend) else IngressBackend(**b)
+                for b in ingress.get("backends", [])
+            ]
+            zones = ingress.get("zones")
+            if not zones:
+                if cluster_config.autopilot:
+                    raise ValueError("ingress 'zones' is required with autopilot=True")
+                zones = [c.effective_zone for c in cluster_configs.values()]
+            self._ingress = StandardIngress(
+                self,
+                "ingress",
+                project_id=project_id,
+                name=f"{prefix}-{env}",
+                network_id=self.vpc.network.id,
+                zones=zones,
+                backends=backends,
+                domains=ingress.get("domains"),
+                # Node pool and Autopilot nodes all carry NODE_TAG
+                target_tags=[NODE_TAG],
+            )
+
+        # 8. Create Memorystore cache (optional)
+        psa_range = self.vpc.private_services_range
+        psa_connection = self.vpc.private_services_connection
+        self._cache = None
+        if cache is not None:
+            if psa_range is None or psa_connection is None:
+                raise ValueError("cache requires private services access on the VPC")
+            self._cache = StandardCache(
+                self,
+                "cache",
+                config=profile.get_cache_config(**cache),
+                network_id=self.vpc.network.id,
+                reserved_ip_range=psa_range.name,
+                depends_on=[psa_connection],
+            )
+
+        # 9. Create Cloud SQL database (optional)
+        self._database = None
+        if database is not None:
+            if psa_range is None or psa_connection is None:
+                raise ValueError("database requires private services access on the VPC")
+            self._database = StandardDatabase(
+                self,
+                "database",
+                config=profile.get_database_config(**database),
+                network_id=self.vpc.network.id,
+                allocated_ip_range=psa_range.name,
+                depends_on=[psa_connection],
+            )
+
+        # 10. Enable required APIs (after all constructs so it can see them)
+        self._services = None
+        if enable_services:
+            self._services = StandardServices(self, "services", project_id=project_id, target=self)
+
     # --- Safe Access Properties ---
 
     @property
@@ -155,6 +274,31 @@ class StandardPlatform(Construct):
         """Check if workload identity was configured."""
         return self._identity is not None
 
+    @property
+    def has_registry(self) -> bool:
+        """Check if the artifact registry was configured."""
+        return self._registry is not None
+
+    @property
+    def has_ingress(self) -> bool:
+        """Check if the ingress load balancer was configured."""
+        return self._ingress is not None
+
+    @property
+    def has_cache(self) -> bool:
+        """Check if the cache was configured."""
+        return self._cache is not None
+
+    @property
+    def has_database(self) -> bool:
+        """Check if the database was configured."""
+        return self._database is not None
+
+    @property
+    def has_services(self) -> bool:
+        """Check if API enablement was configured."""
+        return self._services is not None
+
     @property
     def secrets(self) -> StandardSecrets:
         """
@@ -183,6 +327,72 @@ class StandardPlatform(Construct):
             )
         return self._identity
 
+    @property
+    def registry(self) -> StandardRegistry:
+        """
+        Get the StandardRegistry instance.
+
+        Raises:
+            ValueError: If the registry was not configured
+        """
+        if self._registry is None:
+            raise ValueError(
+                "Registry not configured. Provide 'registry' parameter to StandardPlatform."
+            )
+        return self._registry
+
+    @property
+    def ingress(self) -> StandardIngress:
+        """
+        Get the StandardIngress instance.
+
+        Raises:
+            ValueError: If the ingress was not configured
+        """
+        if self._ingress is None:
+            raise ValueError(
+                "Ingress not configured. Provide 'ingress' parameter to StandardPlatform."
+            )
+        return self._ingress
+
+    @property
+    def cache(self) -> StandardCache:
+        """
+        Get the StandardCache instance.
+
+        Raises:
+            ValueError: If the cache was not configured
+        """
+        if self._cache is None:
+            raise ValueError("Cache not configured. Provide 'cache' parameter to StandardPlatform.")
+        return self._cache
+
+    @property
+    def database(self) -> StandardDatabase:
+        """
+        Get the StandardDatabase instance.
+
+        Raises:
+            ValueError: If the database was not configured
+        """
+        if self._database is None:
+            raise ValueError(
+                "Database not configured. Provide 'database' parameter to StandardPlatform."
+            )
+        return self._database
+
+    @property
+    def services(self) -> StandardServices:
+        """
+        Get the StandardServices instance.
+
+        Raises:
+            ValueError: If API enablement was disabled (enable_services=False)
+        """
+        if self._services is None:
+            raise ValueError("Services not configured. Pass enable_services=True.")
+        return self._services
+
     # --- Convenience Properties ---
 
     @property
@@ -195,6 +405,11 @@ class StandardPlatform(Construct):
         """Get the GKE cluster endpoint (API server URL)."""
         return self.cluster.cluster.endpoint
 
+    @property
+    def cluster_endpoints(self) -> dict[str, str]:
+        """Get the GKE cluster endpoint per region."""
+        return {region: c.cluster.endpoint for region, c in self.clusters.items()}
+
     @property
     def network_id(self) -> str:
         """Get the VPC network ID."""
@@ -1,12 +1,261 @@
-from dataclasses import dataclass
-from typing import Optional
+import hashlib
+import ipaddress
+import json
+import math
+import re
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field, fields
+from typing import Any, NoReturn, Optional
 
+# Sysctls GKE allows in linux_node_config (Linux node system configuration)
+ALLOWED_SYSCTLS = frozenset(
+    {
+        "net.core.busy_poll",
+        "net.core.busy_read",
+        "net.core.netdev_max_backlog",
+        "net.core.optmem_max",
+        "net.core.rmem_default",
+        "net.core.rmem_max",
+        "net.core.somaxconn",
+        "net.core.wmem_default",
+        "net.core.wmem_max",
+        "net.ipv4.tcp_rmem",
+        "net.ipv4.tcp_wmem",
+        "net.ipv4.tcp_tw_reuse",
+        "net.ipv4.tcp_max_orphans",
+        "net.ipv6.conf.all.disable_ipv6",
+        "net.ipv6.conf.default.disable_ipv6",
+        "net.netfilter.nf_conntrack_acct",
+        "net.netfilter.nf_conntrack_buckets",
+        "net.netfilter.nf_conntrack_max",
+        "net.netfilter.nf_conntrack_tcp_timeout_close_wait",
+        "net.netfilter.nf_conntrack_tcp_timeout_established",
+        "net.netfilter.nf_conntrack_tcp_timeout_time_wait",
+        "fs.aio-max-nr",
+        "fs.file-max",
+        "fs.inotify.max_user_instances",
+        "fs.inotify.max_user_watches",
+        "fs.nr_open",
+        "kernel.shmall",
+        "kernel.shmmax",
+        "kernel.shmmni",
+        "vm.max_map_count",
+    }
+)
 
-@dataclass
+# Node tuning presets: ClusterConfig field defaults applied by tuning_preset
+NODE_TUNING_PRESETS: dict[str, dict[str, Any]] = {
+    # Network-heavy services: deep accept/backlog queues, large TCP buffers,
+    # big conntrack table, exclusive cores for Guaranteed pods without CFS throttling
+    "high-throughput": {
+        "cpu_manager_policy": "static",
+        "cpu_cfs_quota": False,
+        "pod_pids_limit": 4096,
+        "cgroup_mode": "CGROUP_MODE_V2",
+        "sysctls": {
+            "net.core.somaxconn": "4096",
+            "net.core.netdev_max_backlog": "30000",
+            "net.core.rmem_max": "16777216",
+            "net.core.wmem_max": "16777216",
+            "net.ipv4.tcp_rmem": "4096 87380 16777216",
+            "net.ipv4.tcp_wmem": "4096 65536 16777216",
+            "net.ipv4.tcp_tw_reuse": "1",
+            "net.netfilter.nf_conntrack_max": "1048576",
+        },
+    },
+}
+
+# GKE Cloud Monitoring / Cloud Logging components (monitoring_config / logging_config)
+MONITORING_COMPONENTS = (
+    "SYSTEM_COMPONENTS",
+    "APISERVER",
+    "SCHEDULER",
+    "CONTROLLER_MANAGER",
+    "STORAGE",
+    "HPA",
+    "POD",
+    "DAEMONSET",
+    "DEPLOYMENT",
+    "STATEFULSET",
+    "JOBSET",
+    "KUBELET",
+    "CADVISOR",
+    "DCGM",
+)
+LOGGING_COMPONENTS = (
+    "SYSTEM_COMPONENTS",
+    "APISERVER",
+    "CONTROLLER_MANAGER",
+    "SCHEDULER",
+    "WORKLOADS",
+)
+
+# Cluster telemetry presets: ClusterConfig field defaults applied by telemetry_preset
+TELEMETRY_PRESETS: dict[str, dict[str, Any]] = {
+    # System metrics and logs only: smallest metric/log volume
+    "minimal": {
+        "managed_prometheus": False,
+        "monitoring_components": ["SYSTEM_COMPONENTS"],
+        "logging_components": ["SYSTEM_COMPONENTS", "WORKLOADS"],
+    },
+    # Managed Prometheus + workload state metrics
+    "standard": {
+        "managed_prometheus": True,
+        "monitoring_components": ["SYSTEM_COMPONENTS", "STORAGE", "POD", "DEPLOYMENT"],
+        "logging_components": ["SYSTEM_COMPONENTS", "WORKLOADS"],
+    },
+    # Everything needed to profile scaling: control plane, kubelet and cAdvisor metrics
+    "full": {
+        "managed_prometheus": True,
+        "monitoring_components": [
+            "SYSTEM_COMPONENTS",
+            "APISERVER",
+            "SCHEDULER",
+            "CONTROLLER_MANAGER",
+            "STORAGE",
+            "HPA",
+            "POD",
+            "DAEMONSET",
+            "DEPLOYMENT",
+            "STATEFULSET",
+            "KUBELET",
+            "CADVISOR",
+        ],
+        "logging_components": [
+            "SYSTEM_COMPONENTS",
+            "APISERVER",
+            "CONTROLLER_MANAGER",
+            "SCHEDULER",
+            "WORKLOADS",
+        ],
+    },
+}
+
+UPGRADE_STRATEGIES = ("SURGE", "BLUE_GREEN")
+CPU_MANAGER_POLICIES = ("none", "static")
+CGROUP_MODES = ("CGROUP_MODE_UNSPECIFIED", "CGROUP_MODE_V1", "CGROUP_MODE_V2")
+AUTOSCALING_PROFILES = ("BALANCED", "OPTIMIZE_UTILIZATION")
+FLOW_LOG_INTERVALS = (
+    "INTERVAL_5_SEC",
+    "INTERVAL_30_SEC",
+    "INTERVAL_1_MIN",
+    "INTERVAL_5_MIN",
+    "INTERVAL_10_MIN",
+    "INTERVAL_15_MIN",
+)
+FLOW_LOG_METADATA = ("INCLUDE_ALL_METADATA", "EXCLUDE_ALL_METADATA")
+NAT_LOG_FILTERS = ("ERRORS_ONLY", "TRANSLATIONS_ONLY", "ALL")
+MAX_REGIONS = 8
+# GKE rejects longer cluster and node pool names at apply time
+MAX_GKE_NAME_LENGTH = 40
+PSC_GOOGLE_API_BUNDLES = ("all-apis", "vpc-sc")
+# Domains resolved to the Private Service Connect endpoint for Google APIs
+PSC_API_DOMAINS = ("googleapis.com", "pkg.dev")
+
+
+class FrozenDict(dict):
+    """Read-only, hashable dict used for the dict fields of frozen configs."""
+
+    __slots__ = ()
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self) -> tuple:
+        return (type(self), (dict(self),))
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore[assignment]
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-ready copy of a config value (tuples as lists, dict keys as strings)."""
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    return value
+
+
+def canonical_json(config: Any) -> str:
+    """
+    Canonical serialization of a config dataclass.
+
+    Only init fields are included (derived values follow from them), keys are
+    sorted and separators fixed, so the result does not depend on field order,
+    override order or the Python version.
+    """
+    data = {
+        "type": type(config).__name__,
+        "fields": {f.name: _canonical(getattr(config, f.name)) for f in fields(config) if f.init},
+    }
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), allow_nan=False)
+
+
+def config_fingerprint(config: Any) -> str:
+    """SHA-256 hex digest of canonical_json(config)."""
+    return hashlib.sha256(canonical_json(config).encode()).hexdigest()
+
+
+def offset_cidr(cidr: str, index: int) -> str:
+    """Shift a CIDR block by index blocks of its own size (10.0.0.0/16, 1 -> 10.1.0.0/16)."""
+    network = ipaddress.ip_network(cidr)
+    base = int(network.network_address) + index * network.num_addresses
+    return str(ipaddress.ip_network((base, network.prefixlen)))
+
+
+_REGION_AREAS = {"northamerica": "na", "southamerica": "sa"}
+
+
+def region_suffix(region: str) -> str:
+    """
+    Short name suffix for a region (europe-west4 -> euw4, australia-southeast1 -> ause1).
+
+    Keeps region-suffixed cluster and node pool names within MAX_GKE_NAME_LENGTH.
+    """
+    area, _, location = region.partition("-")
+    directions = re.findall(r"north|south|east|west|central|\d+", location)
+    if not location or "".join(directions) != location:
+        raise ValueError(f"Invalid region '{region}'")
+    short = "".join(d if d.isdigit() else d[0] for d in directions)
+    return _REGION_AREAS.get(area, area[:2]) + short
+
+
+@dataclass(frozen=True)
+class RegionalSubnet:
+    """
+    Subnet, router and NAT settings of one VPC region (see NetworkConfig.subnets).
+
+    Attributes:
+        region: GCP region
+        subnet_name: Subnet name
+        router_name: Cloud Router name
+        nat_name: Cloud NAT name
+        cidr: Primary subnet CIDR (node IPs)
+        pod_cidr: Secondary range for pods
+        service_cidr: Secondary range for services
+    """
+
+    region: str
+    subnet_name: str
+    router_name: str
+    nat_name: str
+    cidr: str
+    pod_cidr: str
+    service_cidr: str
+
+
+@dataclass(frozen=True)
 class NetworkConfig:
     """
     Network configuration for VPC and Subnet.
 
+    Instances are immutable and hashable (use dataclasses.replace to derive a
+    variant); derived names and subnets are computed once at construction.
+
     Required:
         project_id: GCP project ID
         region: GCP region
@@ -19,6 +268,27 @@ class NetworkConfig:
         service_cidr: Secondary range for services (default: 10.12.0.0/21)
         pod_range_name: Name for pod secondary range (default: pod-ranges)
         service_range_name: Name for service secondary range (default: service-ranges)
+        private_services_access: Reserve a range and peer it with Google services
+                                 (Memorystore, Cloud SQL) (default: False)
+        private_services_cidr: Range allocated to private services (default: 10.20.0.0/16)
+        flow_logs: Enable VPC flow logs on the subnet (default: False)
+        flow_logs_interval: Flow log aggregation interval (default: INTERVAL_5_SEC)
+        flow_logs_sampling: Fraction of flows logged, 0.0-1.0 (default: 0.5)
+        flow_logs_metadata: INCLUDE_ALL_METADATA or EXCLUDE_ALL_METADATA
+                            (default: INCLUDE_ALL_METADATA)
+        nat_logging: Cloud NAT log filter: ERRORS_ONLY, TRANSLATIONS_ONLY or ALL
+                     (default: None = disabled)
+        additional_regions: More regions served by the same global VPC, each with
+                            its own subnet, router and NAT (default: (); any sequence,
+                            stored as a tuple). Region N
+                            uses cidr, pod_cidr and service_cidr shifted by N blocks
+                            of their size (10.0.0.0/16 -> 10.1.0.0/16).
+        psc_google_apis: Private Service Connect endpoint for Google APIs: "all-apis"
+                         or "vpc-sc" (VPC Service Controls supported APIs only),
+                         with private DNS for PSC_API_DOMAINS (default: None = public
+                         API VIPs via private Google access)
+        psc_address: Internal IP of the PSC endpoint, outside all subnet ranges
+                     (default: 10.254.0.2)
     """
 
     # REQUIRED
@@ -33,24 +303,175 @@ class NetworkConfig:
     service_cidr: str = "10.12.0.0/21"
     pod_range_name: str = "pod-ranges"
     service_range_name: str = "service-ranges"
+    private_services_access: bool = False
+    private_services_cidr: str = "10.20.0.0/16"
+    flow_logs: bool = False
+    flow_logs_interval: str = "INTERVAL_5_SEC"
+    flow_logs_sampling: float = 0.5
+    flow_logs_metadata: str = "INCLUDE_ALL_METADATA"
+    nat_logging: Optional[str] = None
+    additional_regions: Sequence[str] = ()
+    psc_google_apis: Optional[str] = None
+    psc_address: str = "10.254.0.2"
+
+    # AUTO-GENERATED (computed once in __post_init__)
+    _vpc_name: str = field(init=False, repr=False, compare=False)
+    _subnets: tuple[RegionalSubnet, ...] = field(init=False, repr=False, compare=False)
+    _fingerprint: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
-    # AUTO-GENERATED (computed properties)
     @property
     def vpc_name(self) -> str:
         """Standard naming: {prefix}-{env}-vpc"""
-        return f"{self.prefix}-{self.env}-vpc"
+        return self._vpc_name
 
     @property
     def subnet_name(self) -> str:
         """Standard naming: {prefix}-{env}-subnet"""
-        return f"{self.prefix}-{self.env}-subnet"
+        return self._subnets[0].subnet_name
 
+    @property
+    def private_services_range_name(self) -> str:
+        """Standard naming: {prefix}-{env}-psa-range"""
+        return f"{self.prefix}-{self.env}-psa-range"
 
-@dataclass
+    @property
+    def psc_endpoint_name(self) -> str:
+        """PSC endpoint naming: psc{prefix}{env}, letters and digits only, at most 20 chars"""
+        return re.sub(r"[^a-z0-9]", "", f"psc{self.prefix}{self.env}".lower())[:20]
+
+    @property
+    def regions(self) -> tuple[str, ...]:
+        """Primary region followed by additional_regions."""
+        return (self.region, *self.additional_regions)
+
+    @property
+    def is_multi_region(self) -> bool:
+        """True if the VPC spans more than one region."""
+        return bool(self.additional_regions)
+
+    @property
+    def subnets(self) -> tuple[RegionalSubnet, ...]:
+        """
+        Subnet settings per region, primary region first.
+
+        The primary region keeps the single-region names; additional regions
+        are named {prefix}-{env}-{region}-subnet, {vpc_name}-{region}-router/-nat.
+        """
+        return self._subnets
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable SHA-256 of the canonical serialization (see canonical_json)."""
+        if self._fingerprint is None:
+            object.__setattr__(self, "_fingerprint", config_fingerprint(self))
+        return self._fingerprint  # type: ignore[return-value]
+
+    def canonical_json(self) -> str:
+        """Canonical JSON of the configuration fields (sorted keys, no whitespace)."""
+        return canonical_json(self)
+
+    def subnet_for(self, region: str) -> RegionalSubnet:
+        """
+        Subnet settings of a region.
+
+        Raises:
+            ValueError: If the region is not part of this network
+        """
+        for subnet in self.subnets:
+            if subnet.region == region:
+                return subnet
+        raise ValueError(f"Region '{region}' is not in {list(self.regions)}")
+
+    def _build_subnets(self) -> tuple[RegionalSubnet, ...]:
+        """RegionalSubnet per region (see subnets)."""
+        subnets = []
+        for index, region in enumerate(self.regions):
+            suffix = "" if index == 0 else f"-{region}"
+            subnets.append(
+                RegionalSubnet(
+                    region=region,
+                    subnet_name=f"{self.prefix}-{self.env}{suffix}-subnet",
+                    router_name=f"{self._vpc_name}{suffix}-router",
+                    nat_name=f"{self._vpc_name}{suffix}-nat",
+                    cidr=offset_cidr(self.cidr, index),
+                    pod_cidr=offset_cidr(self.pod_cidr, index),
+                    service_cidr=offset_cidr(self.service_cidr, index),
+                )
+            )
+        return tuple(subnets)
+
+    def __post_init__(self):
+        """Freeze collection fields, compute derived values and validate configuration."""
+        object.__setattr__(self, "additional_regions", tuple(self.additional_regions))
+        if self.flow_logs_interval not in FLOW_LOG_INTERVALS:
+            raise ValueError(
+                f"flow_logs_interval must be one of {FLOW_LOG_INTERVALS}, "
+                f"got '{self.flow_logs_interval}'"
+            )
+        if not 0.0 < self.flow_logs_sampling <= 1.0:
+            raise ValueError(
+                f"flow_logs_sampling ({self.flow_logs_sampling}) must be in (0.0, 1.0]"
+            )
+        if self.flow_logs_metadata not in FLOW_LOG_METADATA:
+            raise ValueError(
+                f"flow_logs_metadata must be one of {FLOW_LOG_METADATA}, "
+                f"got '{self.flow_logs_metadata}'"
+            )
+        if self.nat_logging is not None and self.nat_logging not in NAT_LOG_FILTERS:
+            raise ValueError(
+                f"nat_logging must be one of {NAT_LOG_FILTERS} or None, got '{self.nat_logging}'"
+            )
+        if self.psc_google_apis is not None and (
+            self.psc_google_apis not in PSC_GOOGLE_API_BUNDLES
+        ):
+            raise ValueError(
+                f"psc_google_apis must be one of {PSC_GOOGLE_API_BUNDLES} or None, "
+                f"got '{self.psc_google_apis}'"
+            )
+        self._validate_regions()
+        object.__setattr__(self, "_vpc_name", f"{self.prefix}-{self.env}-vpc")
+        object.__setattr__(self, "_subnets", self._build_subnets())
+        self._validate_ranges()
+
+    def _validate_regions(self):
+        """Validate additional regions."""
+        if len(set(self.regions)) != len(self.regions):
+            raise ValueError(f"Regions must be unique, got {list(self.regions)}")
+        if len(self.regions) > MAX_REGIONS:
+            raise ValueError(
+                f"At most {MAX_REGIONS} regions are supported, got {len(self.regions)}"
+            )
+
+    def _validate_ranges(self):
+        """Validate that no address ranges of any region overlap."""
+        ranges = []
+        for subnet in self.subnets:
+            ranges += [
+                (f"{subnet.region} cidr", subnet.cidr),
+                (f"{subnet.region} pod_cidr", subnet.pod_cidr),
+                (f"{subnet.region} service_cidr", subnet.service_cidr),
+            ]
+        if self.private_services_access:
+            ranges.append(("private_services_cidr", self.private_services_cidr))
+        if self.psc_google_apis is not None:
+            ranges.append(("psc_address", f"{self.psc_address}/32"))
+
+        networks = [(name, ipaddress.ip_network(cidr)) for name, cidr in ranges]
+        for i, (name, network) in enumerate(networks):
+            for other_name, other in networks[i + 1 :]:
+                if network.overlaps(other):
+                    raise ValueError(f"{name} ({network}) overlaps {other_name} ({other})")
+
+
+@dataclass(frozen=True)
 class ClusterConfig:
     """
     GKE Cluster configuration.
 
+    Instances are immutable and hashable (use dataclasses.replace to derive a
+    variant); sysctls (any mapping) is stored as a read-only FrozenDict and
+    component sequences as tuples.
+
     Required:
         project_id: GCP project ID
         region: GCP region
@@ -64,8 +485,76 @@ class ClusterConfig:
         min_nodes: Autoscaler minimum (default: 1)
         max_nodes: Autoscaler maximum (default: 3)
         disk_size: Node disk size in GB (default: 50)
+        disk_type: Node boot disk type (default: pd-standard)
         spot_instances: Use spot/preemptible VMs (default: True)
         master_cidr: Private cluster master CIDR (default: 172.16.0.0/28)
+        image_streaming: Enable GKE image streaming on node pools (default: False)
+        autopilot: Provision a regional Autopilot cluster instead of a zonal cluster
+                   with a managed node pool (default: False). Node pool settings
+                   (machine type, node counts, disks, spot, image streaming) are
+                   ignored; node tuning and upgrade settings are rejected.
+        name_suffix: Appended to the cluster name, e.g. region_suffix() of an additional
+                     cluster of a multi-region platform (default: None). The cluster
+                     name and node pool names ({cluster_name}-pool and, with
+                     spot_fallback, {cluster_name}-ondemand-pool) must fit in 40
+                     characters.
+
+    Spot fallback (optional, requires spot_instances=True):
+        spot_fallback: Pair the spot node pool with an on-demand pool that scales from
+                       0 when spot capacity is reclaimed or unavailable (default: False)
+        fallback_ratio: Fallback pool maximum as a fraction of max_nodes, rounded up
+                        (default: 1.0 = the whole spot pool can fail over)
+        fallback_max_nodes: Hard ceiling for the fallback pool (default: None)
+        autoscaling_profile: Cluster autoscaler profile, BALANCED or OPTIMIZE_UTILIZATION
+                             (default: None = GKE default, BALANCED). Applies to the
+                             whole cluster: OPTIMIZE_UTILIZATION bin-packs harder and
+                             removes under-used nodes sooner, but never moves pods from
+                             on-demand back to spot nodes.
+
+    Node tuning (optional, None = GKE default):
+        tuning_preset: Named preset from NODE_TUNING_PRESETS (e.g. "high-throughput");
+                       explicit fields below take precedence over the preset
+        cpu_manager_policy: Kubelet CPU manager policy ("none" or "static")
+        cpu_cfs_quota: Enforce CPU limits with CFS quota
+        pod_pids_limit: Maximum PIDs per pod (1024-4194304)
+        sysctls: Linux sysctls, keys must be in ALLOWED_SYSCTLS
+        hugepages_2m: Number of 2M hugepages per node
+        hugepages_1g: Number of 1G hugepages per node
+        cgroup_mode: CGROUP_MODE_V1 or CGROUP_MODE_V2
+
+    Node pool upgrades (optional, None = GKE default surge 1/0):
+        auto_repair: Automatically repair unhealthy nodes (default: True)
+        auto_upgrade: Automatically upgrade nodes with the control plane (default: True)
+        upgrade_strategy: "SURGE" or "BLUE_GREEN"
+        max_surge: SURGE: extra nodes created during an upgrade
+        max_unavailable: SURGE: nodes that may be unavailable during an upgrade
+        blue_green_soak_duration: BLUE_GREEN: time to keep the old pool after draining (e.g. "1800s")
+        blue_green_batch_node_count: BLUE_GREEN: nodes drained per batch
+        blue_green_batch_soak_duration: BLUE_GREEN: wait between batches (e.g. "60s")
+
+    Telemetry (optional, None = GKE default):
+        telemetry_preset: Named preset from TELEMETRY_PRESETS ("minimal", "standard", "full");
+                          explicit fields below take precedence over the preset
+        managed_prometheus: Enable Google Cloud Managed Service for Prometheus
+        monitoring_components: Cloud Monitoring components from MONITORING_COMPONENTS
+                               (must include SYSTEM_COMPONENTS unless empty)
+        logging_components: Cloud Logging components from LOGGING_COMPONENTS
+                            (must include SYSTEM_COMPONENTS unless empty)
+
+    Pod autoscaling addons (optional, None = GKE default: VPA off, HPA on):
+        vertical_pod_autoscaling: Enable the VerticalPodAutoscaler, which recommends
+                                  or applies right-sized pod requests
+        horizontal_pod_autoscaling: Enable the HorizontalPodAutoscaler addon
+        (Autopilot always runs both; setting either to False is rejected)
+
+    Usage metering (optional, default off):
+        usage_metering: Export per-namespace and per-label resource requests and
+                        consumption to a BigQuery dataset (usage_dataset_id) created
+                        in the cluster region (not supported with autopilot)
+        usage_metering_egress: Also meter network egress per workload (default: True,
+                               usage_metering only; runs a metering agent DaemonSet)
+        cost_allocation: Add namespace and label cost breakdowns to the Cloud Billing
+                         export (default: False)
     """
 
     # REQUIRED
@@ -81,18 +570,67 @@ class ClusterConfig:
     min_nodes: int = 1
     max_nodes: int = 3
     disk_size: int = 50
+    disk_type: str = "pd-standard"
     spot_instances: bool = True
     master_cidr: str = "172.16.0.0/28"
+    image_streaming: bool = False
+    autopilot: bool = False
+    name_suffix: Optional[str] = None
+
+    # Spot fallback (on-demand pool next to the spot pool)
+    spot_fallback: bool = False
+    fallback_ratio: float = 1.0
+    fallback_max_nodes: Optional[int] = None
+    autoscaling_profile: Optional[str] = None
+
+    # Node tuning (kubelet + Linux node config)
+    tuning_preset: Optional[str] = None
+    cpu_manager_policy: Optional[str] = None
+    cpu_cfs_quota: Optional[bool] = None
+    pod_pids_limit: Optional[int] = None
+    sysctls: Optional[Mapping[str, str]] = None
+    hugepages_2m: Optional[int] = None
+    hugepages_1g: Optional[int] = None
+    cgroup_mode: Optional[str] = None
+
+    # Node pool upgrades
+    auto_repair: bool = True
+    auto_upgrade: bool = True
+    upgrade_strategy: Optional[str] = None
+    max_surge: Optional[int] = None
+    max_unavailable: Optional[int] = None
+    blue_green_soak_duration: Optional[str] = None
+    blue_green_batch_node_count: Optional[int] = None
+    blue_green_batch_soak_duration: Optional[str] = None
+
+    # Telemetry (monitoring + logging config)
+    telemetry_preset: Optional[str] = None
+    managed_prometheus: Optional[bool] = None
+    monitoring_components: Optional[Sequence[str]] = None
+    logging_components: Optional[Sequence[str]] = None
+
+    # Pod autoscaling addons
+    vertical_pod_autoscaling: Optional[bool] = None
+    horizontal_pod_autoscaling: Optional[bool] = None
+
+    # Usage metering (BigQuery resource usage export + cost allocation)
+    usage_metering: bool = False
+    usage_metering_egress: bool = True
+    cost_allocation: bool = False
 
     # Secondary range names (to pass to GKE)
     pod_range_name: str = "pod-ranges"
     service_range_name: str = "service-ranges"
 
-    # AUTO-GENERATED (computed properties)
+    # AUTO-GENERATED (computed once in __post_init__)
+    _cluster_name: str = field(init=False, repr=False, compare=False)
+    _effective_zone: str = field(init=False, repr=False, compare=False)
+    _fingerprint: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
     @property
     def cluster_name(self) -> str:
-        """Standard naming: {prefix}-{env}-cluster"""
-        return f"{self.prefix}-{self.env}-cluster"
+        """Standard naming: {prefix}-{env}-cluster[-{name_suffix}]"""
+        return self._cluster_name
 
     @property
     def workload_pool(self) -> str:
@@ -102,11 +640,399 @@ class ClusterConfig:
     @property
     def effective_zone(self) -> str:
         """Returns zone if set, otherwise {region}-a"""
-        return self.zone if self.zone else f"{self.region}-a"
+        return self._effective_zone
+
+    @property
+    def location(self) -> str:
+        """Cluster location: region for Autopilot, otherwise effective_zone"""
+        return self.region if self.autopilot else self._effective_zone
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable SHA-256 of the canonical serialization (see canonical_json)."""
+        if self._fingerprint is None:
+            object.__setattr__(self, "_fingerprint", config_fingerprint(self))
+        return self._fingerprint  # type: ignore[return-value]
+
+    def canonical_json(self) -> str:
+        """Canonical JSON of the configuration fields (sorted keys, no whitespace)."""
+        return canonical_json(self)
+
+    @property
+    def usage_dataset_id(self) -> str:
+        """BigQuery dataset for usage metering: {prefix}_{env}_gke_usage[_{name_suffix}]"""
+        dataset = f"{self.prefix}_{self.env}_gke_usage"
+        if self.name_suffix:
+            dataset = f"{dataset}_{self.name_suffix}"
+        return re.sub(r"[^A-Za-z0-9_]", "_", dataset)
+
+    @property
+    def fallback_node_limit(self) -> int:
+        """Autoscaler maximum of the on-demand fallback pool, 0 without spot_fallback."""
+        if not self.spot_fallback:
+            return 0
+        limit = math.ceil(self.max_nodes * self.fallback_ratio)
+        if self.fallback_max_nodes is not None:
+            limit = min(limit, self.fallback_max_nodes)
+        return limit
+
+    @property
+    def has_kubelet_config(self) -> bool:
+        """True if any kubelet setting is configured."""
+        return any(
+            v is not None
+            for v in (self.cpu_manager_policy, self.cpu_cfs_quota, self.pod_pids_limit)
+        )
+
+    @property
+    def has_linux_node_config(self) -> bool:
+        """True if any Linux node setting is configured."""
+        return bool(self.sysctls) or any(
+            v is not None for v in (self.hugepages_2m, self.hugepages_1g, self.cgroup_mode)
+        )
+
+    @property
+    def has_monitoring_config(self) -> bool:
+        """True if managed Prometheus or monitoring components are configured."""
+        return self.managed_prometheus is not None or self.monitoring_components is not None
+
+    def _validate_names(self) -> None:
+        """Cluster and node pool names must fit GKE's name length limit."""
+        names = [self.cluster_name]
+        if not self.autopilot:
+            names.append(f"{self.cluster_name}-pool")
+        if self.spot_fallback:
+            names.append(f"{self.cluster_name}-ondemand-pool")
+        for name in names:
+            if len(name) > MAX_GKE_NAME_LENGTH:
+                raise ValueError(
+                    f"'{name}' is {len(name)} characters, GKE allows {MAX_GKE_NAME_LENGTH}; "
+                    "shorten prefix or name_suffix"
+                )
 
     def __post_init__(self):
-        """Validate configuration."""
+        """Apply presets, freeze collection fields, compute derived values and validate."""
+        name = f"{self.prefix}-{self.env}-cluster"
+        object.__setattr__(
+            self, "_cluster_name", f"{name}-{self.name_suffix}" if self.name_suffix else name
+        )
+        object.__setattr__(self, "_effective_zone", self.zone or f"{self.region}-a")
+        self._validate_names()
+
         if self.min_nodes > self.max_nodes:
             raise ValueError(
                 f"min_nodes ({self.min_nodes}) cannot be greater than max_nodes ({self.max_nodes})"
             )
+
+        if self.tuning_preset is not None:
+            if self.tuning_preset not in NODE_TUNING_PRESETS:
+                raise ValueError(
+                    f"Unknown tuning_preset '{self.tuning_preset}'. "
+                    f"Available: {sorted(NODE_TUNING_PRESETS)}"
+                )
+            for key, value in NODE_TUNING_PRESETS[self.tuning_preset].items():
+                if key == "sysctls":
+                    object.__setattr__(self, "sysctls", {**value, **(self.sysctls or {})})
+                elif getattr(self, key) is None:
+                    object.__setattr__(self, key, value)
+        if self.sysctls is not None:
+            object.__setattr__(self, "sysctls", FrozenDict(self.sysctls))
+
+        if self.cpu_manager_policy is not None and self.cpu_manager_policy not in (
+            CPU_MANAGER_POLICIES
+        ):
+            raise ValueError(f"cpu_manager_policy must be one of {CPU_MANAGER_POLICIES}")
+        if self.cgroup_mode is not None and self.cgroup_mode not in CGROUP_MODES:
+            raise ValueError(f"cgroup_mode must be one of {CGROUP_MODES}")
+        if self.pod_pids_limit is not None and not 1024 <= self.pod_pids_limit <= 4194304:
+            raise ValueError(f"pod_pids_limit ({self.pod_pids_limit}) must be 1024-4194304")
+        for name in ("hugepages_2m", "hugepages_1g"):
+            if (getattr(self, name) or 0) < 0:
+                raise ValueError(f"{name} cannot be negative")
+        if self.sysctls:
+            unsupported = sorted(set(self.sysctls) - ALLOWED_SYSCTLS)
+            if unsupported:
+                raise ValueError(f"Unsupported sysctls: {unsupported}. See ALLOWED_SYSCTLS.")
+
+        self._validate_upgrade_settings()
+        self._validate_telemetry()
+        self._validate_spot_fallback()
+
+        if self.autopilot:
+            if self.has_kubelet_config or self.has_linux_node_config:
+                raise ValueError("Node tuning is not supported with autopilot=True")
+            if self.upgrade_strategy is not None:
+                raise ValueError("upgrade_strategy is not supported with autopilot=True")
+            if False in (self.vertical_pod_autoscaling, self.horizontal_pod_autoscaling):
+                raise ValueError("Pod autoscaling cannot be disabled with autopilot=True")
+            if self.usage_metering:
+                raise ValueError("usage_metering is not supported with autopilot=True")
+
+    def _validate_upgrade_settings(self):
+        """Validate node pool upgrade strategy settings."""
+        surge = (self.max_surge, self.max_unavailable)
+        blue_green = (
+            self.blue_green_soak_duration,
+            self.blue_green_batch_node_count,
+            self.blue_green_batch_soak_duration,
+        )
+
+        if self.upgrade_strategy is None:
+            if any(v is not None for v in surge + blue_green):
+                raise ValueError("upgrade_strategy is required when setting upgrade options")
+            return
+        if self.upgrade_strategy not in UPGRADE_STRATEGIES:
+            raise ValueError(f"upgrade_strategy must be one of {UPGRADE_STRATEGIES}")
+
+        if self.upgrade_strategy == "SURGE":
+            if any(v is not None for v in blue_green):
+                raise ValueError("blue_green_* options require upgrade_strategy='BLUE_GREEN'")
+            if any(v is not None and v < 0 for v in surge):
+                raise ValueError("max_surge and max_unavailable cannot be negative")
+            if (self.max_surge or 0) + (self.max_unavailable or 0) == 0 and None not in surge:
+                raise ValueError("max_surge and max_unavailable cannot both be 0")
+        else:
+            if any(v is not None for v in surge):
+                raise ValueError("max_surge/max_unavailable require upgrade_strategy='SURGE'")
+            if (
+                self.blue_green_batch_node_count is not None
+                and self.blue_green_batch_node_count < 1
+            ):
+                raise ValueError("blue_green_batch_node_count must be at least 1")
+            for name in ("blue_green_soak_duration", "blue_green_batch_soak_duration"):
+                value = getattr(self, name)
+                if value is not None and not re.fullmatch(r"\d+s", value):
+                    raise ValueError(f"{name} must be a duration in seconds, e.g. '600s'")
+
+    def _validate_spot_fallback(self):
+        """Validate the on-demand fallback pool settings."""
+        if not 0.0 < self.fallback_ratio <= 1.0:
+            raise ValueError(f"fallback_ratio ({self.fallback_ratio}) must be in (0.0, 1.0]")
+        if self.fallback_max_nodes is not None and self.fallback_max_nodes < 1:
+            raise ValueError("fallback_max_nodes must be at least 1")
+        if self.autoscaling_profile is not None:
+            if self.autoscaling_profile not in AUTOSCALING_PROFILES:
+                raise ValueError(f"autoscaling_profile must be one of {AUTOSCALING_PROFILES}")
+            if self.autopilot:
+                raise ValueError("autoscaling_profile is not supported with autopilot=True")
+        if self.spot_fallback:
+            if self.autopilot:
+                raise ValueError("spot_fallback is not supported with autopilot=True")
+            if not self.spot_instances:
+                raise ValueError("spot_fallback requires spot_instances=True")
+
+    def _validate_telemetry(self):
+        """Apply the telemetry preset and validate monitoring/logging components."""
+        if self.telemetry_preset is not None:
+            if self.telemetry_preset not in TELEMETRY_PRESETS:
+                raise ValueError(
+                    f"Unknown telemetry_preset '{self.telemetry_preset}'. "
+                    f"Available: {sorted(TELEMETRY_PRESETS)}"
+                )
+            for key, value in TELEMETRY_PRESETS[self.telemetry_preset].items():
+                if getattr(self, key) is None:
+                    object.__setattr__(self, key, value)
+
+        for name, allowed in (
+            ("monitoring_components", MONITORING_COMPONENTS),
+            ("logging_components", LOGGING_COMPONENTS),
+        ):
+            components = getattr(self, name)
+            if components is not None:
+                components = tuple(components)
+                object.__setattr__(self, name, components)
+            if not components:
+                continue
+            unsupported = sorted(set(components) - set(allowed))
+            if unsupported:
+                raise ValueError(f"Unsupported {name}: {unsupported}. Available: {list(allowed)}")
+            if "SYSTEM_COMPONENTS" not in components:
+                raise ValueError(f"{name} must include SYSTEM_COMPONENTS")
+
+
+@dataclass
+class IngressBackend:
+    """
+    A Kubernetes Service exposed through StandardIngress via a standalone NEG.
+
+    The Service must carry the NEG annotation (see StandardIngress.neg_annotation)
+    so GKE creates a network endpoint group named neg_name in every cluster zone.
+
+    Required:
+        name: Backend name (used in resource names)
+        neg_name: Name of the standalone NEG created by GKE
+        port: Service port exposed through the NEG
+
+    Optional:
+        target_port: Container port the Service forwards to (default: port); NEG
+                     endpoints are podIP:target_port, so health checks and load
+                     balancer traffic reach pods on this port
+        paths: URL paths routed to this backend (default: ["/*"])
+        health_check_path: HTTP health check path (default: /healthz)
+        cdn: Enable Cloud CDN for cacheable responses (default: False)
+        max_rate_per_endpoint: Target requests per second per pod (default: 100)
+    """
+
+    # REQUIRED
+    name: str
+    neg_name: str
+    port: int
+
+    # OPTIONAL
+    target_port: Optional[int] = None  # None = same as port
+    paths: list[str] = field(default_factory=lambda: ["/*"])
+    health_check_path: str = "/healthz"
+    cdn: bool = False
+    max_rate_per_endpoint: int = 100
+
+    def __post_init__(self):
+        """Validate configuration."""
+        if not self.name or not self.neg_name:
+            raise ValueError("name and neg_name are required")
+        if not re.fullmatch(r"[a-z]([-a-z0-9]*[a-z0-9])?", self.name):
+            raise ValueError(f"name '{self.name}' must be lowercase letters, digits and hyphens")
+        if not 1 <= self.port <= 65535:
+            raise ValueError(f"port ({self.port}) must be 1-65535")
+        if self.target_port is None:
+            self.target_port = self.port
+        if not 1 <= self.target_port <= 65535:
+            raise ValueError(f"target_port ({self.target_port}) must be 1-65535")
+        if not self.paths or any(not p.startswith("/") for p in self.paths):
+            raise ValueError("paths must be a non-empty list of paths starting with '/'")
+
+
+@dataclass
+class CacheConfig:
+    """
+    Memorystore for Redis configuration.
+
+    Required:
+        project_id: GCP project ID
+        region: GCP region
+        env: Environment (dev, staging, prod)
+        prefix: Resource naming prefix
+
+    Optional:
+        memory_size_gb: Instance memory in GB (default: 1)
+        tier: BASIC (single node) or STANDARD_HA (primary + replicas) (default: BASIC)
+        replica_count: STANDARD_HA replicas, 1-5 (default: None = GKE default of 1)
+        read_replicas: Serve reads from replicas (STANDARD_HA, >= 5 GB) (default: False)
+        redis_version: Redis version (default: REDIS_7_2)
+    """
+
+    # REQUIRED
+    project_id: str
+    region: str
+    env: str
+    prefix: str
+
+    # OPTIONAL (with smart defaults)
+    memory_size_gb: int = 1
+    tier: str = "BASIC"
+    replica_count: Optional[int] = None
+    read_replicas: bool = False
+    redis_version: str = "REDIS_7_2"
+
+    # AUTO-GENERATED (computed properties)
+    @property
+    def instance_name(self) -> str:
+        """Standard naming: {prefix}-{env}-cache"""
+        return f"{self.prefix}-{self.env}-cache"
+
+    def __post_init__(self):
+        """Validate configuration."""
+        if self.tier not in ("BASIC", "STANDARD_HA"):
+            raise ValueError(f"tier must be BASIC or STANDARD_HA, got '{self.tier}'")
+        if self.memory_size_gb < 1:
+            raise ValueError("memory_size_gb must be at least 1")
+        if self.tier == "BASIC" and (self.replica_count or self.read_replicas):
+            raise ValueError("replicas require tier='STANDARD_HA'")
+        if self.replica_count is not None and self.tier == "STANDARD_HA":
+            if not 1 <= self.replica_count <= 5:
+                raise ValueError(f"replica_count ({self.replica_count}) must be 1-5")
+        if self.read_replicas and self.memory_size_gb < 5:
+            raise ValueError("read_replicas require memory_size_gb >= 5")
+
+
+@dataclass
+class DatabaseConfig:
+    """
+    Cloud SQL configuration.
+
+    Required:
+        project_id: GCP project ID
+        region: GCP region
+        env: Environment (dev, staging, prod)
+        prefix: Resource naming prefix
+
+    Optional:
+        database_version: Cloud SQL version (default: POSTGRES_16)
+        tier: Machine tier (default: db-custom-1-3840)
+        disk_size: Initial disk size in GB, grows automatically (default: 10)
+        disk_type: PD_SSD or PD_HDD (default: PD_SSD)
+        availability_type: ZONAL or REGIONAL (standby in another zone) (default: ZONAL)
+        read_replicas: Number of read replicas, 0-10 (default: 0)
+        database_flags: Database flags, e.g. {"max_connections": "200"} (default: {})
+        backups: Automated backups with point-in-time recovery (default: True)
+        query_insights: Enable Query Insights (default: True)
+        deletion_protection: Block instance deletion (default: False)
+        database_name: Application database (default: app)
+        user_name: Application user (default: app)
+    """
+
+    # REQUIRED
+    project_id: str
+    region: str
+    env: str
+    prefix: str
+
+    # OPTIONAL (with smart defaults)
+    database_version: str = "POSTGRES_16"
+    tier: str = "db-custom-1-3840"
+    disk_size: int = 10
+    disk_type: str = "PD_SSD"
+    availability_type: str = "ZONAL"
+    read_replicas: int = 0
+    database_flags: dict[str, str] = field(default_factory=dict)
+    backups: bool = True
+    query_insights: bool = True
+    deletion_protection: bool = False
+    database_name: str = "app"
+    user_name: str = "app"
+
+    # AUTO-GENERATED (computed properties)
+    @property
+    def instance_name(self) -> str:
+        """Standard naming: {prefix}-{env}-db"""
+        return f"{self.prefix}-{self.env}-db"
+
+    @property
+    def password_secret_id(self) -> str:
+        """Secret Manager ID of the user password: {prefix}-{env}-db-password"""
+        return f"{self.instance_name}-password"
+
+    def replica_name(self, index: int) -> str:
+        """Standard naming: {prefix}-{env}-db-replica-{index}"""
+        return f"{self.instance_name}-replica-{index}"
+
+    def __post_init__(self):
+        """Validate configuration."""
+        if not self.database_version.startswith(("POSTGRES_", "MYSQL_")):
+            raise ValueError(
+                f"database_version must be a POSTGRES_* or MYSQL_* version, "
+                f"got '{self.database_version}'"
+            )
+        if self.disk_type not in ("PD_SSD", "PD_HDD"):
+            raise ValueError(f"disk_type must be PD_SSD or PD_HDD, got '{self.disk_type}'")
+        if self.availability_type not in ("ZONAL", "REGIONAL"):
+            raise ValueError(
+                f"availability_type must be ZONAL or REGIONAL, got '{self.availability_type}'"
+            )
+        if self.disk_size < 10:
+            raise ValueError("disk_size must be at least 10 GB")
+        if not 0 <= self.read_replicas <= 10:
+            raise ValueError(f"read_replicas ({self.read_replicas}) must be 0-10")
+        if self.read_replicas and not self.backups:
+            raise ValueError("read_replicas require backups=True")
+        if not self.database_name or not self.user_name:
+            raise ValueError("database_name and user_name cannot be empty")
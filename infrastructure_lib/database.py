@@ -0,0 +1,241 @@
+"""
+Private-IP Cloud SQL construct.
+
+Provides:
+- StandardDatabase: Cloud SQL instance (+ read replicas) reachable only over
+  private services access, with its user password kept in Secret Manager
+"""
+
+from typing import Optional
+
+from cdktf import ITerraformDependable, TerraformStack
+from cdktf_cdktf_provider_google.secret_manager_secret_version import (
+    SecretManagerSecretVersion,
+)
+from cdktf_cdktf_provider_google.sql_database import SqlDatabase
+from cdktf_cdktf_provider_google.sql_database_instance import (
+    SqlDatabaseInstance,
+    SqlDatabaseInstanceSettings,
+    SqlDatabaseInstanceSettingsBackupConfiguration,
+    SqlDatabaseInstanceSettingsDatabaseFlags,
+    SqlDatabaseInstanceSettingsInsightsConfig,
+    SqlDatabaseInstanceSettingsIpConfiguration,
+)
+from cdktf_cdktf_provider_google.sql_user import SqlUser
+from cdktf_cdktf_provider_random.password import Password
+from cdktf_cdktf_provider_random.provider import RandomProvider
+from constructs import Construct
+
+from .config import DatabaseConfig
+from .security import StandardSecrets
+
+
+class StandardDatabase(Construct):
+    """
+    Cloud SQL on private IPs, next to the cluster.
+
+    Creates:
+    1. Primary instance with no public IP, allocated from the VPC's private
+       services range (StandardVPC with private_services_access=True)
+    2. Read replicas (config.read_replicas) on the same network
+    3. Application database and user
+    4. Random user password stored in Secret Manager ({instance}-password)
+
+    Query Insights is enabled by default. Tier, disk and flags come from the
+    profile (PlatformProfile.get_database_config).
+
+    Args:
+        scope: CDK scope
+        id: Construct ID
+        config: DatabaseConfig instance
+        network_id: VPC network ID
+        allocated_ip_range: Name of the private services range
+        depends_on: Resources to wait for (pass the service networking connection)
+        labels: Optional resource labels
+
+    Attributes:
+        instance: The primary SqlDatabaseInstance
+        replicas: List of read replica SqlDatabaseInstances
+        secrets: StandardSecrets holding the user password
+        connection_name: Primary connection name (project:region:instance)
+        private_ip: Primary private IP
+        replica_private_ips: Read replica private IPs
+
+    Example:
+        profile = ProdProfile("my-project", "europe-west1", "prod", "myapp")
+        vpc = StandardVPC(self, "vpc",
+            config=profile.get_network_config(private_services_access=True)
+        )
+        db = StandardDatabase(self, "db",
+            config=profile.get_database_config(),
+            network_id=vpc.network_id,
+            allocated_ip_range=vpc.private_services_range.name,
+            depends_on=[vpc.private_services_connection]
+        )
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        config: DatabaseConfig,
+        network_id: str,
+        allocated_ip_range: str,
+        depends_on: Optional[list[ITerraformDependable]] = None,
+        labels: Optional[dict[str, str]] = None,
+    ):
+        super().__init__(scope, id)
+
+        if not allocated_ip_range:
+            raise ValueError("allocated_ip_range is required (private services access range name)")
+
+        self.config = config
+
+        # Default labels
+        resource_labels = {
+            "environment": config.env,
+            "managed-by": "cdktf",
+        }
+        if labels:
+            resource_labels.update(labels)
+
+        # 1. Primary instance
+        self.instance = SqlDatabaseInstance(
+            self,
+            "instance",
+            name=config.instance_name,
+            project=config.project_id,
+            region=config.region,
+            database_version=config.database_version,
+            deletion_protection=config.deletion_protection,
+            settings=self._settings(
+                config,
+                network_id,
+                allocated_ip_range,
+                resource_labels,
+                availability_type=config.availability_type,
+                backups=config.backups,
+            ),
+            depends_on=depends_on,
+        )
+
+        # 2. Read replicas (always zonal; the primary carries the HA standby)
+        self.replicas: list[SqlDatabaseInstance] = []
+        for idx in range(config.read_replicas):
+            replica = SqlDatabaseInstance(
+                self,
+                f"replica_{idx}",
+                name=config.replica_name(idx),
+                project=config.project_id,
+                region=config.region,
+                database_version=config.database_version,
+                master_instance_name=self.instance.name,
+                deletion_protection=config.deletion_protection,
+                settings=self._settings(
+                    config,
+                    network_id,
+                    allocated_ip_range,
+                    resource_labels,
+                    availability_type="ZONAL",
+                    backups=False,
+                ),
+            )
+            self.replicas.append(replica)
+
+        # 3. Application database and user
+        self.database = SqlDatabase(
+            self,
+            "database",
+            project=config.project_id,
+            instance=self.instance.name,
+            name=config.database_name,
+        )
+
+        _ensure_random_provider(self)
+        self.password = Password(self, "password", length=32, special=False)
+        self.user = SqlUser(
+            self,
+            "user",
+            project=config.project_id,
+            instance=self.instance.name,
+            name=config.user_name,
+            password=self.password.result,
+        )
+
+        # 4. Password in Secret Manager (read it with External Secrets / Workload Identity)
+        self.secrets = StandardSecrets(self, "secrets", secret_ids=[config.password_secret_id])
+        self.password_version = SecretManagerSecretVersion(
+            self,
+            "password_version",
+            secret=self.secrets.get_secret(config.password_secret_id).id,
+            secret_data=self.password.result,
+        )
+
+    @staticmethod
+    def _settings(
+        config: DatabaseConfig,
+        network_id: str,
+        allocated_ip_range: str,
+        labels: dict[str, str],
+        availability_type: str,
+        backups: bool,
+    ) -> SqlDatabaseInstanceSettings:
+        """Instance settings shared by the primary and its replicas."""
+        is_postgres = config.database_version.startswith("POSTGRES_")
+        return SqlDatabaseInstanceSettings(
+            tier=config.tier,
+            # ENTERPRISE_PLUS (the default for new versions) only accepts db-perf-optimized tiers
+            edition="ENTERPRISE",
+            availability_type=availability_type,
+            disk_size=config.disk_size,
+            disk_type=config.disk_type,
+            disk_autoresize=True,
+            # Private IP only: clients connect through the VPC peering, no proxy hop
+            ip_configuration=SqlDatabaseInstanceSettingsIpConfiguration(
+                ipv4_enabled=False,
+                private_network=network_id,
+                allocated_ip_range=allocated_ip_range,
+                ssl_mode="ENCRYPTED_ONLY",
+            ),
+            insights_config=SqlDatabaseInstanceSettingsInsightsConfig(
+                query_insights_enabled=config.query_insights,
+                record_application_tags=config.query_insights,
+                record_client_address=config.query_insights,
+            ),
+            database_flags=[
+                SqlDatabaseInstanceSettingsDatabaseFlags(name=name, value=value)
+                for name, value in sorted(config.database_flags.items())
+            ]
+            or None,
+            backup_configuration=SqlDatabaseInstanceSettingsBackupConfiguration(
+                enabled=True,
+                point_in_time_recovery_enabled=is_postgres,
+                # MySQL replicas replicate from the binary log
+                binary_log_enabled=None if is_postgres else True,
+            )
+            if backups
+            else None,
+            user_labels=labels,
+        )
+
+    @property
+    def connection_name(self) -> str:
+        """Get the primary connection name (project:region:instance)."""
+        return self.instance.connection_name
+
+    @property
+    def private_ip(self) -> str:
+        """Get the primary private IP address."""
+        return self.instance.private_ip_address
+
+    @property
+    def replica_private_ips(self) -> list[str]:
+        """Get the read replica private IP addresses."""
+        return [replica.private_ip_address for replica in self.replicas]
+
+
+def _ensure_random_provider(scope: Construct) -> None:
+    """Add the random provider to the stack once (needed for the password)."""
+    stack = TerraformStack.of(scope)
+    if not any(isinstance(child, RandomProvider) for child in stack.node.children):
+        RandomProvider(stack, "random")
@@ -0,0 +1,111 @@
+"""
+Fleet specifications for offline tooling.
+
+A fleet spec describes many StandardPlatform instances in one JSON file, so
+reports and analysis tools can evaluate every environment without synthesizing.
+
+Example (fleet.json):
+    {
+        "platforms": [
+            {"project_id": "acme-dev", "region": "europe-west1", "env": "dev", "prefix": "shop"},
+            {
+                "project_id": "acme-prod",
+                "region": "europe-west1",
+                "env": "prod",
+                "prefix": "shop",
+                "cluster_overrides": {"max_nodes": 20}
+            }
+        ]
+    }
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Union
+
+from .config import ClusterConfig, NetworkConfig
+from .profiles import PlatformProfile, get_profile
+
+
+@dataclass
+class PlatformSpec:
+    """
+    Inputs of a single StandardPlatform.
+
+    Required:
+        project_id: GCP project ID
+        region: GCP region
+        env: Environment (dev, staging, prod)
+        prefix: Resource naming prefix
+
+    Optional:
+        cluster_overrides: ClusterConfig overrides (same as StandardPlatform **cluster_overrides)
+        additional_regions: More regions served by the platform (same as StandardPlatform)
+    """
+
+    # REQUIRED
+    project_id: str
+    region: str
+    env: str
+    prefix: str
+
+    # OPTIONAL
+    cluster_overrides: dict[str, Any] = field(default_factory=dict)
+    additional_regions: list[str] = field(default_factory=list)
+
+    @property
+    def name(self) -> str:
+        """Standard naming: {prefix}-{env}"""
+        return f"{self.prefix}-{self.env}"
+
+    @property
+    def profile(self) -> PlatformProfile:
+        """Profile selected for this environment (as StandardPlatform does)."""
+        return get_profile(self.project_id, self.region, self.env, self.prefix)
+
+    def get_network_config(self) -> NetworkConfig:
+        """Network configuration StandardPlatform would build."""
+        return self.profile.get_network_config(additional_regions=list(self.additional_regions))
+
+    def get_cluster_config(self) -> ClusterConfig:
+        """Cluster configuration StandardPlatform would build (primary region)."""
+        return self.get_cluster_configs()[self.region]
+
+    def get_cluster_configs(self) -> dict[str, ClusterConfig]:
+        """Cluster configuration per region StandardPlatform would build."""
+        return self.profile.get_cluster_configs(self.get_network_config(), **self.cluster_overrides)
+
+
+def load_fleet(path: Union[str, Path]) -> list[PlatformSpec]:
+    """
+    Load platform specs from a fleet JSON file.
+
+    Accepts either {"platforms": [...]} or a bare list of platform objects.
+
+    Raises:
+        ValueError: If the file is not a valid fleet spec
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+
+    entries = data.get("platforms") if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: expected a list of platforms or {{'platforms': [...]}}")
+
+    specs = []
+    for idx, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            raise ValueError(f"{path}: platform #{idx} must be an object")
+        try:
+            specs.append(PlatformSpec(**entry))
+        except TypeError as e:
+            raise ValueError(f"{path}: invalid platform #{idx}: {e}") from e
+    return specs
+
+
+def default_fleet(
+    project_id: str = "my-project", region: str = "us-central1"
+) -> list[PlatformSpec]:
+    """One PlatformSpec per built-in profile (dev, staging, prod)."""
+    return [PlatformSpec(project_id, region, env, "platform") for env in ("dev", "staging", "prod")]
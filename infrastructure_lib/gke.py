@@ -5,24 +5,61 @@ Features:
 - Private cluster with private nodes
 - VPC-native (Alias IPs)
 - Workload Identity enabled
-- Autoscaling node pool
+- Autoscaling node pool, or Autopilot (GKE-managed nodes)
+- Optional image streaming for fast pod start-up
+- Optional kubelet and Linux kernel tuning
+- Configurable surge / blue-green upgrades
+- Managed Prometheus and monitoring/logging component selection
+- Optional on-demand fallback pool for spot node pools
+- Vertical and horizontal pod autoscaling addons
+- Optional usage metering to BigQuery and cost allocation
 """
 
+from typing import Optional
+
+from cdktf_cdktf_provider_google.bigquery_dataset import BigqueryDataset
 from cdktf_cdktf_provider_google.container_cluster import (
     ContainerCluster,
+    ContainerClusterAddonsConfig,
+    ContainerClusterAddonsConfigHorizontalPodAutoscaling,
+    ContainerClusterClusterAutoscaling,
+    ContainerClusterCostManagementConfig,
     ContainerClusterIpAllocationPolicy,
+    ContainerClusterLoggingConfig,
+    ContainerClusterMonitoringConfig,
+    ContainerClusterMonitoringConfigManagedPrometheus,
+    ContainerClusterNodePoolAutoConfig,
+    ContainerClusterNodePoolAutoConfigNetworkTags,
     ContainerClusterPrivateClusterConfig,
+    ContainerClusterResourceUsageExportConfig,
+    ContainerClusterResourceUsageExportConfigBigqueryDestination,
+    ContainerClusterVerticalPodAutoscaling,
     ContainerClusterWorkloadIdentityConfig,
 )
 from cdktf_cdktf_provider_google.container_node_pool import (
     ContainerNodePool,
     ContainerNodePoolAutoscaling,
+    ContainerNodePoolManagement,
     ContainerNodePoolNodeConfig,
+    ContainerNodePoolNodeConfigGcfsConfig,
+    ContainerNodePoolNodeConfigKubeletConfig,
+    ContainerNodePoolNodeConfigLinuxNodeConfig,
+    ContainerNodePoolNodeConfigLinuxNodeConfigHugepagesConfig,
+    ContainerNodePoolNodeConfigTaint,
+    ContainerNodePoolUpgradeSettings,
+    ContainerNodePoolUpgradeSettingsBlueGreenSettings,
+    ContainerNodePoolUpgradeSettingsBlueGreenSettingsStandardRolloutPolicy,
 )
 from constructs import Construct
 
 from .config import ClusterConfig
 
+# Node label (and fallback pool taint key) marking spot vs. on-demand capacity
+CAPACITY_LABEL = "x-infra-kit/capacity"
+
+# Network tag on every node (node pools and Autopilot), targeted by firewall rules
+NODE_TAG = "gke-node"
+
 
 class StandardCluster(Construct):
     """
@@ -31,6 +68,32 @@ class StandardCluster(Construct):
     Creates:
     - Private GKE cluster with Workload Identity
     - Managed node pool with autoscaling
+    - With config.spot_fallback: an on-demand fallback pool next to the spot pool
+    - Vertical / horizontal pod autoscaling as set in the config (omitted when
+      None, keeping GKE defaults, and with Autopilot, which always runs both)
+    - With config.usage_metering: a BigQuery dataset (config.usage_dataset_id,
+      in the cluster region) receiving GKE resource usage export, with
+      resource consumption and (usage_metering_egress) network egress
+      metering; with config.cost_allocation: GKE cost allocation in the
+      Cloud Billing export
+
+    Spot fallback: the spot pool is labelled x-infra-kit/capacity=spot; the
+    fallback pool ({cluster_name}-ondemand-pool) is labelled and tainted
+    x-infra-kit/capacity=on-demand:PreferNoSchedule and scales from 0 up to
+    config.fallback_node_limit, so the cluster autoscaler can add on-demand
+    nodes for pending pods when spot VMs cannot be obtained. The taint only
+    makes kube-scheduler prefer existing spot nodes; it does not steer which
+    pool the cluster autoscaler expands, so on-demand nodes can be added while
+    spot capacity is available, and pods are never moved back to spot nodes
+    (an on-demand node is removed only once it is under-used). Spot-first
+    scale-up needs a GKE custom ComputeClass (a Kubernetes resource, not
+    managed here). config.autoscaling_profile sets the cluster-wide
+    autoscaler profile (None keeps the GKE default).
+
+    With config.autopilot, creates a regional Autopilot cluster instead (same
+    network, secondary ranges, private nodes and Workload Identity; GKE sizes
+    and bin-packs nodes per pod, no node pool). Autopilot nodes get the same
+    network tags as node pool nodes through node_pool_auto_config.
 
     Args:
         scope: CDK scope
@@ -41,23 +104,49 @@ class StandardCluster(Construct):
 
     Attributes:
         cluster: The ContainerCluster resource
-        node_pool: The ContainerNodePool resource
+        node_pool: The ContainerNodePool resource (None with autopilot)
+        fallback_node_pool: The on-demand ContainerNodePool (None without spot_fallback)
+        network_tags: Network tags on the cluster's nodes (NODE_TAG first)
+        usage_dataset: The usage metering BigqueryDataset (None without usage_metering)
     """
 
     def __init__(
         self, scope: Construct, id: str, config: ClusterConfig, network_id: str, subnet_id: str
     ):
         super().__init__(scope, id)
+        self.network_tags = [NODE_TAG, f"{config.cluster_name}-gke"]
+
+        # Usage metering dataset (GKE creates and appends the export tables)
+        self.usage_dataset: Optional[BigqueryDataset] = None
+        if config.usage_metering:
+            self.usage_dataset = BigqueryDataset(
+                self,
+                "usage_dataset",
+                dataset_id=config.usage_dataset_id,
+                project=config.project_id,
+                location=config.region,
+                description=f"GKE usage metering for {config.cluster_name}",
+                delete_contents_on_destroy=config.env != "prod",
+                labels={"environment": config.env, "managed-by": "cdktf"},
+            )
 
         self.cluster = ContainerCluster(
             self,
             "cluster",
             name=config.cluster_name,
-            location=config.effective_zone,
+            location=config.location,
             network=network_id,
             subnetwork=subnet_id,
-            remove_default_node_pool=True,
-            initial_node_count=1,
+            # Autopilot has no default node pool to replace
+            enable_autopilot=True if config.autopilot else None,
+            remove_default_node_pool=None if config.autopilot else True,
+            initial_node_count=None if config.autopilot else 1,
+            # Autopilot nodes carry the node pool tags (ingress firewall targets)
+            node_pool_auto_config=ContainerClusterNodePoolAutoConfig(
+                network_tags=ContainerClusterNodePoolAutoConfigNetworkTags(tags=self.network_tags)
+            )
+            if config.autopilot
+            else None,
             deletion_protection=True if config.env == "prod" else False,
             # VPC-Native: Use secondary ranges from config
             ip_allocation_policy=ContainerClusterIpAllocationPolicy(
@@ -74,27 +163,198 @@ class StandardCluster(Construct):
             workload_identity_config=ContainerClusterWorkloadIdentityConfig(
                 workload_pool=config.workload_pool
             ),
+            monitoring_config=self._monitoring_config(config),
+            # Logging components control log volume (and Cloud Logging cost)
+            logging_config=ContainerClusterLoggingConfig(
+                enable_components=list(config.logging_components)
+            )
+            if config.logging_components is not None
+            else None,
+            cluster_autoscaling=ContainerClusterClusterAutoscaling(
+                autoscaling_profile=config.autoscaling_profile
+            )
+            if config.autoscaling_profile is not None
+            else None,
+            # Pod autoscaling (Autopilot always runs VPA and HPA)
+            vertical_pod_autoscaling=ContainerClusterVerticalPodAutoscaling(
+                enabled=config.vertical_pod_autoscaling
+            )
+            if config.vertical_pod_autoscaling is not None and not config.autopilot
+            else None,
+            addons_config=ContainerClusterAddonsConfig(
+                horizontal_pod_autoscaling=ContainerClusterAddonsConfigHorizontalPodAutoscaling(
+                    disabled=not config.horizontal_pod_autoscaling
+                )
+            )
+            if config.horizontal_pod_autoscaling is not None and not config.autopilot
+            else None,
+            # Usage metering: requests and consumption per namespace/label in BigQuery
+            resource_usage_export_config=ContainerClusterResourceUsageExportConfig(
+                bigquery_destination=ContainerClusterResourceUsageExportConfigBigqueryDestination(
+                    dataset_id=self.usage_dataset.dataset_id
+                ),
+                enable_resource_consumption_metering=True,
+                enable_network_egress_metering=config.usage_metering_egress,
+            )
+            if self.usage_dataset is not None
+            else None,
+            cost_management_config=ContainerClusterCostManagementConfig(enabled=True)
+            if config.cost_allocation
+            else None,
         )
 
-        # Managed Node Pool
-        self.node_pool = ContainerNodePool(
-            self,
+        # Managed Node Pool (GKE manages nodes with Autopilot)
+        self.node_pool: Optional[ContainerNodePool] = None
+        self.fallback_node_pool: Optional[ContainerNodePool] = None
+        if config.autopilot:
+            return
+
+        self.node_pool = self._node_pool(
             "default_pool",
+            config,
             name=f"{config.cluster_name}-pool",
+            spot=config.spot_instances,
+            initial_node_count=config.node_count,
+            min_nodes=config.min_nodes,
+            max_nodes=config.max_nodes,
+            labels={CAPACITY_LABEL: "spot"} if config.spot_fallback else None,
+        )
+        if config.spot_fallback:
+            # On-demand pool, empty until spot capacity runs out
+            self.fallback_node_pool = self._node_pool(
+                "ondemand_pool",
+                config,
+                name=f"{config.cluster_name}-ondemand-pool",
+                spot=False,
+                initial_node_count=0,
+                min_nodes=0,
+                max_nodes=config.fallback_node_limit,
+                labels={CAPACITY_LABEL: "on-demand"},
+                taint=ContainerNodePoolNodeConfigTaint(
+                    key=CAPACITY_LABEL, value="on-demand", effect="PREFER_NO_SCHEDULE"
+                ),
+            )
+
+    @property
+    def has_usage_metering(self) -> bool:
+        """Check if usage metering to BigQuery was configured."""
+        return self.usage_dataset is not None
+
+    def _node_pool(
+        self,
+        id: str,
+        config: ClusterConfig,
+        *,
+        name: str,
+        spot: bool,
+        initial_node_count: int,
+        min_nodes: int,
+        max_nodes: int,
+        labels: Optional[dict[str, str]] = None,
+        taint: Optional[ContainerNodePoolNodeConfigTaint] = None,
+    ) -> ContainerNodePool:
+        """Autoscaling node pool with the cluster's machine, disk and tuning settings."""
+        return ContainerNodePool(
+            self,
+            id,
+            name=name,
             location=config.effective_zone,
             cluster=self.cluster.name,
-            initial_node_count=config.node_count,
+            initial_node_count=initial_node_count,
             autoscaling=ContainerNodePoolAutoscaling(
-                min_node_count=config.min_nodes,
-                max_node_count=config.max_nodes,
+                min_node_count=min_nodes,
+                max_node_count=max_nodes,
                 location_policy="ANY",
             ),
+            management=ContainerNodePoolManagement(
+                auto_repair=config.auto_repair,
+                auto_upgrade=config.auto_upgrade,
+            ),
+            upgrade_settings=self._upgrade_settings(config),
             node_config=ContainerNodePoolNodeConfig(
                 machine_type=config.machine_type,
                 disk_size_gb=config.disk_size,
-                disk_type="pd-standard",
-                spot=config.spot_instances,
-                tags=["gke-node", f"{config.cluster_name}-gke"],
+                disk_type=config.disk_type,
+                spot=spot,
+                tags=self.network_tags,
                 oauth_scopes=["https://www.googleapis.com/auth/cloud-platform"],
+                # Image streaming: lazily pull Artifact Registry images
+                gcfs_config=ContainerNodePoolNodeConfigGcfsConfig(enabled=True)
+                if config.image_streaming
+                else None,
+                kubelet_config=self._kubelet_config(config),
+                linux_node_config=self._linux_node_config(config),
+                labels=labels,
+                taint=[taint] if taint is not None else None,
+            ),
+        )
+
+    @staticmethod
+    def _monitoring_config(config: ClusterConfig) -> Optional[ContainerClusterMonitoringConfig]:
+        """Managed Prometheus + monitoring components, None to keep GKE defaults."""
+        if not config.has_monitoring_config:
+            return None
+        return ContainerClusterMonitoringConfig(
+            enable_components=list(config.monitoring_components)
+            if config.monitoring_components is not None
+            else None,
+            managed_prometheus=ContainerClusterMonitoringConfigManagedPrometheus(
+                enabled=config.managed_prometheus
+            )
+            if config.managed_prometheus is not None
+            else None,
+        )
+
+    @staticmethod
+    def _upgrade_settings(config: ClusterConfig) -> Optional[ContainerNodePoolUpgradeSettings]:
+        """Surge or blue-green upgrade settings, None to keep GKE defaults."""
+        if config.upgrade_strategy is None:
+            return None
+        if config.upgrade_strategy == "SURGE":
+            return ContainerNodePoolUpgradeSettings(
+                strategy="SURGE",
+                max_surge=config.max_surge,
+                max_unavailable=config.max_unavailable,
+            )
+        return ContainerNodePoolUpgradeSettings(
+            strategy="BLUE_GREEN",
+            blue_green_settings=ContainerNodePoolUpgradeSettingsBlueGreenSettings(
+                node_pool_soak_duration=config.blue_green_soak_duration,
+                standard_rollout_policy=ContainerNodePoolUpgradeSettingsBlueGreenSettingsStandardRolloutPolicy(
+                    batch_node_count=config.blue_green_batch_node_count,
+                    batch_soak_duration=config.blue_green_batch_soak_duration,
+                ),
             ),
         )
+
+    @staticmethod
+    def _kubelet_config(
+        config: ClusterConfig,
+    ) -> Optional[ContainerNodePoolNodeConfigKubeletConfig]:
+        """Kubelet settings (CPU manager, CFS quota, PID limit), None if not configured."""
+        if not config.has_kubelet_config:
+            return None
+        return ContainerNodePoolNodeConfigKubeletConfig(
+            cpu_manager_policy=config.cpu_manager_policy,
+            cpu_cfs_quota=config.cpu_cfs_quota,
+            pod_pids_limit=config.pod_pids_limit,
+        )
+
+    @staticmethod
+    def _linux_node_config(
+        config: ClusterConfig,
+    ) -> Optional[ContainerNodePoolNodeConfigLinuxNodeConfig]:
+        """Linux node settings (sysctls, hugepages, cgroup mode), None if not configured."""
+        if not config.has_linux_node_config:
+            return None
+        hugepages = None
+        if config.hugepages_2m is not None or config.hugepages_1g is not None:
+            hugepages = ContainerNodePoolNodeConfigLinuxNodeConfigHugepagesConfig(
+                hugepage_size2_m=config.hugepages_2m,
+                hugepage_size1_g=config.hugepages_1g,
+            )
+        return ContainerNodePoolNodeConfigLinuxNodeConfig(
+            sysctls=dict(config.sysctls) if config.sysctls else None,
+            cgroup_mode=config.cgroup_mode,
+            hugepages_config=hugepages,
+        )
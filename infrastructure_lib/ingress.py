@@ -0,0 +1,284 @@
+"""
+Container-native load balancing ingress construct.
+
+Creates a global external Application Load Balancer that sends traffic
+directly to pods through GKE standalone NEGs, skipping node ports and kube-proxy.
+"""
+
+import json
+from typing import Optional
+
+from cdktf_cdktf_provider_google.compute_backend_service import (
+    ComputeBackendService,
+    ComputeBackendServiceBackend,
+    ComputeBackendServiceCdnPolicy,
+)
+from cdktf_cdktf_provider_google.compute_firewall import ComputeFirewall, ComputeFirewallAllow
+from cdktf_cdktf_provider_google.compute_global_address import ComputeGlobalAddress
+from cdktf_cdktf_provider_google.compute_global_forwarding_rule import (
+    ComputeGlobalForwardingRule,
+)
+from cdktf_cdktf_provider_google.compute_health_check import (
+    ComputeHealthCheck,
+    ComputeHealthCheckHttpHealthCheck,
+)
+from cdktf_cdktf_provider_google.compute_managed_ssl_certificate import (
+    ComputeManagedSslCertificate,
+    ComputeManagedSslCertificateManaged,
+)
+from cdktf_cdktf_provider_google.compute_target_http_proxy import ComputeTargetHttpProxy
+from cdktf_cdktf_provider_google.compute_target_https_proxy import ComputeTargetHttpsProxy
+from cdktf_cdktf_provider_google.compute_url_map import (
+    ComputeUrlMap,
+    ComputeUrlMapDefaultUrlRedirect,
+    ComputeUrlMapHostRule,
+    ComputeUrlMapPathMatcher,
+    ComputeUrlMapPathMatcherPathRule,
+)
+from constructs import Construct
+
+from .config import IngressBackend
+
+# Google Front End ranges used by load balancer health checks
+HEALTH_CHECK_RANGES = ["35.191.0.0/16", "130.211.0.0/22"]
+DEFAULT_PATH = "/*"
+
+
+class StandardIngress(Construct):
+    """
+    Global external HTTP(S) load balancer with container-native backends.
+
+    Creates:
+    - Reserved global IP address
+    - Google-managed certificate + HTTPS proxy (if domains are given), HTTP->HTTPS redirect
+    - Per backend: health check + backend service over the NEGs in every zone
+      (optional Cloud CDN for cacheable routes)
+    - URL map routing paths to backends
+    - Firewall rule allowing health checks and proxied traffic to reach the
+      pods' target ports on the nodes
+
+    Each backend's Kubernetes Service must be annotated so GKE creates the NEGs:
+        cloud.google.com/neg: StandardIngress.neg_annotation(backend)
+
+    Args:
+        scope: CDK scope
+        id: Construct ID
+        project_id: GCP project ID
+        name: Resource name prefix (e.g. myapp-prod)
+        network_id: VPC network ID (for the health check firewall rule)
+        zones: Cluster zones where GKE creates the NEGs
+        backends: IngressBackend list; the first backend serving "/*" is the default
+        domains: Domains for the managed certificate (HTTP only if empty)
+        target_tags: Node network tags for the firewall rule (default: ["gke-node"])
+        labels: Optional resource labels
+
+    Attributes:
+        address: The ComputeGlobalAddress resource
+        url_map: The ComputeUrlMap resource
+        backend_services: Dict of backend name to ComputeBackendService
+        ip_address: The reserved IP address
+
+    Example:
+        ingress = StandardIngress(self, "ingress",
+            project_id="my-project",
+            name="myapp-prod",
+            network_id=vpc.network_id,
+            zones=["europe-west1-b"],
+            backends=[
+                IngressBackend(name="web", neg_name="web-neg", port=80),
+                IngressBackend(name="static", neg_name="static-neg", port=80,
+                               paths=["/static/*"], cdn=True),
+            ],
+            domains=["shop.example.com"]
+        )
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        project_id: str,
+        name: str,
+        network_id: str,
+        zones: list[str],
+        backends: list[IngressBackend],
+        domains: Optional[list[str]] = None,
+        target_tags: Optional[list[str]] = None,
+        labels: Optional[dict[str, str]] = None,
+    ):
+        super().__init__(scope, id)
+
+        # Validation
+        if not project_id:
+            raise ValueError("project_id is required")
+        if not zones:
+            raise ValueError("zones cannot be empty")
+        if not backends:
+            raise ValueError("backends cannot be empty")
+        backend_names = [b.name for b in backends]
+        if len(set(backend_names)) != len(backend_names):
+            raise ValueError(f"Backend names must be unique: {backend_names}")
+
+        self.name = name
+        self.domains = domains or []
+
+        # 1. Reserved global IP
+        self.address = ComputeGlobalAddress(
+            self, "address", project=project_id, name=f"{name}-ingress-ip", labels=labels
+        )
+
+        # 2. Health checks + backend services over container-native NEGs
+        self.backend_services: dict[str, ComputeBackendService] = {}
+        for backend in backends:
+            health_check = ComputeHealthCheck(
+                self,
+                f"health_check_{backend.name}",
+                project=project_id,
+                name=f"{name}-{backend.name}-hc",
+                http_health_check=ComputeHealthCheckHttpHealthCheck(
+                    port_specification="USE_SERVING_PORT",
+                    request_path=backend.health_check_path,
+                ),
+            )
+            self.backend_services[backend.name] = ComputeBackendService(
+                self,
+                f"backend_{backend.name}",
+                project=project_id,
+                name=f"{name}-{backend.name}",
+                protocol="HTTP",
+                load_balancing_scheme="EXTERNAL_MANAGED",
+                health_checks=[health_check.id],
+                backend=[
+                    ComputeBackendServiceBackend(
+                        group=(
+                            f"projects/{project_id}/zones/{zone}"
+                            f"/networkEndpointGroups/{backend.neg_name}"
+                        ),
+                        balancing_mode="RATE",
+                        max_rate_per_endpoint=backend.max_rate_per_endpoint,
+                    )
+                    for zone in zones
+                ],
+                enable_cdn=backend.cdn,
+                cdn_policy=ComputeBackendServiceCdnPolicy(cache_mode="CACHE_ALL_STATIC")
+                if backend.cdn
+                else None,
+            )
+
+        # 3. URL map: default backend + path rules
+        default_backend = next((b for b in backends if DEFAULT_PATH in b.paths), backends[0])
+        default_service = self.backend_services[default_backend.name].id
+        path_rules = [
+            ComputeUrlMapPathMatcherPathRule(
+                paths=[p for p in b.paths if p != DEFAULT_PATH],
+                service=self.backend_services[b.name].id,
+            )
+            for b in backends
+            if any(p != DEFAULT_PATH for p in b.paths)
+        ]
+        self.url_map = ComputeUrlMap(
+            self,
+            "url_map",
+            project=project_id,
+            name=f"{name}-ingress",
+            default_service=default_service,
+            host_rule=[ComputeUrlMapHostRule(hosts=self.domains or ["*"], path_matcher="routes")]
+            if path_rules
+            else None,
+            path_matcher=[
+                ComputeUrlMapPathMatcher(
+                    name="routes", default_service=default_service, path_rule=path_rules
+                )
+            ]
+            if path_rules
+            else None,
+        )
+
+        # 4. Frontends: HTTPS with managed certificate, or plain HTTP
+        if self.domains:
+            certificate = ComputeManagedSslCertificate(
+                self,
+                "certificate",
+                project=project_id,
+                name=f"{name}-ingress-cert",
+                managed=ComputeManagedSslCertificateManaged(domains=self.domains),
+            )
+            https_proxy = ComputeTargetHttpsProxy(
+                self,
+                "https_proxy",
+                project=project_id,
+                name=f"{name}-ingress-https",
+                url_map=self.url_map.id,
+                ssl_certificates=[certificate.id],
+            )
+            self._forwarding_rule("https", project_id, https_proxy.id, "443", labels)
+
+            redirect_map = ComputeUrlMap(
+                self,
+                "redirect_url_map",
+                project=project_id,
+                name=f"{name}-ingress-redirect",
+                default_url_redirect=ComputeUrlMapDefaultUrlRedirect(
+                    https_redirect=True, strip_query=False
+                ),
+            )
+            http_url_map = redirect_map.id
+        else:
+            http_url_map = self.url_map.id
+
+        http_proxy = ComputeTargetHttpProxy(
+            self,
+            "http_proxy",
+            project=project_id,
+            name=f"{name}-ingress-http",
+            url_map=http_url_map,
+        )
+        self._forwarding_rule("http", project_id, http_proxy.id, "80", labels)
+
+        # 5. Allow Google health checks and proxies to reach pods (NEG endpoints
+        #    are podIP:targetPort, not the Service port)
+        self.health_check_firewall = ComputeFirewall(
+            self,
+            "health_check_firewall",
+            project=project_id,
+            name=f"{name}-ingress-allow-hc",
+            network=network_id,
+            direction="INGRESS",
+            source_ranges=HEALTH_CHECK_RANGES,
+            target_tags=target_tags or ["gke-node"],
+            allow=[
+                ComputeFirewallAllow(
+                    protocol="tcp", ports=sorted({str(b.target_port) for b in backends})
+                )
+            ],
+        )
+
+    def _forwarding_rule(
+        self,
+        scheme: str,
+        project_id: str,
+        target: str,
+        port: str,
+        labels: Optional[dict[str, str]],
+    ) -> ComputeGlobalForwardingRule:
+        return ComputeGlobalForwardingRule(
+            self,
+            f"{scheme}_forwarding_rule",
+            project=project_id,
+            name=f"{self.name}-ingress-{scheme}",
+            target=target,
+            ip_address=self.address.address,
+            port_range=port,
+            load_balancing_scheme="EXTERNAL_MANAGED",
+            labels=labels,
+        )
+
+    @staticmethod
+    def neg_annotation(backend: IngressBackend) -> str:
+        """Value of the cloud.google.com/neg annotation for the backend's Service."""
+        return json.dumps({"exposed_ports": {str(backend.port): {"name": backend.neg_name}}})
+
+    @property
+    def ip_address(self) -> str:
+        """Get the reserved load balancer IP address."""
+        return self.address.address
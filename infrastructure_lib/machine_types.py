@@ -0,0 +1,107 @@
+"""
+Offline catalog of Compute Engine machine types used for GKE node pools.
+
+Values are taken from the public machine family documentation and are meant
+for planning (capacity, quota, right-sizing), not billing:
+
+- vcpus: sustained vCPUs (fractional for shared-core E2 types)
+- memory_gb: memory in GB
+- max_pods: GKE Standard default maximum pods per node
+- bandwidth_gbps: default-tier maximum egress bandwidth
+- disk_types: supported boot disk types
+"""
+
+import difflib
+from dataclasses import dataclass
+from typing import Optional
+
+PD_DISKS = ("pd-standard", "pd-balanced", "pd-ssd")
+HYPERDISK_DISKS = ("pd-balanced", "pd-ssd", "hyperdisk-balanced")
+GKE_DEFAULT_MAX_PODS = 110
+
+
+@dataclass(frozen=True)
+class MachineType:
+    """A single machine type entry in the catalog."""
+
+    name: str
+    family: str
+    vcpus: float
+    memory_gb: float
+    bandwidth_gbps: int
+    disk_types: tuple[str, ...] = PD_DISKS
+    shared_core: bool = False
+    max_pods: int = GKE_DEFAULT_MAX_PODS
+
+    def supports_disk(self, disk_type: str) -> bool:
+        """Check whether the machine type can boot from the given disk type."""
+        return disk_type in self.disk_types
+
+
+def _shape(
+    family: str,
+    shape: str,
+    sizes: tuple[int, ...],
+    gb_per_vcpu: float,
+    max_bandwidth: int,
+    min_bandwidth: int = 10,
+    disk_types: tuple[str, ...] = PD_DISKS,
+) -> list[MachineType]:
+    """Build predefined machine types of one family/shape (2 Gbps per vCPU, capped)."""
+    return [
+        MachineType(
+            name=f"{family}-{shape}-{size}",
+            family=family,
+            vcpus=size,
+            memory_gb=size * gb_per_vcpu,
+            bandwidth_gbps=max(min_bandwidth, min(2 * size, max_bandwidth)),
+            disk_types=disk_types,
+        )
+        for size in sizes
+    ]
+
+
+_E2_SIZES = (2, 4, 8, 16, 32)
+_N2_SIZES = (2, 4, 8, 16, 32, 48, 64)
+
+_CATALOG: list[MachineType] = [
+    # E2 shared-core
+    MachineType("e2-micro", "e2", 0.25, 1, 1, shared_core=True),
+    MachineType("e2-small", "e2", 0.5, 2, 1, shared_core=True),
+    MachineType("e2-medium", "e2", 1, 4, 2, shared_core=True),
+    # E2 (bandwidth: 2 Gbps per vCPU up to 16 Gbps)
+    *_shape("e2", "standard", _E2_SIZES, 4, 16, min_bandwidth=4),
+    *_shape("e2", "highmem", (2, 4, 8, 16), 8, 16, min_bandwidth=4),
+    *_shape("e2", "highcpu", _E2_SIZES, 1, 16, min_bandwidth=4),
+    # N1
+    MachineType("n1-standard-1", "n1", 1, 3.75, 2),
+    *_shape("n1", "standard", (2, 4, 8, 16, 32, 64, 96), 3.75, 32),
+    *_shape("n1", "highmem", (2, 4, 8, 16, 32, 64, 96), 6.5, 32),
+    *_shape("n1", "highcpu", (2, 4, 8, 16, 32, 64, 96), 0.9, 32),
+    # N2 / N2D
+    *_shape("n2", "standard", _N2_SIZES, 4, 32),
+    *_shape("n2", "highmem", _N2_SIZES, 8, 32),
+    *_shape("n2", "highcpu", _N2_SIZES, 1, 32),
+    *_shape("n2d", "standard", _N2_SIZES, 4, 32),
+    *_shape("n2d", "highmem", _N2_SIZES, 8, 32),
+    *_shape("n2d", "highcpu", _N2_SIZES, 1, 32),
+    # Compute-optimized
+    *_shape("c2", "standard", (4, 8, 16, 30, 60), 4, 32),
+    *_shape("c2d", "standard", (2, 4, 8, 16, 32, 56), 4, 32),
+    *_shape("c3", "standard", (4, 8, 22, 44, 88), 4, 100, disk_types=HYPERDISK_DISKS),
+    *_shape("t2d", "standard", (1, 2, 4, 8, 16, 32, 48, 60), 4, 32),
+    # N4 (Hyperdisk only)
+    *_shape("n4", "standard", (2, 4, 8, 16, 32, 48, 64), 4, 50, disk_types=("hyperdisk-balanced",)),
+]
+
+MACHINE_TYPES: dict[str, MachineType] = {m.name: m for m in _CATALOG}
+
+
+def get_machine_type(name: str) -> Optional[MachineType]:
+    """Look up a machine type by name (None if not in the catalog)."""
+    return MACHINE_TYPES.get(name)
+
+
+def suggest_machine_types(name: str, limit: int = 3) -> list[str]:
+    """Return catalog names close to a (probably misspelled) machine type."""
+    return difflib.get_close_matches(name, list(MACHINE_TYPES), n=limit)
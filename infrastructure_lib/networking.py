@@ -3,22 +3,43 @@ Standard VPC networking construct with best practices.
 
 Creates:
 - Custom VPC (no auto-subnets)
-- Subnet with secondary ranges for GKE pods/services
-- Cloud Router + NAT for private node internet access
+- Subnet with secondary ranges for GKE pods/services (one per region)
+- Cloud Router + NAT for private node internet access (one per region)
+- Optional subnet flow logs and NAT logging (network performance analysis)
+- Optional private services access (peering range for Memorystore, Cloud SQL)
+- Optional Private Service Connect endpoint for Google APIs with private DNS
 """
 
+import ipaddress
 from typing import Optional
 
+from cdktf_cdktf_provider_google.compute_global_address import ComputeGlobalAddress
+from cdktf_cdktf_provider_google.compute_global_forwarding_rule import (
+    ComputeGlobalForwardingRule,
+)
 from cdktf_cdktf_provider_google.compute_network import ComputeNetwork
 from cdktf_cdktf_provider_google.compute_router import ComputeRouter
-from cdktf_cdktf_provider_google.compute_router_nat import ComputeRouterNat
+from cdktf_cdktf_provider_google.compute_router_nat import (
+    ComputeRouterNat,
+    ComputeRouterNatLogConfig,
+)
 from cdktf_cdktf_provider_google.compute_subnetwork import (
     ComputeSubnetwork,
+    ComputeSubnetworkLogConfig,
     ComputeSubnetworkSecondaryIpRange,
 )
+from cdktf_cdktf_provider_google.dns_managed_zone import (
+    DnsManagedZone,
+    DnsManagedZonePrivateVisibilityConfig,
+    DnsManagedZonePrivateVisibilityConfigNetworks,
+)
+from cdktf_cdktf_provider_google.dns_record_set import DnsRecordSet
+from cdktf_cdktf_provider_google.service_networking_connection import (
+    ServiceNetworkingConnection,
+)
 from constructs import Construct
 
-from .config import NetworkConfig
+from .config import PSC_API_DOMAINS, NetworkConfig, RegionalSubnet
 
 
 class StandardVPC(Construct):
@@ -26,9 +47,17 @@ class StandardVPC(Construct):
     Standard VPC with production-ready networking.
 
     Creates a custom VPC with:
-    - Single subnet with configurable CIDR
+    - Subnet with configurable CIDR in config.region
     - Secondary IP ranges for GKE pods and services
     - Cloud Router and NAT for private node egress
+    - The same subnet/router/NAT set in each of config.additional_regions
+    - Subnet flow logs (if config.flow_logs) and NAT logs (if config.nat_logging)
+    - Private services access range + peering (if config.private_services_access)
+    - Private Service Connect endpoint for Google APIs (if config.psc_google_apis):
+      an internal global address, a forwarding rule to the all-apis or vpc-sc
+      bundle, and a private DNS zone per PSC_API_DOMAINS entry (googleapis.com,
+      pkg.dev) resolving the domain and its subdomains to the endpoint, so
+      Secret Manager, Artifact Registry and Cloud Storage calls stay internal
 
     Args:
         scope: CDK scope
@@ -38,9 +67,17 @@ class StandardVPC(Construct):
 
     Attributes:
         network: The ComputeNetwork resource
-        subnet: The ComputeSubnetwork resource
-        router: The ComputeRouter resource
-        nat: The ComputeRouterNat resource
+        subnet: The ComputeSubnetwork resource of the primary region
+        router: The ComputeRouter resource of the primary region
+        nat: The ComputeRouterNat resource of the primary region
+        subnets: Dict of region to ComputeSubnetwork (all regions)
+        routers: Dict of region to ComputeRouter (all regions)
+        nats: Dict of region to ComputeRouterNat (all regions)
+        private_services_range: The allocated ComputeGlobalAddress (or None)
+        private_services_connection: The ServiceNetworkingConnection (or None)
+        psc_address: The PSC endpoint ComputeGlobalAddress (or None)
+        psc_endpoint: The PSC endpoint ComputeGlobalForwardingRule (or None)
+        psc_dns_zones: Dict of domain to private DnsManagedZone (empty without PSC)
 
     Example:
         from infrastructure_lib import NetworkConfig, StandardVPC
@@ -84,45 +121,162 @@ class StandardVPC(Construct):
             description=f"Standard VPC for {config.prefix}-{config.env}",
         )
 
+        # Subnet, router and NAT per region (primary region keeps the unsuffixed IDs)
+        self.subnets: dict[str, ComputeSubnetwork] = {}
+        self.routers: dict[str, ComputeRouter] = {}
+        self.nats: dict[str, ComputeRouterNat] = {}
+        for index, regional in enumerate(config.subnets):
+            suffix = "" if index == 0 else f"_{regional.region}"
+            self._create_region(config, regional, suffix)
+
+        self.subnet = self.subnets[config.region]
+        self.router = self.routers[config.region]
+        self.nat = self.nats[config.region]
+
+        # Private services access (Memorystore, Cloud SQL reachable on private IPs)
+        self.private_services_range: Optional[ComputeGlobalAddress] = None
+        self.private_services_connection: Optional[ServiceNetworkingConnection] = None
+        if config.private_services_access:
+            psa_range = ipaddress.ip_network(config.private_services_cidr)
+            self.private_services_range = ComputeGlobalAddress(
+                self,
+                "private_services_range",
+                name=config.private_services_range_name,
+                purpose="VPC_PEERING",
+                address_type="INTERNAL",
+                address=str(psa_range.network_address),
+                prefix_length=psa_range.prefixlen,
+                network=self.network.id,
+            )
+            self.private_services_connection = ServiceNetworkingConnection(
+                self,
+                "private_services_connection",
+                network=self.network.id,
+                service="servicenetworking.googleapis.com",
+                reserved_peering_ranges=[self.private_services_range.name],
+            )
+
+        # Private Service Connect endpoint for Google APIs (internal API path)
+        self.psc_address: Optional[ComputeGlobalAddress] = None
+        self.psc_endpoint: Optional[ComputeGlobalForwardingRule] = None
+        self.psc_dns_zones: dict[str, DnsManagedZone] = {}
+        if config.psc_google_apis is not None:
+            self._create_psc_endpoint(config, config.psc_google_apis)
+
+    def _create_region(self, config: NetworkConfig, regional: RegionalSubnet, suffix: str) -> None:
+        """Create the subnet, Cloud Router and Cloud NAT of one region."""
+        region = regional.region
+
         # Subnet with secondary ranges for GKE
-        self.subnet = ComputeSubnetwork(
+        self.subnets[region] = ComputeSubnetwork(
             self,
-            "subnet",
-            name=config.subnet_name,
-            region=config.region,
+            f"subnet{suffix}",
+            name=regional.subnet_name,
+            region=region,
             network=self.network.id,
-            ip_cidr_range=config.cidr,
+            ip_cidr_range=regional.cidr,
             private_ip_google_access=True,  # Best practice: access Google APIs without public IP
             secondary_ip_range=[
                 ComputeSubnetworkSecondaryIpRange(
-                    range_name=config.pod_range_name, ip_cidr_range=config.pod_cidr
+                    range_name=config.pod_range_name, ip_cidr_range=regional.pod_cidr
                 ),
                 ComputeSubnetworkSecondaryIpRange(
-                    range_name=config.service_range_name, ip_cidr_range=config.service_cidr
+                    range_name=config.service_range_name, ip_cidr_range=regional.service_cidr
                 ),
             ],
+            # Flow logs: sampled 5-tuple records with latency/bytes for traffic analysis
+            log_config=ComputeSubnetworkLogConfig(
+                aggregation_interval=config.flow_logs_interval,
+                flow_sampling=config.flow_logs_sampling,
+                metadata=config.flow_logs_metadata,
+            )
+            if config.flow_logs
+            else None,
         )
 
         # Cloud Router (required for NAT)
-        self.router = ComputeRouter(
+        self.routers[region] = ComputeRouter(
             self,
-            "router",
-            name=f"{config.vpc_name}-router",
-            region=config.region,
+            f"router{suffix}",
+            name=regional.router_name,
+            region=region,
             network=self.network.id,
         )
 
         # Cloud NAT (allows private nodes to access internet)
-        self.nat = ComputeRouterNat(
+        self.nats[region] = ComputeRouterNat(
             self,
-            "nat",
-            name=f"{config.vpc_name}-nat",
-            router=self.router.name,
-            region=config.region,
+            f"nat{suffix}",
+            name=regional.nat_name,
+            router=self.routers[region].name,
+            region=region,
             nat_ip_allocate_option="AUTO_ONLY",
+            # ALL_SUBNETWORKS covers the subnets in the router's region only
             source_subnetwork_ip_ranges_to_nat="ALL_SUBNETWORKS_ALL_IP_RANGES",
+            # NAT logs: ERRORS_ONLY surfaces dropped connections (port exhaustion)
+            log_config=ComputeRouterNatLogConfig(enable=True, filter=config.nat_logging)
+            if config.nat_logging
+            else None,
+        )
+
+    def _create_psc_endpoint(self, config: NetworkConfig, bundle: str) -> None:
+        """Create the PSC endpoint for Google APIs and its private DNS zones."""
+        self.psc_address = ComputeGlobalAddress(
+            self,
+            "psc_address",
+            name=f"{config.prefix}-{config.env}-psc-apis-ip",
+            purpose="PRIVATE_SERVICE_CONNECT",
+            address_type="INTERNAL",
+            address=config.psc_address,
+            network=self.network.id,
+        )
+        self.psc_endpoint = ComputeGlobalForwardingRule(
+            self,
+            "psc_endpoint",
+            name=config.psc_endpoint_name,
+            target=bundle,
+            network=self.network.id,
+            ip_address=self.psc_address.id,
+            # PSC endpoints for Google APIs have no load balancing scheme
+            load_balancing_scheme="",
         )
 
+        # Resolve each domain and its subdomains to the endpoint inside the VPC
+        for domain in PSC_API_DOMAINS:
+            zone_id = domain.replace(".", "_")
+            zone = DnsManagedZone(
+                self,
+                f"psc_zone_{zone_id}",
+                name=f"{config.prefix}-{config.env}-{domain.replace('.', '-')}",
+                dns_name=f"{domain}.",
+                visibility="private",
+                description=f"{domain} via Private Service Connect ({bundle})",
+                private_visibility_config=DnsManagedZonePrivateVisibilityConfig(
+                    networks=[
+                        DnsManagedZonePrivateVisibilityConfigNetworks(network_url=self.network.id)
+                    ]
+                ),
+            )
+            DnsRecordSet(
+                self,
+                f"psc_a_{zone_id}",
+                managed_zone=zone.name,
+                name=f"{domain}.",
+                type="A",
+                ttl=300,
+                rrdatas=[config.psc_address],
+            )
+            DnsRecordSet(
+                self,
+                f"psc_cname_{zone_id}",
+                managed_zone=zone.name,
+                name=f"*.{domain}.",
+                type="CNAME",
+                ttl=300,
+                rrdatas=[f"{domain}."],
+            )
+            self.psc_dns_zones[domain] = zone
+
     @property
     def network_id(self) -> str:
         """Get the VPC network ID."""
@@ -130,5 +284,26 @@ class StandardVPC(Construct):
 
     @property
     def subnet_id(self) -> str:
-        """Get the subnet ID."""
+        """Get the subnet ID (primary region)."""
         return self.subnet.id
+
+    def subnet_id_for(self, region: str) -> str:
+        """
+        Get the subnet ID of a region.
+
+        Raises:
+            ValueError: If the VPC has no subnet in the region
+        """
+        if region not in self.subnets:
+            raise ValueError(f"No subnet in region '{region}' (regions: {list(self.subnets)})")
+        return self.subnets[region].id
+
+    @property
+    def has_private_services_access(self) -> bool:
+        """Check if private services access was configured."""
+        return self.private_services_connection is not None
+
+    @property
+    def has_psc_google_apis(self) -> bool:
+        """Check if a Private Service Connect endpoint for Google APIs was configured."""
+        return self.psc_endpoint is not None
@@ -5,9 +5,67 @@ Profiles define sensible defaults for Dev, Staging, and Production environments.
 Each profile can be customized via override parameters.
 """
 
-from typing import Any
+import functools
+from typing import Any, Callable, TypeVar, cast
 
-from .config import ClusterConfig, NetworkConfig
+from .config import (
+    CacheConfig,
+    ClusterConfig,
+    DatabaseConfig,
+    NetworkConfig,
+    offset_cidr,
+    region_suffix,
+)
+
+# Maximum memoized configs per profile method (oldest entries are evicted first)
+CONFIG_CACHE_SIZE = 1024
+
+_CONFIG_CACHES: list[dict] = []
+_Getter = TypeVar("_Getter", bound=Callable[..., Any])
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable, type-tagged form of an override value (so True and 1 differ)."""
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((k, _freeze(v)) for k, v in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (tuple, tuple(_freeze(v) for v in value))
+    return (type(value), value)
+
+
+def memoize_config(method: _Getter) -> _Getter:
+    """
+    Memoize a profile get_*_config method per (profile identity, overrides).
+
+    Only for methods returning frozen configs: equal calls return the same
+    instance. The key is a snapshot of the profile's _identity, so changing a
+    profile attribute afterwards cannot return configs built for the old
+    values. Calls with unhashable override values are not cached.
+    """
+    cache: dict = {}
+    _CONFIG_CACHES.append(cache)
+
+    @functools.wraps(method)
+    def wrapper(self: "PlatformProfile", **overrides: Any) -> Any:
+        try:
+            key = (self._identity, tuple(sorted((k, _freeze(v)) for k, v in overrides.items())))
+            config = cache.get(key)
+        except TypeError:
+            return method(self, **overrides)
+        if config is None:
+            config = method(self, **overrides)
+            if len(cache) >= CONFIG_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = config
+        return config
+
+    return cast(_Getter, wrapper)
+
+
+def clear_config_cache() -> None:
+    """Drop all memoized profile configs."""
+    for cache in _CONFIG_CACHES:
+        cache.clear()
 
 
 class PlatformProfile:
@@ -15,6 +73,9 @@ class PlatformProfile:
     Base class for Platform Profiles (Golden Paths).
 
     Enforces naming conventions and provides common configuration patterns.
+    Profiles compare equal by type and arguments; get_network_config and
+    get_cluster_config are memoized per (profile arguments, overrides) and
+    return the same frozen config for equal calls.
 
     Args:
         project_id: GCP project ID
@@ -29,15 +90,31 @@ class PlatformProfile:
         self.env = env
         self.prefix = prefix
 
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, PlatformProfile) and self._identity == other._identity
+
+    def __hash__(self) -> int:
+        return hash(self._identity)
+
+    @property
+    def _identity(self) -> tuple:
+        """Profile type and arguments (memoization key)."""
+        return (type(self), self.project_id, self.region, self.env, self.prefix)
+
     @property
     def common_labels(self) -> dict:
         """Standard labels applied to all resources."""
         return {"environment": self.env, "managed-by": "cdktf", "project": self.project_id}
 
+    @memoize_config
     def get_network_config(self, **overrides: Any) -> NetworkConfig:
         """
         Get network configuration with optional overrides.
 
+        Default telemetry (cheap, overridden by Staging/Prod):
+        - flow_logs: 10 minute aggregation, 10% sampling, no metadata
+        - nat_logging: ERRORS_ONLY
+
         Args:
             **overrides: Override any NetworkConfig parameter
                         (e.g., cidr="10.1.0.0/16")
@@ -50,9 +127,15 @@ class PlatformProfile:
             "region": self.region,
             "env": self.env,
             "prefix": self.prefix,
+            "flow_logs": True,
+            "flow_logs_interval": "INTERVAL_10_MIN",
+            "flow_logs_sampling": 0.1,
+            "flow_logs_metadata": "EXCLUDE_ALL_METADATA",
+            "nat_logging": "ERRORS_ONLY",
         }
         return NetworkConfig(**{**defaults, **overrides})
 
+    @memoize_config
     def get_cluster_config(self, **overrides: Any) -> ClusterConfig:
         """
         Get cluster configuration with optional overrides.
@@ -60,6 +143,85 @@ class PlatformProfile:
         """
         raise NotImplementedError("Subclasses must implement get_cluster_config")
 
+    def get_cluster_configs(
+        self, network_config: NetworkConfig, **overrides: Any
+    ) -> dict[str, ClusterConfig]:
+        """
+        Get one cluster configuration per network region (multi-region platforms).
+
+        The primary region's cluster is get_cluster_config(**overrides). Each
+        additional region N gets a cluster named {prefix}-{env}-cluster-{suffix}
+        (suffix = region_suffix(region), e.g. euw4 for europe-west4, keeping
+        names within GKE's 40 character limit) in its default zone, with the
+        master CIDR shifted by N /28 blocks so control plane ranges do not
+        overlap in the shared VPC.
+
+        Args:
+            network_config: NetworkConfig whose regions get a cluster
+            **overrides: Override any ClusterConfig parameter (zone applies to
+                         the primary region only)
+
+        Returns:
+            Dict of region to ClusterConfig, primary region first
+        """
+        ranges = {
+            "pod_range_name": network_config.pod_range_name,
+            "service_range_name": network_config.service_range_name,
+        }
+        primary = self.get_cluster_config(**{**ranges, **overrides})
+        regional_overrides = {k: v for k, v in overrides.items() if k != "zone"}
+
+        configs = {network_config.region: primary}
+        for index, region in enumerate(network_config.additional_regions, start=1):
+            configs[region] = self.get_cluster_config(
+                **{
+                    **ranges,
+                    **regional_overrides,
+                    "region": region,
+                    "name_suffix": region_suffix(region),
+                    "master_cidr": offset_cidr(primary.master_cidr, index),
+                }
+            )
+        return configs
+
+    def get_cache_config(self, **overrides: Any) -> CacheConfig:
+        """
+        Get cache configuration with optional overrides.
+
+        Default settings (single node, overridden by Staging/Prod):
+        - tier: BASIC
+        - memory_size_gb: 1
+        """
+        defaults = {
+            "project_id": self.project_id,
+            "region": self.region,
+            "env": self.env,
+            "prefix": self.prefix,
+            "tier": "BASIC",
+            "memory_size_gb": 1,
+        }
+        return CacheConfig(**{**defaults, **overrides})
+
+    def get_database_config(self, **overrides: Any) -> DatabaseConfig:
+        """
+        Get database configuration with optional overrides.
+
+        Default settings (small zonal instance, overridden by Staging/Prod):
+        - tier: db-custom-1-3840 (1 vCPU, 3.75 GB)
+        - disk_size: 10GB
+        - availability_type: ZONAL
+        """
+        defaults = {
+            "project_id": self.project_id,
+            "region": self.region,
+            "env": self.env,
+            "prefix": self.prefix,
+            "tier": "db-custom-1-3840",
+            "disk_size": 10,
+            "availability_type": "ZONAL",
+        }
+        return DatabaseConfig(**{**defaults, **overrides})
+
 
 class DevProfile(PlatformProfile):
     """
@@ -72,6 +234,7 @@ class DevProfile(PlatformProfile):
     - Lower node count limits
     """
 
+    @memoize_config
     def get_cluster_config(self, **overrides: Any) -> ClusterConfig:
         """
         Get dev-optimized cluster configuration.
@@ -81,6 +244,9 @@ class DevProfile(PlatformProfile):
         - max_nodes: 3 (limited scaling)
         - spot_instances: True (cost savings)
         - disk_size: 50GB
+        - telemetry_preset: minimal (system metrics and logs only)
+        - vertical/horizontal_pod_autoscaling: True (right-sized requests keep
+          the 3 small nodes from filling up with oversized pods)
         """
         defaults = {
             "project_id": self.project_id,
@@ -93,6 +259,9 @@ class DevProfile(PlatformProfile):
             "max_nodes": 3,
             "spot_instances": True,
             "disk_size": 50,
+            "telemetry_preset": "minimal",
+            "vertical_pod_autoscaling": True,
+            "horizontal_pod_autoscaling": True,
         }
         return ClusterConfig(**{**defaults, **overrides})
 
@@ -106,8 +275,38 @@ class ProdProfile(PlatformProfile):
     - No spot instances (stability)
     - Larger machine types
     - Higher disk sizes
+    - Surge upgrades that never reduce serving capacity
+    - Detailed flow logs and full NAT logging
     """
 
+    @memoize_config
+    def get_network_config(self, **overrides: Any) -> NetworkConfig:
+        """
+        Get production network configuration.
+
+        Default settings:
+        - pod_cidr: 10.11.0.0/20 (16 nodes at one /24 per node, room for
+          max_nodes=10 and surge nodes)
+
+        Default telemetry:
+        - flow_logs: 5 second aggregation, 50% sampling, all metadata
+        - nat_logging: ALL (translations and errors)
+        """
+        defaults = {
+            "project_id": self.project_id,
+            "region": self.region,
+            "env": self.env,
+            "prefix": self.prefix,
+            "pod_cidr": "10.11.0.0/20",
+            "flow_logs": True,
+            "flow_logs_interval": "INTERVAL_5_SEC",
+            "flow_logs_sampling": 0.5,
+            "flow_logs_metadata": "INCLUDE_ALL_METADATA",
+            "nat_logging": "ALL",
+        }
+        return NetworkConfig(**{**defaults, **overrides})
+
+    @memoize_config
     def get_cluster_config(self, **overrides: Any) -> ClusterConfig:
         """
         Get production-optimized cluster configuration.
@@ -118,6 +317,14 @@ class ProdProfile(PlatformProfile):
         - max_nodes: 10 (scaling headroom)
         - spot_instances: False (stability)
         - disk_size: 100GB
+        - upgrade_strategy: SURGE with max_surge=2, max_unavailable=0
+          (new nodes are added before old ones drain)
+        - telemetry_preset: full (managed Prometheus, control plane, kubelet
+          and cAdvisor metrics)
+        - vertical/horizontal_pod_autoscaling: True (VPA right-sizes requests,
+          HPA scales replicas with load)
+        - usage_metering: True with egress metering (per-namespace usage in
+          BigQuery; not with autopilot) and cost_allocation: True
         """
         defaults = {
             "project_id": self.project_id,
@@ -130,9 +337,72 @@ class ProdProfile(PlatformProfile):
             "max_nodes": 10,
             "spot_instances": False,
             "disk_size": 100,
+            "upgrade_strategy": "SURGE",
+            "max_surge": 2,
+            "max_unavailable": 0,
+            "telemetry_preset": "full",
+            "vertical_pod_autoscaling": True,
+            "horizontal_pod_autoscaling": True,
+            "usage_metering": True,
+            "cost_allocation": True,
         }
+        if overrides.get("autopilot"):
+            # Autopilot manages node upgrades itself and has no usage metering
+            del defaults["upgrade_strategy"], defaults["max_surge"], defaults["max_unavailable"]
+            del defaults["usage_metering"]
+        elif overrides.get("upgrade_strategy", "SURGE") != "SURGE":
+            # Surge defaults do not apply to other strategies
+            del defaults["max_surge"], defaults["max_unavailable"]
         return ClusterConfig(**{**defaults, **overrides})
 
+    def get_cache_config(self, **overrides: Any) -> CacheConfig:
+        """
+        Get production cache configuration.
+
+        Default settings:
+        - tier: STANDARD_HA (automatic failover)
+        - memory_size_gb: 5
+        - replica_count: 2 with read replicas (read scaling)
+        """
+        defaults = {
+            "project_id": self.project_id,
+            "region": self.region,
+            "env": self.env,
+            "prefix": self.prefix,
+            "tier": "STANDARD_HA",
+            "memory_size_gb": 5,
+            "replica_count": 2,
+            "read_replicas": True,
+        }
+        return CacheConfig(**{**defaults, **overrides})
+
+    def get_database_config(self, **overrides: Any) -> DatabaseConfig:
+        """
+        Get production database configuration.
+
+        Default settings:
+        - tier: db-custom-4-16384 (4 vCPU, 16 GB)
+        - disk_size: 100GB (grows automatically)
+        - availability_type: REGIONAL (standby in another zone)
+        - read_replicas: 1 (read scaling)
+        - log_min_duration_statement: 500ms on PostgreSQL (slow query log)
+        - deletion_protection: True
+        """
+        defaults: dict[str, Any] = {
+            "project_id": self.project_id,
+            "region": self.region,
+            "env": self.env,
+            "prefix": self.prefix,
+            "tier": "db-custom-4-16384",
+            "disk_size": 100,
+            "availability_type": "REGIONAL",
+            "read_replicas": 1,
+            "deletion_protection": True,
+        }
+        if overrides.get("database_version", "POSTGRES_").startswith("POSTGRES_"):
+            defaults["database_flags"] = {"log_min_duration_statement": "500"}
+        return DatabaseConfig(**{**defaults, **overrides})
+
 
 class StagingProfile(PlatformProfile):
     """
@@ -144,6 +414,29 @@ class StagingProfile(PlatformProfile):
     - Spot instances allowed
     """
 
+    @memoize_config
+    def get_network_config(self, **overrides: Any) -> NetworkConfig:
+        """
+        Get staging network configuration.
+
+        Default telemetry:
+        - flow_logs: 1 minute aggregation, 25% sampling, all metadata
+        - nat_logging: ERRORS_ONLY
+        """
+        defaults = {
+            "project_id": self.project_id,
+            "region": self.region,
+            "env": self.env,
+            "prefix": self.prefix,
+            "flow_logs": True,
+            "flow_logs_interval": "INTERVAL_1_MIN",
+            "flow_logs_sampling": 0.25,
+            "flow_logs_metadata": "INCLUDE_ALL_METADATA",
+            "nat_logging": "ERRORS_ONLY",
+        }
+        return NetworkConfig(**{**defaults, **overrides})
+
+    @memoize_config
     def get_cluster_config(self, **overrides: Any) -> ClusterConfig:
         """
         Get staging cluster configuration.
@@ -154,6 +447,8 @@ class StagingProfile(PlatformProfile):
         - max_nodes: 5
         - spot_instances: True (cost savings)
         - disk_size: 75GB
+        - telemetry_preset: standard (managed Prometheus + workload metrics)
+        - vertical/horizontal_pod_autoscaling: True (same as prod)
         """
         defaults = {
             "project_id": self.project_id,
@@ -166,5 +461,72 @@ class StagingProfile(PlatformProfile):
             "max_nodes": 5,
             "spot_instances": True,
             "disk_size": 75,
+            "telemetry_preset": "standard",
+            "vertical_pod_autoscaling": True,
+            "horizontal_pod_autoscaling": True,
         }
         return ClusterConfig(**{**defaults, **overrides})
+
+    def get_cache_config(self, **overrides: Any) -> CacheConfig:
+        """
+        Get staging cache configuration.
+
+        Default settings:
+        - tier: STANDARD_HA (failover tested like prod)
+        - memory_size_gb: 2
+        """
+        defaults = {
+            "project_id": self.project_id,
+            "region": self.region,
+            "env": self.env,
+            "prefix": self.prefix,
+            "tier": "STANDARD_HA",
+            "memory_size_gb": 2,
+        }
+        return CacheConfig(**{**defaults, **overrides})
+
+    def get_database_config(self, **overrides: Any) -> DatabaseConfig:
+        """
+        Get staging database configuration.
+
+        Default settings:
+        - tier: db-custom-2-7680 (2 vCPU, 7.5 GB)
+        - disk_size: 20GB
+        - availability_type: ZONAL
+        """
+        defaults = {
+            "project_id": self.project_id,
+            "region": self.region,
+            "env": self.env,
+            "prefix": self.prefix,
+            "tier": "db-custom-2-7680",
+            "disk_size": 20,
+            "availability_type": "ZONAL",
+        }
+        return DatabaseConfig(**{**defaults, **overrides})
+
+
+PROFILES: dict[str, type[PlatformProfile]] = {
+    "dev": DevProfile,
+    "staging": StagingProfile,
+    "prod": ProdProfile,
+}
+
+
+def get_profile(project_id: str, region: str, env: str, prefix: str) -> PlatformProfile:
+    """
+    Select the Golden Path profile for an environment.
+
+    Unknown environments fall back to DevProfile (cheapest defaults).
+
+    Args:
+        project_id: GCP project ID
+        region: GCP region
+        env: Environment name (dev, staging, prod)
+        prefix: Resource naming prefix
+
+    Returns:
+        PlatformProfile instance for the environment
+    """
+    profile_cls = PROFILES.get(env, DevProfile)
+    return profile_cls(project_id, region, env, prefix)
@@ -0,0 +1,344 @@
+"""
+Provider lock files and shared plugin cache configuration.
+
+Every stack directory of cdktf.out runs its own `terraform init`, which
+downloads the google provider again. This tool prepares synthesized output so
+a fleet of stacks initializes from one local copy:
+
+- A `.terraform.lock.hcl` per stack, pinned to the provider versions of the
+  synthesized required_providers; the google provider must match the version
+  the installed cdktf-cdktf-provider-google bindings were generated for
+- Checksums in the lock files, computed from a local filesystem mirror
+  (`terraform providers mirror <dir>` once per provider upgrade); without a
+  mirror the lock files pin versions only and `terraform init` adds checksums
+- A shared Terraform CLI configuration (`terraformrc`) with a plugin cache
+  directory and, if given, the filesystem mirror as the installation source
+  for the locked providers
+
+Terraform only links providers from the plugin cache when the lock file
+already holds a checksum for the current platform, so use a mirror to get
+cache hits on the first `terraform init` of every stack.
+
+Usage:
+    terraform providers mirror -platform=linux_amd64 ~/.terraform.d/mirror
+    python -m infrastructure_lib.provider_lock cdktf.out --mirror ~/.terraform.d/mirror
+    export TF_CLI_CONFIG_FILE=$PWD/cdktf.out/terraformrc
+
+Or from the app, after app.synth():
+    write_lock_files(app.outdir, mirror="~/.terraform.d/mirror")
+"""
+
+import argparse
+import base64
+import hashlib
+import importlib.util
+import json
+import os
+import re
+import sys
+import tarfile
+import zipfile
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .synth_diff import load_stacks
+
+LOCK_FILE = ".terraform.lock.hcl"
+CLI_CONFIG_FILE = "terraformrc"
+DEFAULT_REGISTRY = "registry.terraform.io"
+DEFAULT_NAMESPACE = "hashicorp"
+DEFAULT_PLUGIN_CACHE = "~/.terraform.d/plugin-cache"
+GOOGLE_BINDINGS = "cdktf_cdktf_provider_google"
+
+EXACT_VERSION = re.compile(r"^=?\s*(\d+\.\d+\.\d+(?:-[\w.]+)?)$")
+LOCK_HEADER = (
+    '# This file is maintained automatically by "terraform init".\n'
+    "# Manual edits may be lost in future updates.\n"
+)
+
+
+@dataclass(frozen=True)
+class ProviderPin:
+    """An exact provider version, addressed by its fully qualified source."""
+
+    source: str
+    version: str
+
+    @property
+    def type(self) -> str:
+        """Provider type (registry.terraform.io/hashicorp/google -> google)."""
+        return self.source.rsplit("/", 1)[-1]
+
+
+@dataclass
+class LockReport:
+    """Lock file written for one stack."""
+
+    stack: str
+    path: str
+    providers: dict[str, str]
+    hashes: dict[str, int] = field(default_factory=dict)
+
+
+def provider_source(source: str) -> str:
+    """Fully qualified provider source (google -> registry.terraform.io/hashicorp/google)."""
+    parts = source.lower().split("/")
+    if len(parts) == 1:
+        parts = [DEFAULT_REGISTRY, DEFAULT_NAMESPACE, *parts]
+    elif len(parts) == 2:
+        parts = [DEFAULT_REGISTRY, *parts]
+    if len(parts) != 3 or not all(parts):
+        raise ValueError(f"Invalid provider source '{source}'")
+    return "/".join(parts)
+
+
+def installed_provider_pin(package: str = GOOGLE_BINDINGS) -> Optional[ProviderPin]:
+    """
+    Provider version the installed cdktf bindings were generated for.
+
+    Reads the jsii assembly metadata without importing the bindings (and
+    starting the jsii runtime).
+
+    Returns:
+        The pin, or None if the bindings are not installed
+    """
+    spec = importlib.util.find_spec(package)
+    if spec is None or not spec.submodule_search_locations:
+        return None
+    for location in spec.submodule_search_locations:
+        for assembly in sorted(Path(location, "_jsii").glob("*.jsii.tgz")):
+            with tarfile.open(assembly) as tar:
+                member = tar.extractfile("package/package.json")
+                if member is None:
+                    continue
+                provider = json.load(member).get("cdktf", {}).get("provider", {})
+            if provider.get("name") and provider.get("version"):
+                return ProviderPin(provider_source(provider["name"]), provider["version"])
+    return None
+
+
+def required_providers(
+    synth: dict[str, Any], installed: Iterable[ProviderPin] = ()
+) -> list[ProviderPin]:
+    """
+    Exact provider versions of a synthesized stack.
+
+    Providers without an exact version constraint take the version of the
+    installed bindings for the same source.
+
+    Raises:
+        ValueError: If a provider is neither pinned nor installed, or the
+            synthesized version differs from the installed bindings (stale synth)
+    """
+    installed_versions = {pin.source: pin.version for pin in installed}
+    pins = []
+    for name, requirement in synth.get("terraform", {}).get("required_providers", {}).items():
+        if isinstance(requirement, str):
+            requirement = {"version": requirement}
+        source = provider_source(requirement.get("source", name))
+        match = EXACT_VERSION.match(str(requirement.get("version", "")).strip())
+        version = match.group(1) if match else installed_versions.get(source)
+        if version is None:
+            raise ValueError(
+                f"Provider {source} has no exact version ({requirement.get('version')!r})"
+            )
+        if source in installed_versions and version != installed_versions[source]:
+            raise ValueError(
+                f"Provider {source} {version} does not match the installed bindings "
+                f"({installed_versions[source]}); re-run cdktf synth"
+            )
+        pins.append(ProviderPin(source, version))
+    return sorted(set(pins), key=lambda p: p.source)
+
+
+# --- Checksums ---
+
+
+def _hash1(files: Iterable[tuple[str, bytes]]) -> str:
+    """Terraform "h1:" checksum (Go dirhash Hash1) over (name, content) pairs."""
+    summary = hashlib.sha256()
+    for name, content in sorted(files):
+        summary.update(f"{hashlib.sha256(content).hexdigest()}  {name}\n".encode())
+    return "h1:" + base64.b64encode(summary.digest()).decode()
+
+
+def package_hashes(package: Union[str, Path]) -> list[str]:
+    """
+    Lock file checksums of a provider package.
+
+    Packed archives (.zip) get their "h1:" content checksum and the "zh:"
+    archive checksum the registry publishes; unpacked directories get "h1:".
+    """
+    package = Path(package)
+    if package.is_dir():
+        files = [
+            (path.relative_to(package).as_posix(), path.read_bytes())
+            for path in package.rglob("*")
+            if path.is_file()
+        ]
+        return [_hash1(files)]
+    with zipfile.ZipFile(package) as archive:
+        h1 = _hash1((name, archive.read(name)) for name in archive.namelist())
+    return [h1, "zh:" + hashlib.sha256(package.read_bytes()).hexdigest()]
+
+
+def mirror_packages(mirror: Union[str, Path], pin: ProviderPin) -> list[Path]:
+    """
+    Packages of a provider version in a filesystem mirror (any platform).
+
+    Supports both layouts Terraform reads: packed
+    HOST/NAMESPACE/TYPE/terraform-provider-TYPE_VERSION_OS_ARCH.zip and
+    unpacked HOST/NAMESPACE/TYPE/VERSION/OS_ARCH/.
+    """
+    provider_dir = Path(mirror).expanduser().joinpath(*pin.source.split("/"))
+    packed = provider_dir.glob(f"terraform-provider-{pin.type}_{pin.version}_*.zip")
+    unpacked = (p for p in provider_dir.joinpath(pin.version).glob("*_*") if p.is_dir())
+    return sorted([*packed, *unpacked])
+
+
+# --- Output ---
+
+
+def format_lock_file(pins: Iterable[ProviderPin], hashes: dict[str, list[str]]) -> str:
+    """Render a dependency lock file in the layout `terraform init` writes."""
+    blocks = []
+    for pin in sorted(pins, key=lambda p: p.source):
+        lines = [
+            f'provider "{pin.source}" {{',
+            f'  version     = "{pin.version}"',
+            f'  constraints = "{pin.version}"',
+        ]
+        checksums = sorted(set(hashes.get(pin.source, [])))
+        if checksums:
+            lines += ["  hashes = [", *(f'    "{c}",' for c in checksums), "  ]"]
+        blocks.append("\n".join([*lines, "}"]) + "\n")
+    return LOCK_HEADER + "".join("\n" + block for block in blocks)
+
+
+def format_cli_config(
+    plugin_cache_dir: Union[str, Path],
+    mirror: Optional[Union[str, Path]] = None,
+    sources: Iterable[str] = (),
+) -> str:
+    """
+    Render a Terraform CLI configuration with a shared plugin cache.
+
+    With a mirror, the given provider sources install only from it and
+    everything else from its origin registry.
+    """
+    lines = [f'plugin_cache_dir = "{Path(plugin_cache_dir).expanduser().resolve()}"']
+    sources = sorted(set(sources))
+    if mirror is not None and sources:
+        included = ", ".join(f'"{s}"' for s in sources)
+        lines += [
+            "",
+            "provider_installation {",
+            "  filesystem_mirror {",
+            f'    path    = "{Path(mirror).expanduser().resolve()}"',
+            f"    include = [{included}]",
+            "  }",
+            "  direct {",
+            f"    exclude = [{included}]",
+            "  }",
+            "}",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def write_lock_files(
+    outdir: Union[str, Path],
+    mirror: Optional[Union[str, Path]] = None,
+    plugin_cache_dir: Optional[Union[str, Path]] = None,
+) -> list[LockReport]:
+    """
+    Write a lock file into every stack of cdktf.out and a shared CLI config.
+
+    Args:
+        outdir: Synthesized cdktf.out directory
+        mirror: Filesystem mirror to take checksums from and install from
+        plugin_cache_dir: Shared plugin cache (default: $TF_PLUGIN_CACHE_DIR
+            or ~/.terraform.d/plugin-cache); created if missing
+
+    Returns:
+        LockReport per stack
+
+    Raises:
+        ValueError: If no stacks are found or a provider cannot be pinned
+    """
+    outdir = Path(outdir)
+    stacks_dir = outdir / "stacks" if (outdir / "stacks").is_dir() else outdir
+    installed = [pin for pin in [installed_provider_pin()] if pin is not None]
+    hashes: dict[ProviderPin, list[str]] = {}
+    reports = []
+
+    for stack, synth in load_stacks(outdir).items():
+        pins = required_providers(synth, installed)
+        for pin in pins:
+            if pin not in hashes:
+                packages = mirror_packages(mirror, pin) if mirror is not None else []
+                hashes[pin] = [h for package in packages for h in package_hashes(package)]
+        path = stacks_dir / stack / LOCK_FILE
+        path.write_text(format_lock_file(pins, {pin.source: hashes[pin] for pin in pins}))
+        reports.append(
+            LockReport(
+                stack=stack,
+                path=str(path),
+                providers={pin.source: pin.version for pin in pins},
+                hashes={pin.source: len(hashes[pin]) for pin in pins},
+            )
+        )
+
+    cache = Path(
+        plugin_cache_dir or os.getenv("TF_PLUGIN_CACHE_DIR") or DEFAULT_PLUGIN_CACHE
+    ).expanduser()
+    cache.mkdir(parents=True, exist_ok=True)
+    (outdir / CLI_CONFIG_FILE).write_text(
+        format_cli_config(cache, mirror, {pin.source for pin in hashes})
+    )
+    return reports
+
+
+def format_lock_report(reports: list[LockReport]) -> str:
+    """Render the locked providers per stack."""
+    lines = []
+    for report in reports:
+        for source, version in report.providers.items():
+            checksums = report.hashes.get(source, 0)
+            note = f"{checksums} checksum(s)" if checksums else "no checksums (not in mirror)"
+            lines.append(f"{report.stack}: {source} {version} - {note}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(
+        description="Write provider lock files and a shared plugin cache config"
+    )
+    parser.add_argument("outdir", help="cdktf.out directory")
+    parser.add_argument("--mirror", help="Filesystem mirror (terraform providers mirror)")
+    parser.add_argument(
+        "--plugin-cache",
+        help=f"Shared plugin cache (default: $TF_PLUGIN_CACHE_DIR or {DEFAULT_PLUGIN_CACHE})",
+    )
+    parser.add_argument("--json", action="store_true", help="Output JSON instead of text")
+    args = parser.parse_args(argv)
+
+    reports = write_lock_files(args.outdir, args.mirror, args.plugin_cache)
+    config = Path(args.outdir, CLI_CONFIG_FILE).resolve()
+
+    if args.json:
+        print(
+            json.dumps(
+                {"cli_config": str(config), "stacks": [asdict(r) for r in reports]}, indent=2
+            )
+        )
+    else:
+        print(format_lock_report(reports))
+        print(f"\nexport TF_CLI_CONFIG_FILE={config}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
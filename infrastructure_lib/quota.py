@@ -0,0 +1,429 @@
+"""
+Offline quota and address-space estimator.
+
+Aggregates the worst-case regional demand of a fleet (platform specs) or of
+synthesized stacks and compares it with a local quota file, so scale-outs do
+not fail mid-apply on exhausted quota:
+
+- vCPUs: worst-case nodes x machine vCPUs, per machine family quota metric
+  (CPUS for E2/N1, N2_CPUS, C3_CPUS, ...)
+- Persistent disk: worst-case nodes x disk_size (DISKS_TOTAL_GB for
+  pd-standard, SSD_TOTAL_GB for pd-balanced/pd-ssd)
+- External IPs: Cloud NAT addresses (IN_USE_ADDRESSES), one per 1008 VMs at
+  the default 64 ports per VM
+- Address space (from the config, not the quota file): node IPs in each
+  subnet and nodes the pod secondary range can hold
+
+Worst-case nodes are max_nodes plus upgrade surge (max_surge, GKE default 1)
+or twice max_nodes for blue-green upgrades, per node pool (spot_fallback adds
+the on-demand pool at its fallback_node_limit).
+
+Quota file (limits per project, region and metric; missing metrics are
+reported without a limit):
+    {
+        "acme-prod": {
+            "us-central1": {"CPUS": 24, "N2_CPUS": 96, "SSD_TOTAL_GB": 2048,
+                            "DISKS_TOTAL_GB": 4096, "IN_USE_ADDRESSES": 8}
+        }
+    }
+
+Usage:
+    python -m infrastructure_lib.quota --quotas quotas.json                 # built-in profiles
+    python -m infrastructure_lib.quota --quotas quotas.json fleet.json
+    python -m infrastructure_lib.quota --quotas quotas.json --synth cdktf.out --json
+"""
+
+import argparse
+import ipaddress
+import json
+import math
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .capacity import max_nodes_for_pod_range
+from .fleet import PlatformSpec, default_fleet, load_fleet
+from .machine_types import get_machine_type
+from .synth_diff import load_stacks
+
+# Families whose vCPUs count against the generic CPUS quota
+GENERIC_CPU_FAMILIES = ("e2", "n1")
+DISK_QUOTA_METRICS = {
+    "pd-standard": "DISKS_TOTAL_GB",
+    "pd-balanced": "SSD_TOTAL_GB",
+    "pd-ssd": "SSD_TOTAL_GB",
+}
+NAT_IP_METRIC = "IN_USE_ADDRESSES"
+NODE_IPS_METRIC = "NODE_IPS"
+POD_RANGE_METRIC = "POD_RANGE_NODES"
+# Cloud NAT: 64512 usable ports per address, 64 ports per VM by default
+NAT_PORTS_PER_IP = 64512
+NAT_DEFAULT_PORTS_PER_VM = 64
+# GCP reserves 4 addresses in every subnet primary range
+SUBNET_RESERVED_IPS = 4
+GKE_DEFAULT_MAX_SURGE = 1
+LOW_HEADROOM_PERCENT = 10.0
+
+_REFERENCE = re.compile(r"^\$\{(\w+)\.([\w-]+)\.\w+\}$")
+
+Quotas = dict[str, dict[str, dict[str, float]]]
+
+
+# --- Footprint ---
+
+
+@dataclass
+class NodePoolFootprint:
+    """Worst-case size of one node pool."""
+
+    project: str
+    region: str
+    name: str
+    machine_type: str
+    nodes: int
+    disk_type: str
+    disk_size_gb: int
+    subnet: str
+
+
+@dataclass
+class SubnetFootprint:
+    """Address ranges of one subnet."""
+
+    project: str
+    region: str
+    name: str
+    cidr: str
+    pod_cidr: Optional[str] = None
+
+
+@dataclass
+class NatFootprint:
+    """A Cloud NAT gateway and the VMs it serves."""
+
+    project: str
+    region: str
+    name: str
+    vms: int = 0
+
+
+@dataclass
+class Footprint:
+    """Quota-relevant resources of a fleet or of synthesized stacks."""
+
+    node_pools: list[NodePoolFootprint] = field(default_factory=list)
+    subnets: list[SubnetFootprint] = field(default_factory=list)
+    nats: list[NatFootprint] = field(default_factory=list)
+
+
+def worst_case_nodes(max_nodes: int, strategy: Optional[str], max_surge: Optional[int]) -> int:
+    """Nodes of a pool at max_nodes during an upgrade."""
+    if strategy == "BLUE_GREEN":
+        return 2 * max_nodes
+    return max_nodes + (max_surge if max_surge is not None else GKE_DEFAULT_MAX_SURGE)
+
+
+def nat_ips_needed(vms: int, ports_per_vm: int = NAT_DEFAULT_PORTS_PER_VM) -> int:
+    """NAT addresses AUTO_ONLY allocation needs for the VMs (at least one)."""
+    return max(math.ceil(vms * ports_per_vm / NAT_PORTS_PER_IP), 1)
+
+
+def footprint_from_specs(specs: list[PlatformSpec]) -> Footprint:
+    """Footprint StandardPlatform would create for each spec (all regions)."""
+    footprint = Footprint()
+    for spec in specs:
+        network = spec.get_network_config()
+        configs = spec.get_cluster_configs()
+        for subnet in network.subnets:
+            config = configs[subnet.region]
+            footprint.subnets.append(
+                SubnetFootprint(
+                    spec.project_id, subnet.region, subnet.subnet_name, subnet.cidr, subnet.pod_cidr
+                )
+            )
+            pools = [] if config.autopilot else [("pool", config.max_nodes)]
+            if config.spot_fallback:
+                pools.append(("ondemand-pool", config.fallback_node_limit))
+            for suffix, max_nodes in pools:
+                footprint.node_pools.append(
+                    NodePoolFootprint(
+                        project=spec.project_id,
+                        region=subnet.region,
+                        name=f"{config.cluster_name}-{suffix}",
+                        machine_type=config.machine_type,
+                        nodes=worst_case_nodes(
+                            max_nodes, config.upgrade_strategy, config.max_surge
+                        ),
+                        disk_type=config.disk_type,
+                        disk_size_gb=config.disk_size,
+                        subnet=subnet.subnet_name,
+                    )
+                )
+            nodes = sum(
+                p.nodes
+                for p in footprint.node_pools
+                if (p.project, p.subnet) == (spec.project_id, subnet.subnet_name)
+            )
+            footprint.nats.append(
+                NatFootprint(spec.project_id, subnet.region, subnet.nat_name, nodes)
+            )
+    return footprint
+
+
+def footprint_from_synth(path: Union[str, Path]) -> Footprint:
+    """
+    Footprint of synthesized stacks (cdk.tf.json file or cdktf.out directory).
+
+    Resources without an explicit project use the stack's google provider project.
+    """
+    footprint = Footprint()
+    for stack_name, synth in load_stacks(path).items():
+        resources = synth.get("resource", {})
+        providers = synth.get("provider", {}).get("google", [{}])
+        default_project = providers[0].get("project", stack_name) if providers else stack_name
+
+        subnets = resources.get("google_compute_subnetwork", {})
+        for attrs in subnets.values():
+            pod_ranges = attrs.get("secondary_ip_range") or []
+            footprint.subnets.append(
+                SubnetFootprint(
+                    _project(attrs, default_project),
+                    attrs["region"],
+                    attrs["name"],
+                    attrs["ip_cidr_range"],
+                    pod_ranges[0]["ip_cidr_range"] if pod_ranges else None,
+                )
+            )
+
+        clusters = resources.get("google_container_cluster", {})
+        for attrs in resources.get("google_container_node_pool", {}).values():
+            cluster = clusters.get(_referenced_name(attrs.get("cluster")) or "", {})
+            subnet = subnets.get(_referenced_name(cluster.get("subnetwork")) or "", {})
+            autoscaling = attrs.get("autoscaling") or {}
+            upgrade = attrs.get("upgrade_settings") or {}
+            node_config = attrs.get("node_config") or {}
+            max_nodes = autoscaling.get("max_node_count", attrs.get("node_count", 0))
+            footprint.node_pools.append(
+                NodePoolFootprint(
+                    project=_project(attrs, default_project),
+                    region=subnet.get("region") or _zone_region(attrs.get("location", "")),
+                    name=attrs["name"],
+                    machine_type=node_config.get("machine_type", "e2-medium"),
+                    nodes=worst_case_nodes(
+                        max_nodes, upgrade.get("strategy"), upgrade.get("max_surge")
+                    ),
+                    disk_type=node_config.get("disk_type", "pd-balanced"),
+                    disk_size_gb=node_config.get("disk_size_gb", 100),
+                    subnet=subnet.get("name", ""),
+                )
+            )
+
+        # A NAT serves the node pools on its stack's subnets in the same region
+        stack_subnets = {attrs["name"] for attrs in subnets.values()}
+        for attrs in resources.get("google_compute_router_nat", {}).values():
+            project, region = _project(attrs, default_project), attrs["region"]
+            vms = sum(
+                p.nodes
+                for p in footprint.node_pools
+                if (p.project, p.region) == (project, region) and p.subnet in stack_subnets
+            )
+            footprint.nats.append(NatFootprint(project, region, attrs["name"], vms))
+    return footprint
+
+
+def _project(attrs: dict[str, Any], default: str) -> str:
+    """Project of a resource (the provider's project unless set explicitly)."""
+    return attrs.get("project") or default
+
+
+def _referenced_name(value: Optional[str]) -> Optional[str]:
+    """Resource name of a "${type.name.attribute}" reference."""
+    match = _REFERENCE.match(value or "")
+    return match.group(2) if match else None
+
+
+def _zone_region(zone: str) -> str:
+    """Region of a zone (us-central1-a -> us-central1); regions are returned unchanged."""
+    parts = zone.split("-")
+    return "-".join(parts[:2]) if len(parts) > 2 else zone
+
+
+# --- Estimate ---
+
+
+@dataclass
+class QuotaUsage:
+    """Worst-case demand against one quota or address-space limit."""
+
+    project: str
+    region: str
+    metric: str
+    demand: float
+    limit: Optional[float] = None
+    scope: str = ""  # subnet name for address-space metrics
+
+    @property
+    def headroom(self) -> Optional[float]:
+        """Limit minus demand (None without a limit)."""
+        return None if self.limit is None else self.limit - self.demand
+
+    @property
+    def exceeded(self) -> bool:
+        """True if demand is above the limit."""
+        return self.limit is not None and self.demand > self.limit
+
+    @property
+    def low(self) -> bool:
+        """True if less than LOW_HEADROOM_PERCENT of the limit is left."""
+        if self.limit is None or self.exceeded:
+            return False
+        return self.limit - self.demand < self.limit * LOW_HEADROOM_PERCENT / 100
+
+
+def cpu_quota_metric(family: str) -> str:
+    """Regional vCPU quota metric of a machine family."""
+    return "CPUS" if family in GENERIC_CPU_FAMILIES else f"{family.upper()}_CPUS"
+
+
+def estimate(footprint: Footprint, quotas: Optional[Quotas] = None) -> list[QuotaUsage]:
+    """
+    Aggregate worst-case demand per project, region and metric and attach limits.
+
+    Raises:
+        ValueError: If a node pool uses a machine type missing from the catalog
+    """
+    quotas = quotas or {}
+    demand: dict[tuple[str, str, str], float] = {}
+
+    def add(project: str, region: str, metric: str, amount: float) -> None:
+        key = (project, region, metric)
+        demand[key] = demand.get(key, 0) + amount
+
+    for pool in footprint.node_pools:
+        machine = get_machine_type(pool.machine_type)
+        if machine is None:
+            raise ValueError(f"{pool.name}: unknown machine type '{pool.machine_type}'")
+        add(pool.project, pool.region, cpu_quota_metric(machine.family), machine.vcpus * pool.nodes)
+        disk_metric = DISK_QUOTA_METRICS.get(pool.disk_type)
+        if disk_metric:
+            add(pool.project, pool.region, disk_metric, pool.disk_size_gb * pool.nodes)
+
+    for nat in footprint.nats:
+        add(nat.project, nat.region, NAT_IP_METRIC, nat_ips_needed(nat.vms))
+
+    usages = [
+        QuotaUsage(
+            project, region, metric, amount, quotas.get(project, {}).get(region, {}).get(metric)
+        )
+        for (project, region, metric), amount in sorted(demand.items())
+    ]
+
+    # Address space: fixed by the subnet ranges, not by the quota file
+    for subnet in footprint.subnets:
+        nodes = sum(
+            p.nodes
+            for p in footprint.node_pools
+            if (p.project, p.subnet) == (subnet.project, subnet.name)
+        )
+        node_ips = ipaddress.ip_network(subnet.cidr).num_addresses - SUBNET_RESERVED_IPS
+        usages.append(
+            QuotaUsage(subnet.project, subnet.region, NODE_IPS_METRIC, nodes, node_ips, subnet.name)
+        )
+        if subnet.pod_cidr:
+            usages.append(
+                QuotaUsage(
+                    subnet.project,
+                    subnet.region,
+                    POD_RANGE_METRIC,
+                    nodes,
+                    max_nodes_for_pod_range(subnet.pod_cidr),
+                    subnet.name,
+                )
+            )
+    return usages
+
+
+def load_quotas(path: Union[str, Path]) -> Quotas:
+    """
+    Load quota limits ({project: {region: {metric: limit}}}).
+
+    Raises:
+        ValueError: If the file does not have that shape
+    """
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    try:
+        return {
+            project: {
+                region: {metric: float(limit) for metric, limit in metrics.items()}
+                for region, metrics in regions.items()
+            }
+            for project, regions in data.items()
+        }
+    except (AttributeError, TypeError, ValueError) as e:
+        raise ValueError(f"{path}: expected {{project: {{region: {{metric: limit}}}}}}") from e
+
+
+# --- Output ---
+
+
+def format_quota_report(usages: list[QuotaUsage]) -> str:
+    """Render usages as a plain-text table grouped by project and region."""
+    labels = [f"{u.metric} ({u.scope})" if u.scope else u.metric for u in usages]
+    width = max([len("METRIC"), *map(len, labels)])
+    header = (
+        f"{'PROJECT':<20} {'REGION':<16} {'METRIC':<{width}} {'DEMAND':>9} {'LIMIT':>9} "
+        f"{'HEADROOM':>9}  STATUS"
+    )
+    lines = [header, "-" * len(header)]
+    rows = sorted(zip(usages, labels), key=lambda row: (row[0].project, row[0].region, row[1]))
+    for u, metric in rows:
+        limit = "-" if u.limit is None else f"{u.limit:g}"
+        headroom = "-" if u.headroom is None else f"{u.headroom:g}"
+        if u.exceeded:
+            status = "EXCEEDED"
+        elif u.low:
+            status = "LOW"
+        else:
+            status = "ok" if u.limit is not None else "no limit"
+        lines.append(
+            f"{u.project:<20} {u.region:<16} {metric:<{width}} {u.demand:>9g} {limit:>9} "
+            f"{headroom:>9}  {status}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point. Returns 1 if any limit is exceeded."""
+    parser = argparse.ArgumentParser(description="Offline quota and address-space estimator")
+    parser.add_argument("fleet", nargs="?", help="Fleet spec JSON (default: built-in profiles)")
+    parser.add_argument("--synth", help="Synthesized cdktf.out directory (instead of a fleet)")
+    parser.add_argument("--quotas", help="Quota limits JSON")
+    parser.add_argument("--json", action="store_true", help="Output JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    if args.synth and args.fleet:
+        parser.error("pass either a fleet spec or --synth")
+    if args.synth:
+        footprint = footprint_from_synth(args.synth)
+    else:
+        footprint = footprint_from_specs(load_fleet(args.fleet) if args.fleet else default_fleet())
+    usages = estimate(footprint, load_quotas(args.quotas) if args.quotas else None)
+
+    if args.json:
+        print(
+            json.dumps(
+                [{**asdict(u), "headroom": u.headroom, "exceeded": u.exceeded} for u in usages],
+                indent=2,
+            )
+        )
+    else:
+        print(format_quota_report(usages))
+
+    return 1 if any(u.exceeded for u in usages) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+Artifact Registry construct for pulling container images close to the cluster.
+
+Provides:
+- StandardRegistry: Regional Docker repository with node read access and an
+  optional Docker Hub pull-through cache
+"""
+
+import re
+from typing import Optional
+
+from cdktf_cdktf_provider_google.artifact_registry_repository import (
+    ArtifactRegistryRepository,
+    ArtifactRegistryRepositoryRemoteRepositoryConfig,
+    ArtifactRegistryRepositoryRemoteRepositoryConfigDockerRepository,
+)
+from cdktf_cdktf_provider_google.artifact_registry_repository_iam_member import (
+    ArtifactRegistryRepositoryIamMember,
+)
+from cdktf_cdktf_provider_google.data_google_compute_default_service_account import (
+    DataGoogleComputeDefaultServiceAccount,
+)
+from constructs import Construct
+
+REPOSITORY_ID_PATTERN = re.compile(r"^[a-z]([a-z0-9-]{0,61}[a-z0-9])?$")
+
+
+class StandardRegistry(Construct):
+    """
+    Regional Artifact Registry for container images.
+
+    Creates:
+    1. Docker repository in the platform region (same-region pulls, no NAT hops)
+    2. Reader IAM for the node service accounts
+    3. Optional remote repository caching Docker Hub ({repository_id}-dockerhub)
+
+    Images in Artifact Registry can be pulled with GKE image streaming
+    (ClusterConfig.image_streaming) so pods start before the image is fully downloaded.
+
+    Args:
+        scope: CDK scope
+        id: Construct ID
+        project_id: GCP project ID
+        region: Repository location (use the cluster region)
+        repository_id: Repository name (lowercase letters, digits, hyphens)
+        reader_service_accounts: Node service account emails granted read access
+                                 (default: Compute Engine default service account)
+        docker_hub_cache: Also create a Docker Hub pull-through cache repository
+        labels: Optional resource labels
+
+    Attributes:
+        repository: The Docker ArtifactRegistryRepository
+        cache_repository: The Docker Hub remote repository (None if disabled)
+        repository_url: Image prefix, e.g. europe-west1-docker.pkg.dev/my-project/myapp
+
+    Example:
+        registry = StandardRegistry(self, "registry",
+            project_id="my-project",
+            region="europe-west1",
+            repository_id="myapp",
+            docker_hub_cache=True
+        )
+        print(registry.repository_url)
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        project_id: str,
+        region: str,
+        repository_id: str,
+        reader_service_accounts: Optional[list[str]] = None,
+        docker_hub_cache: bool = False,
+        labels: Optional[dict[str, str]] = None,
+    ):
+        super().__init__(scope, id)
+
+        # Validation
+        if not project_id:
+            raise ValueError("project_id is required")
+        if not region:
+            raise ValueError("region is required")
+        if not repository_id or not REPOSITORY_ID_PATTERN.match(repository_id):
+            raise ValueError(
+                "repository_id must be 1-63 characters: lowercase letters, digits and hyphens, "
+                "starting with a letter"
+            )
+
+        self.project_id = project_id
+        self.region = region
+        self.repository_id = repository_id
+
+        # 1. Standard Docker repository in the platform region
+        self.repository = ArtifactRegistryRepository(
+            self,
+            "repository",
+            project=project_id,
+            location=region,
+            repository_id=repository_id,
+            format="DOCKER",
+            mode="STANDARD_REPOSITORY",
+            description=f"Container images for {repository_id}",
+            labels=labels,
+        )
+        repositories = [self.repository]
+
+        # 2. Optional Docker Hub pull-through cache
+        self.cache_repository: Optional[ArtifactRegistryRepository] = None
+        if docker_hub_cache:
+            self.cache_repository = ArtifactRegistryRepository(
+                self,
+                "dockerhub_cache",
+                project=project_id,
+                location=region,
+                repository_id=f"{repository_id}-dockerhub",
+                format="DOCKER",
+                mode="REMOTE_REPOSITORY",
+                description=f"Docker Hub cache for {repository_id}",
+                remote_repository_config=ArtifactRegistryRepositoryRemoteRepositoryConfig(
+                    docker_repository=ArtifactRegistryRepositoryRemoteRepositoryConfigDockerRepository(
+                        public_repository="DOCKER_HUB"
+                    )
+                ),
+                labels=labels,
+            )
+            repositories.append(self.cache_repository)
+
+        # 3. Grant node service accounts read access
+        if reader_service_accounts is None:
+            default_sa = DataGoogleComputeDefaultServiceAccount(
+                self, "default_sa", project=project_id
+            )
+            reader_service_accounts = [default_sa.email]
+
+        self._reader_bindings: list[ArtifactRegistryRepositoryIamMember] = []
+        for repo_idx, repo in enumerate(repositories):
+            for sa_idx, email in enumerate(reader_service_accounts):
+                binding = ArtifactRegistryRepositoryIamMember(
+                    self,
+                    f"reader_{repo_idx}_{sa_idx}",
+                    project=project_id,
+                    location=region,
+                    repository=repo.name,
+                    role="roles/artifactregistry.reader",
+                    member=f"serviceAccount:{email}",
+                )
+                self._reader_bindings.append(binding)
+
+    @property
+    def repository_url(self) -> str:
+        """Image prefix for the standard repository."""
+        return f"{self.region}-docker.pkg.dev/{self.project_id}/{self.repository_id}"
+
+    @property
+    def cache_repository_url(self) -> str:
+        """
+        Image prefix for the Docker Hub cache (e.g. {url}/library/nginx).
+
+        Raises:
+            ValueError: If docker_hub_cache was not enabled
+        """
+        if self.cache_repository is None:
+            raise ValueError("Docker Hub cache not configured. Pass docker_hub_cache=True.")
+        return f"{self.repository_url}-dockerhub"
@@ -0,0 +1,502 @@
+"""
+Offline right-sizing advisor from exported utilization data.
+
+Reads node or pod utilization time series exported from Cloud Monitoring
+(CSV or JSON), sums them per platform and timestamp into cluster demand,
+computes p50/p95/peak CPU and memory demand and recommends ClusterConfig
+overrides (machine_type, min_nodes, max_nodes, spot_instances) per platform:
+
+- machine shape from the memory/CPU ratio at p95 (highcpu, standard, highmem),
+  in the current machine family (e2 for shared-core types)
+- smallest size whose p95 node count fits the pod range (or --max-nodes)
+- min_nodes from p50 demand, max_nodes from p95 demand, both at the target
+  utilization; prod keeps at least 3 nodes and only uses spot VMs with
+  spot_fallback
+
+Input rows (one per node/pod and timestamp; extra columns are ignored):
+    platform,timestamp,cpu_cores,memory_gb
+    shop-prod,2024-05-01T00:00:00Z,1.25,3.5
+
+memory_bytes may be given instead of memory_gb. JSON input is a list of
+objects with the same keys (or {"samples": [...]}).
+
+With numpy installed (pip install "x-infra-kit[rightsizing]"), CSV exports are
+parsed and aggregated column-wise (load_utilization); without it, samples are
+streamed and summed row by row.
+
+Usage:
+    python -m infrastructure_lib.rightsizing usage.csv                  # built-in profiles
+    python -m infrastructure_lib.rightsizing usage.csv --fleet fleet.json
+    python -m infrastructure_lib.rightsizing usage.csv --fleet fleet.json --write-fleet sized.json
+"""
+
+import argparse
+import csv
+import json
+import math
+import sys
+import warnings
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .capacity import max_nodes_for_pod_range
+from .fleet import PlatformSpec, default_fleet, load_fleet
+from .machine_types import MACHINE_TYPES, MachineType, get_machine_type
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # optional: pip install "x-infra-kit[rightsizing]"
+    HAS_NUMPY = False
+
+GB = 1024**3
+# Fixed width of the platform and timestamp columns in read_columns()
+TEXT_WIDTH = 64
+DEFAULT_TARGET_UTILIZATION = 0.7
+PROD_MIN_NODES = 3
+# Memory GB per vCPU below/above which highcpu/highmem shapes fit better
+HIGHCPU_RATIO = 2.0
+HIGHMEM_RATIO = 6.0
+
+
+@dataclass
+class UtilizationSummary:
+    """Cluster demand percentiles of one platform (vCPUs and GB)."""
+
+    samples: int
+    cpu_p50: float
+    cpu_p95: float
+    cpu_peak: float
+    memory_p50: float
+    memory_p95: float
+    memory_peak: float
+
+
+@dataclass
+class Recommendation:
+    """Recommended ClusterConfig overrides for one platform."""
+
+    name: str
+    env: str
+    utilization: UtilizationSummary
+    current: dict[str, Any]
+    overrides: dict[str, Any]
+    warnings: list[str] = field(default_factory=list)
+
+    @property
+    def changed(self) -> dict[str, Any]:
+        """Overrides that differ from the current configuration."""
+        return {k: v for k, v in self.overrides.items() if self.current.get(k) != v}
+
+
+# --- Loading ---
+
+
+def read_samples(path: Union[str, Path]) -> Iterator[tuple[str, str, float, float]]:
+    """
+    Stream (platform, timestamp, cpu_cores, memory_gb) samples from a CSV or JSON export.
+
+    Raises:
+        ValueError: If a row is missing required columns or has invalid numbers
+    """
+    path = Path(path)
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.suffix.lower() == ".json":
+            data = json.load(f)
+            rows: Iterable[dict[str, Any]] = (
+                data.get("samples", []) if isinstance(data, dict) else data
+            )
+        else:
+            rows = _csv_rows(f)
+        for idx, row in enumerate(rows, start=1):
+            try:
+                memory = (
+                    float(row["memory_gb"])
+                    if row.get("memory_gb") not in (None, "")
+                    else float(row["memory_bytes"]) / GB
+                )
+                yield str(row["platform"]), str(row["timestamp"]), float(row["cpu_cores"]), memory
+            except (KeyError, TypeError, ValueError) as e:
+                raise ValueError(f"{path}: invalid sample #{idx}: {e!r}") from e
+
+
+def _csv_rows(f: Any) -> Iterator[dict[str, str]]:
+    """CSV rows as dicts of the usage columns only (cheaper than csv.DictReader)."""
+    reader = csv.reader(f)
+    header = next(reader, [])
+    columns = [
+        (name, header.index(name))
+        for name in ("platform", "timestamp", "cpu_cores", "memory_gb", "memory_bytes")
+        if name in header
+    ]
+    for row in reader:
+        yield {name: row[i] for name, i in columns if i < len(row)}
+
+
+def read_columns(path: Union[str, Path]) -> tuple[Any, Any, Any, Any]:
+    """
+    Load an export as numpy arrays (platform, timestamp, cpu_cores, memory_gb).
+
+    CSV columns are parsed by numpy's C reader. JSON exports, and CSV files it
+    cannot parse (empty or invalid cells, longer than TEXT_WIDTH names), are
+    read with read_samples(), which reports the offending row.
+
+    Raises:
+        ImportError: If numpy is not installed
+        ValueError: If a row is missing required columns or has invalid numbers
+    """
+    if not HAS_NUMPY:
+        raise ImportError('read_columns requires numpy: pip install "x-infra-kit[rightsizing]"')
+    path = Path(path)
+    if path.suffix.lower() != ".json":
+        with open(path, encoding="utf-8", newline="") as f:
+            header = next(csv.reader(f), [])
+        memory = "memory_gb" if "memory_gb" in header else "memory_bytes"
+        names = ("platform", "timestamp", "cpu_cores", memory)
+        try:
+            usecols = [header.index(name) for name in names]
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # header-only exports are just empty
+                data = np.loadtxt(
+                    path,
+                    delimiter=",",
+                    skiprows=1,
+                    usecols=usecols,
+                    dtype=[
+                        # Unicode so platform keys match read_samples() for any name
+                        ("platform", f"U{TEXT_WIDTH}"),
+                        ("timestamp", f"S{TEXT_WIDTH}"),
+                        ("cpu", "f8"),
+                        ("memory", "f8"),
+                    ],
+                    quotechar='"',
+                    comments=None,
+                    encoding="utf-8",
+                    ndmin=1,
+                )
+        except ValueError:
+            pass  # read_samples() below reports the row
+        else:
+            text_lengths = [np.char.str_len(data[key]) for key in ("platform", "timestamp")]
+            if not any((length >= TEXT_WIDTH).any() for length in text_lengths):
+                gb = data["memory"] if memory == "memory_gb" else data["memory"] / GB
+                return data["platform"], data["timestamp"], data["cpu"], gb
+
+    samples = list(read_samples(path))
+    return (
+        np.array([s[0] for s in samples], dtype=str),
+        np.array([s[1] for s in samples], dtype=str),
+        np.array([s[2] for s in samples], dtype=float),
+        np.array([s[3] for s in samples], dtype=float),
+    )
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0-100) of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def aggregate_utilization(
+    samples: Iterable[tuple[str, str, float, float]],
+) -> dict[str, UtilizationSummary]:
+    """
+    Sum samples per platform and timestamp, then compute demand percentiles.
+
+    Single pass over the samples: per-node/pod rows are added into one
+    (cpu, memory) total per platform and timestamp, so memory grows with the
+    number of timestamps, not rows.
+    """
+    totals: dict[str, dict[str, list[float]]] = {}
+    for platform, timestamp, cpu, memory in samples:
+        by_time = totals.setdefault(platform, {})
+        total = by_time.get(timestamp)
+        if total is None:
+            by_time[timestamp] = [cpu, memory]
+        else:
+            total[0] += cpu
+            total[1] += memory
+
+    return {
+        platform: _summarize(
+            sorted(t[0] for t in by_time.values()), sorted(t[1] for t in by_time.values())
+        )
+        for platform, by_time in totals.items()
+    }
+
+
+def _summarize(cpu_demand: list[float], memory_demand: list[float]) -> UtilizationSummary:
+    """Summary of ascending per-timestamp demand."""
+    return UtilizationSummary(
+        samples=len(cpu_demand),
+        cpu_p50=percentile(cpu_demand, 50),
+        cpu_p95=percentile(cpu_demand, 95),
+        cpu_peak=cpu_demand[-1],
+        memory_p50=percentile(memory_demand, 50),
+        memory_p95=percentile(memory_demand, 95),
+        memory_peak=memory_demand[-1],
+    )
+
+
+def _factorize(values: Any) -> tuple[list[Any], Any]:
+    """Distinct values (first-seen order) and the code of every element."""
+    # Exports are grouped by time series or timestamp: look up runs, not rows
+    starts = np.flatnonzero(np.concatenate(([True], values[1:] != values[:-1])))
+    index: dict[Any, int] = {}
+    run_codes = np.fromiter(
+        (index.setdefault(v, len(index)) for v in values[starts].tolist()),
+        dtype=np.int64,
+        count=len(starts),
+    )
+    return list(index), np.repeat(run_codes, np.diff(np.append(starts, len(values))))
+
+
+def aggregate_columns(
+    platforms: Any, timestamps: Any, cpu: Any, memory: Any
+) -> dict[str, UtilizationSummary]:
+    """
+    Vectorized aggregate_utilization() over numpy arrays (see read_columns()).
+
+    Rows are grouped by integer (platform, timestamp) codes and summed with
+    np.bincount; the summaries are identical to the row-by-row path.
+    """
+    if not len(platforms):
+        return {}
+    names, platform_codes = _factorize(platforms)
+    times, time_codes = _factorize(timestamps)
+    keys, group = np.unique(platform_codes * len(times) + time_codes, return_inverse=True)
+    cpu_totals = np.bincount(group, weights=cpu)
+    memory_totals = np.bincount(group, weights=memory)
+    key_platforms = keys // len(times)
+
+    summaries = {}
+    for code, name in enumerate(names):
+        in_platform = key_platforms == code
+        summaries[name.decode("utf-8") if isinstance(name, bytes) else name] = _summarize(
+            np.sort(cpu_totals[in_platform]).tolist(),
+            np.sort(memory_totals[in_platform]).tolist(),
+        )
+    return summaries
+
+
+def load_utilization(path: Union[str, Path]) -> dict[str, UtilizationSummary]:
+    """Demand summaries of an export, vectorized when numpy is installed."""
+    if HAS_NUMPY:
+        return aggregate_columns(*read_columns(path))
+    return aggregate_utilization(read_samples(path))
+
+
+# --- Recommendation ---
+
+
+def nodes_needed(machine: MachineType, cpu: float, memory: float, target: float) -> int:
+    """Nodes of a machine type that serve the demand at the target utilization."""
+    return max(
+        math.ceil(cpu / (machine.vcpus * target)),
+        math.ceil(memory / (machine.memory_gb * target)),
+        1,
+    )
+
+
+def candidate_machine_types(family: str, cpu: float, memory: float) -> list[MachineType]:
+    """Dedicated-core machine types of the family in the shape matching the demand, by size."""
+    ratio = memory / cpu if cpu > 0 else HIGHMEM_RATIO
+    if ratio < HIGHCPU_RATIO:
+        shape = "highcpu"
+    elif ratio > HIGHMEM_RATIO:
+        shape = "highmem"
+    else:
+        shape = "standard"
+
+    def matching(shape: str) -> list[MachineType]:
+        return sorted(
+            (
+                m
+                for m in MACHINE_TYPES.values()
+                if m.family == family and not m.shared_core and f"-{shape}-" in m.name
+            ),
+            key=lambda m: m.vcpus,
+        )
+
+    return matching(shape) or matching("standard")
+
+
+def recommend(
+    spec: PlatformSpec,
+    utilization: UtilizationSummary,
+    target_utilization: float = DEFAULT_TARGET_UTILIZATION,
+    max_nodes_limit: Optional[int] = None,
+) -> Recommendation:
+    """
+    Recommend cluster overrides for a platform from its utilization.
+
+    The overrides apply to the cluster of every platform region, so each
+    regional cluster is sized for the platform demand (a region can take over
+    the full load) and the node limit is the smallest regional pod range.
+
+    Args:
+        spec: Platform the utilization was measured on
+        utilization: Demand percentiles from aggregate_utilization()
+        target_utilization: Fraction of node capacity to plan for (0.0-1.0]
+        max_nodes_limit: Largest acceptable max_nodes (default: pod range capacity)
+
+    Raises:
+        ValueError: If target_utilization is out of range
+    """
+    if not 0.0 < target_utilization <= 1.0:
+        raise ValueError(f"target_utilization ({target_utilization}) must be in (0.0, 1.0]")
+
+    configs = spec.get_cluster_configs()
+    config = configs[spec.region]
+    current = {
+        "machine_type": config.machine_type,
+        "min_nodes": config.min_nodes,
+        "max_nodes": config.max_nodes,
+        "spot_instances": config.spot_instances,
+    }
+    recommendation = Recommendation(spec.name, spec.env, utilization, current, dict(current))
+    if any(c.autopilot for c in configs.values()):
+        recommendation.warnings.append("autopilot cluster: GKE sizes nodes per pod")
+        return recommendation
+
+    limit = max_nodes_limit or min(
+        max_nodes_for_pod_range(s.pod_cidr)
+        for s in spec.get_network_config().subnets
+        if s.region in configs
+    )
+    machine = get_machine_type(config.machine_type)
+    family = "e2" if machine is None or machine.shared_core else machine.family
+    candidates = candidate_machine_types(family, utilization.cpu_p95, utilization.memory_p95)
+
+    def p95_nodes(m: MachineType) -> int:
+        return nodes_needed(m, utilization.cpu_p95, utilization.memory_p95, target_utilization)
+
+    chosen = next((m for m in candidates if p95_nodes(m) <= limit), candidates[-1])
+    max_nodes = p95_nodes(chosen)
+    if max_nodes > limit:
+        recommendation.warnings.append(
+            f"p95 demand needs {max_nodes} x {chosen.name}, above the limit of {limit} nodes"
+        )
+
+    floor = PROD_MIN_NODES if spec.env == "prod" else 1
+    min_nodes = max(
+        nodes_needed(chosen, utilization.cpu_p50, utilization.memory_p50, target_utilization),
+        floor,
+    )
+    recommendation.overrides = {
+        "machine_type": chosen.name,
+        "min_nodes": min_nodes,
+        "max_nodes": max(max_nodes, min_nodes),
+        # Spot VMs can be reclaimed at any time: only outside prod or with
+        # an on-demand fallback pool
+        "spot_instances": spec.env != "prod" or all(c.spot_fallback for c in configs.values()),
+    }
+    return recommendation
+
+
+def advise(
+    specs: list[PlatformSpec],
+    summaries: dict[str, UtilizationSummary],
+    target_utilization: float = DEFAULT_TARGET_UTILIZATION,
+    max_nodes_limit: Optional[int] = None,
+) -> list[Recommendation]:
+    """Recommend overrides for every platform of the fleet that has utilization data."""
+    return [
+        recommend(spec, summaries[spec.name], target_utilization, max_nodes_limit)
+        for spec in specs
+        if spec.name in summaries
+    ]
+
+
+def apply_recommendations(
+    specs: list[PlatformSpec], recommendations: list[Recommendation]
+) -> list[PlatformSpec]:
+    """Fleet specs with the recommended overrides merged into cluster_overrides."""
+    by_name = {r.name: r for r in recommendations}
+    return [
+        PlatformSpec(
+            project_id=spec.project_id,
+            region=spec.region,
+            env=spec.env,
+            prefix=spec.prefix,
+            cluster_overrides={
+                **spec.cluster_overrides,
+                **(by_name[spec.name].changed if spec.name in by_name else {}),
+            },
+            additional_regions=list(spec.additional_regions),
+        )
+        for spec in specs
+    ]
+
+
+# --- Output ---
+
+
+def format_recommendations(recommendations: list[Recommendation]) -> str:
+    """Render recommendations as a plain-text table followed by warnings."""
+    header = (
+        f"{'PLATFORM':<24} {'CPU p50/p95':>13} {'MEM p50/p95':>13} "
+        f"{'CURRENT':<24} {'RECOMMENDED':<24}"
+    )
+    lines = [header, "-" * len(header)]
+
+    def describe(values: dict[str, Any]) -> str:
+        spot = " spot" if values["spot_instances"] else ""
+        return f"{values['machine_type']} {values['min_nodes']}-{values['max_nodes']}{spot}"
+
+    for r in recommendations:
+        u = r.utilization
+        lines.append(
+            f"{r.name:<24} {f'{u.cpu_p50:.1f}/{u.cpu_p95:.1f}':>13} "
+            f"{f'{u.memory_p50:.1f}/{u.memory_p95:.1f}':>13} "
+            f"{describe(r.current):<24} {describe(r.overrides):<24}"
+        )
+    for r in recommendations:
+        for message in r.warnings:
+            lines.append(f"WARNING {r.name}: {message}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Right-size clusters from utilization exports")
+    parser.add_argument("samples", help="Utilization export (CSV or JSON)")
+    parser.add_argument("--fleet", help="Fleet spec JSON (default: built-in profiles)")
+    parser.add_argument(
+        "--target-utilization",
+        type=float,
+        default=DEFAULT_TARGET_UTILIZATION,
+        help="Fraction of node capacity to plan for (default: 0.7)",
+    )
+    parser.add_argument("--max-nodes", type=int, help="Largest acceptable max_nodes")
+    parser.add_argument("--write-fleet", help="Write the fleet spec with recommended overrides")
+    parser.add_argument("--json", action="store_true", help="Output JSON instead of a table")
+    args = parser.parse_args(argv)
+
+    specs = load_fleet(args.fleet) if args.fleet else default_fleet()
+    summaries = load_utilization(args.samples)
+    recommendations = advise(specs, summaries, args.target_utilization, args.max_nodes)
+
+    unknown = sorted(set(summaries) - {spec.name for spec in specs})
+    if unknown:
+        print(f"Ignoring samples of unknown platforms: {', '.join(unknown)}", file=sys.stderr)
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in recommendations], indent=2))
+    else:
+        print(format_recommendations(recommendations))
+
+    if args.write_fleet:
+        sized = apply_recommendations(specs, recommendations)
+        with open(args.write_fleet, "w", encoding="utf-8") as f:
+            json.dump({"platforms": [asdict(spec) for spec in sized]}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+API enablement construct.
+
+Provides:
+- StandardServices: Enables the Google APIs required by the x-infra-kit
+  constructs in a scope, and makes their resources wait for enablement
+"""
+
+from typing import Any, Optional, Union
+
+import jsii
+from cdktf import IResolvable, IResolveContext, TerraformDataSource, TerraformResource, Token
+from cdktf_cdktf_provider_google.project_service import ProjectService
+from constructs import Construct, IConstruct
+
+from .cache import StandardCache
+from .database import StandardDatabase
+from .gke import StandardCluster
+from .ingress import StandardIngress
+from .networking import StandardVPC
+from .registry import StandardRegistry
+from .security import StandardIdentity, StandardSecrets
+
+# APIs used by the resources of each construct
+CONSTRUCT_SERVICES: dict[type, tuple[str, ...]] = {
+    StandardVPC: ("compute.googleapis.com",),
+    StandardCluster: ("compute.googleapis.com", "container.googleapis.com"),
+    StandardSecrets: ("secretmanager.googleapis.com",),
+    StandardIdentity: ("iam.googleapis.com",),
+    StandardRegistry: ("artifactregistry.googleapis.com", "compute.googleapis.com"),
+    StandardIngress: ("compute.googleapis.com",),
+    StandardCache: ("redis.googleapis.com",),
+    StandardDatabase: ("sqladmin.googleapis.com",),
+}
+PRIVATE_SERVICES_ACCESS_SERVICE = "servicenetworking.googleapis.com"
+PSC_DNS_SERVICE = "dns.googleapis.com"
+USAGE_METERING_SERVICE = "bigquery.googleapis.com"
+
+DependentNode = Union[TerraformResource, TerraformDataSource]
+
+
+@jsii.implements(IResolvable)
+class _Dependency:
+    """
+    depends_on entry for a resource, resolved from its fqn.
+
+    A bare fqn token renders as "${type.name}", which Terraform rejects in
+    depends_on; like the depends_on constructor argument, braces are suppressed.
+    """
+
+    def __init__(self, resource: TerraformResource):
+        self.resource = resource
+
+    @property
+    def creation_stack(self) -> list[str]:
+        return []
+
+    def resolve(self, context: IResolveContext) -> Any:
+        context.suppress_braces = True
+        return self.resource.fqn
+
+    def to_string(self) -> str:
+        return Token.as_string(self)
+
+
+def required_services(construct: IConstruct) -> set[str]:
+    """APIs required by a single x-infra-kit construct (empty for other constructs)."""
+    services = {
+        service
+        for construct_type, names in CONSTRUCT_SERVICES.items()
+        if isinstance(construct, construct_type)
+        for service in names
+    }
+    if isinstance(construct, StandardVPC) and construct.has_private_services_access:
+        services.add(PRIVATE_SERVICES_ACCESS_SERVICE)
+    if isinstance(construct, StandardVPC) and construct.has_psc_google_apis:
+        services.add(PSC_DNS_SERVICE)
+    if isinstance(construct, StandardCluster) and construct.has_usage_metering:
+        services.add(USAGE_METERING_SERVICE)
+    return services
+
+
+class StandardServices(Construct):
+    """
+    Enables the Google APIs used by the x-infra-kit constructs in a scope.
+
+    Create it after the other constructs: it scans the scope, enables exactly
+    the APIs those constructs need (one google_project_service each, without
+    dependencies between them, so they are enabled in parallel) and adds each
+    API to the depends_on of the resources that use it. APIs are left enabled
+    on destroy.
+
+    Args:
+        scope: CDK scope
+        id: Construct ID
+        project_id: GCP project ID
+        target: Scope to scan for constructs (default: scope)
+        extra_services: Additional APIs to enable (no resources depend on them)
+
+    Attributes:
+        services: Dict of API name to ProjectService
+        service_names: Sorted list of enabled APIs
+
+    Example:
+        vpc = StandardVPC(self, "vpc", config=profile.get_network_config())
+        cluster = StandardCluster(self, "gke", config=..., network_id=..., subnet_id=...)
+        StandardServices(self, "services", project_id="my-project")
+        # enables compute + container, VPC/cluster resources wait for them
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        project_id: str,
+        target: Optional[IConstruct] = None,
+        extra_services: Optional[list[str]] = None,
+    ):
+        super().__init__(scope, id)
+
+        if not project_id:
+            raise ValueError("project_id is required")
+
+        # 1. Collect APIs per resource from the constructs that own them
+        dependencies: dict[DependentNode, set[str]] = {}
+        for construct in (target or scope).node.find_all():
+            services = required_services(construct)
+            if not services:
+                continue
+            for node in construct.node.find_all():
+                if isinstance(node, (TerraformResource, TerraformDataSource)):
+                    dependencies.setdefault(node, set()).update(services)
+
+        service_names = set(extra_services or [])
+        for services in dependencies.values():
+            service_names |= services
+        self.service_names = sorted(service_names)
+
+        # 2. Enable every API (independent resources, applied in parallel)
+        self.services: dict[str, ProjectService] = {
+            name: ProjectService(
+                self,
+                name.split(".", 1)[0],
+                project=project_id,
+                service=name,
+                disable_on_destroy=False,
+                disable_dependent_services=False,
+            )
+            for name in self.service_names
+        }
+
+        # 3. Resources wait for the APIs they use
+        for node, services in dependencies.items():
+            node.depends_on = (node.depends_on or []) + [
+                Token.as_string(_Dependency(self.services[s])) for s in sorted(services)
+            ]
@@ -0,0 +1,362 @@
+"""
+Structural diff of synthesized CDKTF output.
+
+Compares two synthesized outputs of the same stacks (e.g. before/after a
+library upgrade) without running terraform. Construct metadata ("//" blocks)
+is stripped, resources are matched by address and every change is classified
+as create, delete, in-place update or replace using a built-in table of
+ForceNew attributes of the resources created by x-infra-kit.
+
+Usage:
+    python -m infrastructure_lib.synth_diff old/cdktf.out new/cdktf.out
+    python -m infrastructure_lib.synth_diff old/cdk.tf.json new/cdk.tf.json --json
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Optional, Union
+
+METADATA_KEY = "//"
+
+# Attributes whose change forces the resource to be destroyed and re-created.
+# A nested path (e.g. "node_config.machine_type") covers everything below it.
+FORCE_NEW_ATTRIBUTES: dict[str, frozenset[str]] = {
+    "google_compute_network": frozenset(
+        {"name", "project", "auto_create_subnetworks", "description"}
+    ),
+    "google_compute_subnetwork": frozenset(
+        {"name", "project", "region", "network", "ip_cidr_range", "purpose"}
+    ),
+    "google_compute_router": frozenset({"name", "project", "region", "network"}),
+    "google_compute_router_nat": frozenset({"name", "project", "region", "router"}),
+    "google_container_cluster": frozenset(
+        {
+            "name",
+            "project",
+            "location",
+            "network",
+            "initial_node_count",
+            "node_config",
+            "ip_allocation_policy",
+            "networking_mode",
+            "enable_autopilot",
+            "private_cluster_config.enable_private_endpoint",
+            "private_cluster_config.master_ipv4_cidr_block",
+        }
+    ),
+    "google_container_node_pool": frozenset(
+        {
+            "name",
+            "project",
+            "location",
+            "cluster",
+            "initial_node_count",
+            "network_config",
+            "node_config.machine_type",
+            "node_config.disk_size_gb",
+            "node_config.disk_type",
+            "node_config.spot",
+            "node_config.preemptible",
+            "node_config.oauth_scopes",
+            "node_config.service_account",
+        }
+    ),
+    "google_compute_global_address": frozenset(
+        {"name", "project", "address", "address_type", "prefix_length", "purpose", "network"}
+    ),
+    "google_service_networking_connection": frozenset({"network", "service"}),
+    "google_redis_instance": frozenset(
+        {
+            "name",
+            "project",
+            "region",
+            "location_id",
+            "alternative_location_id",
+            "tier",
+            "connect_mode",
+            "authorized_network",
+            "reserved_ip_range",
+        }
+    ),
+    "google_sql_database_instance": frozenset(
+        {
+            "name",
+            "project",
+            "region",
+            "database_version",
+            "master_instance_name",
+            "settings.ip_configuration.allocated_ip_range",
+        }
+    ),
+    "google_sql_database": frozenset({"name", "project", "instance", "charset", "collation"}),
+    "google_sql_user": frozenset({"name", "project", "instance", "host", "type"}),
+    "google_project_service": frozenset({"project", "service"}),
+    "google_secret_manager_secret": frozenset({"secret_id", "project", "replication"}),
+    "google_service_account": frozenset({"account_id", "project"}),
+    "google_project_iam_member": frozenset({"project", "role", "member", "condition"}),
+    "google_service_account_iam_binding": frozenset({"service_account_id", "role", "condition"}),
+    "google_secret_manager_secret_version": frozenset({"secret", "secret_data"}),
+    "google_artifact_registry_repository": frozenset(
+        {"repository_id", "project", "location", "format", "mode", "kms_key_name"}
+    ),
+    "google_artifact_registry_repository_iam_member": frozenset(
+        {"repository", "project", "location", "role", "member", "condition"}
+    ),
+    "google_bigquery_dataset": frozenset({"dataset_id", "project", "location"}),
+    "google_compute_firewall": frozenset({"name", "project", "network"}),
+    "google_compute_health_check": frozenset({"name", "project"}),
+    "google_compute_backend_service": frozenset({"name", "project", "load_balancing_scheme"}),
+    "google_compute_url_map": frozenset({"name", "project"}),
+    "google_compute_target_http_proxy": frozenset({"name", "project"}),
+    "google_compute_target_https_proxy": frozenset({"name", "project"}),
+    "google_compute_managed_ssl_certificate": frozenset(
+        {"name", "project", "type", "managed", "description"}
+    ),
+    "google_compute_global_forwarding_rule": frozenset(
+        {
+            "name",
+            "project",
+            "ip_address",
+            "ip_protocol",
+            "port_range",
+            "load_balancing_scheme",
+            "network",
+        }
+    ),
+    "google_compute_forwarding_rule": frozenset(
+        {
+            "name",
+            "project",
+            "region",
+            "network",
+            "subnetwork",
+            "ip_address",
+            "ip_protocol",
+            "ports",
+            "port_range",
+            "load_balancing_scheme",
+        }
+    ),
+    "google_compute_network_endpoint_group": frozenset(
+        {"name", "project", "zone", "network", "subnetwork", "network_endpoint_type"}
+    ),
+    "google_compute_region_network_endpoint_group": frozenset(
+        {"name", "project", "region", "network", "subnetwork", "network_endpoint_type"}
+    ),
+    "google_dns_managed_zone": frozenset({"name", "project", "dns_name", "visibility"}),
+    "google_dns_record_set": frozenset({"name", "project", "managed_zone", "type"}),
+    # Every argument of random_password is ForceNew
+    "random_password": frozenset(
+        {
+            "length",
+            "special",
+            "upper",
+            "lower",
+            "numeric",
+            "min_special",
+            "min_upper",
+            "min_lower",
+            "min_numeric",
+            "override_special",
+            "keepers",
+        }
+    ),
+}
+
+# Meta-arguments that only affect ordering and never change the resource itself
+NO_OP_ATTRIBUTES = frozenset({"depends_on"})
+
+# Change actions, ordered from least to most disruptive
+CREATE = "create"
+DELETE = "delete"
+UPDATE = "update"
+REPLACE = "replace"
+
+
+@dataclass
+class ResourceChange:
+    """A single resource change between two synthesized outputs."""
+
+    stack: str
+    address: str
+    action: str
+    attributes: list[str] = field(default_factory=list)
+    force_new_attributes: list[str] = field(default_factory=list)
+
+    @property
+    def resource_type(self) -> str:
+        """Terraform resource type (e.g. google_container_node_pool)."""
+        return self.address.split(".", 1)[0]
+
+
+def strip_metadata(value: Any) -> Any:
+    """Recursively drop "//" construct metadata blocks."""
+    if isinstance(value, dict):
+        return {k: strip_metadata(v) for k, v in value.items() if k != METADATA_KEY}
+    if isinstance(value, list):
+        return [strip_metadata(v) for v in value]
+    return value
+
+
+def load_stacks(path: Union[str, Path]) -> dict[str, dict]:
+    """
+    Load synthesized stacks from a cdk.tf.json file or a cdktf.out directory.
+
+    Returns:
+        Mapping of stack name to its synthesized JSON
+    """
+    path = Path(path)
+    if path.is_file():
+        return {path.parent.name: _read_json(path)}
+
+    stacks_dir = path / "stacks" if (path / "stacks").is_dir() else path
+    stacks = {p.parent.name: _read_json(p) for p in sorted(stacks_dir.glob("*/cdk.tf.json"))}
+    if not stacks:
+        raise ValueError(f"No synthesized stacks found in {path}")
+    return stacks
+
+
+def _read_json(path: Path) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _resources(synth: dict) -> dict[str, dict]:
+    """Flatten the resource block into {type.name: attributes}."""
+    resources = {}
+    for resource_type, by_name in synth.get("resource", {}).items():
+        for name, attrs in by_name.items():
+            resources[f"{resource_type}.{name}"] = strip_metadata(attrs)
+    return resources
+
+
+def changed_paths(old: Any, new: Any, prefix: str = "") -> list[str]:
+    """
+    Dotted attribute paths that differ between two values.
+
+    List indices are not part of the path, so a change in any element of
+    secondary_ip_range is reported as "secondary_ip_range".
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        paths: list[str] = []
+        for key in sorted(set(old) | set(new)):
+            child = f"{prefix}.{key}" if prefix else key
+            if key not in old or key not in new:
+                paths.append(child)
+            else:
+                paths.extend(changed_paths(old[key], new[key], child))
+        return paths
+
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        paths = []
+        for old_item, new_item in zip(old, new):
+            for p in changed_paths(old_item, new_item, prefix):
+                if p not in paths:
+                    paths.append(p)
+        return paths
+
+    return [] if old == new else [prefix]
+
+
+def _is_force_new(resource_type: str, path: str) -> bool:
+    for attr in FORCE_NEW_ATTRIBUTES.get(resource_type, ()):
+        if path == attr or path.startswith(f"{attr}.") or attr.startswith(f"{path}."):
+            return True
+    return False
+
+
+def diff_stack(stack: str, old: dict, new: dict) -> list[ResourceChange]:
+    """Classify every resource change between two synthesized stacks."""
+    old_resources = _resources(old)
+    new_resources = _resources(new)
+    changes = []
+
+    for address in sorted(set(old_resources) | set(new_resources)):
+        if address not in old_resources:
+            changes.append(ResourceChange(stack, address, CREATE))
+            continue
+        if address not in new_resources:
+            changes.append(ResourceChange(stack, address, DELETE))
+            continue
+
+        paths = [
+            p
+            for p in changed_paths(old_resources[address], new_resources[address])
+            if p.split(".", 1)[0] not in NO_OP_ATTRIBUTES
+        ]
+        if not paths:
+            continue
+
+        resource_type = address.split(".", 1)[0]
+        force_new = [p for p in paths if _is_force_new(resource_type, p)]
+        changes.append(
+            ResourceChange(
+                stack,
+                address,
+                REPLACE if force_new else UPDATE,
+                attributes=paths,
+                force_new_attributes=force_new,
+            )
+        )
+    return changes
+
+
+def diff_synth(old: dict[str, dict], new: dict[str, dict]) -> list[ResourceChange]:
+    """Diff two sets of synthesized stacks (as returned by load_stacks)."""
+    changes = []
+    for stack in sorted(set(old) | set(new)):
+        changes.extend(diff_stack(stack, old.get(stack, {}), new.get(stack, {})))
+    return changes
+
+
+def format_changes(changes: list[ResourceChange]) -> str:
+    """Render changes like a condensed terraform plan."""
+    if not changes:
+        return "No changes."
+
+    symbols = {CREATE: "+", DELETE: "-", UPDATE: "~", REPLACE: "-/+"}
+    lines = []
+    for c in changes:
+        line = f"{symbols[c.action]:>3} {c.stack}: {c.address}"
+        if c.force_new_attributes:
+            line += f" (forces replacement: {', '.join(c.force_new_attributes)})"
+        elif c.attributes:
+            line += f" ({', '.join(c.attributes)})"
+        lines.append(line)
+
+    counts = {action: sum(1 for c in changes if c.action == action) for action in symbols}
+    lines.append(
+        f"\n{counts[CREATE]} to add, {counts[UPDATE]} to change in-place, "
+        f"{counts[REPLACE]} to replace, {counts[DELETE]} to destroy."
+    )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Structural diff of synthesized CDKTF output")
+    parser.add_argument("old", help="Old cdktf.out directory or cdk.tf.json")
+    parser.add_argument("new", help="New cdktf.out directory or cdk.tf.json")
+    parser.add_argument("--json", action="store_true", help="Output JSON instead of text")
+    parser.add_argument(
+        "--detailed-exitcode",
+        action="store_true",
+        help="Exit 2 when there are changes (like terraform plan)",
+    )
+    args = parser.parse_args(argv)
+
+    changes = diff_synth(load_stacks(args.old), load_stacks(args.new))
+
+    if args.json:
+        print(json.dumps([asdict(c) for c in changes], indent=2))
+    else:
+        print(format_changes(changes))
+
+    return 2 if args.detailed_exitcode and changes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+"""
+Persistent synth server with watch mode.
+
+A cold `cdktf synth` starts Python, imports the provider bindings and launches
+the jsii Node kernel before any construct is created. The synth server pays
+that once: it stays running, polls the watched files and re-synthesizes on
+change, printing the latency of every run.
+
+Two inputs are supported:
+- Fleet spec (--fleet): one stack per platform; only stacks whose spec changed
+  are re-synthesized, removed platforms are deleted from the output.
+- App file (--app, e.g. main.py): executed in-process on change; the app
+  writes its own output (--outdir must match the app's outdir) and stacks
+  whose output did not change are reported as unchanged.
+
+Changes to infrastructure_lib itself reload the library and re-synthesize
+everything (provider bindings stay loaded).
+
+Usage:
+    python -m infrastructure_lib.synth_server --fleet fleet.json
+    python -m infrastructure_lib.synth_server --app main.py
+    python -m infrastructure_lib.synth_server --fleet fleet.json --once
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import runpy
+import shutil
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional, Union
+
+from cdktf import App, TerraformStack
+
+PACKAGE = __package__ or "infrastructure_lib"
+LIBRARY_DIR = Path(__file__).parent
+MANIFEST = "manifest.json"
+
+
+@dataclass
+class SynthRun:
+    """Result of one synth run."""
+
+    synthesized: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+    def summary(self, run: int) -> str:
+        """One-line run report."""
+        parts = [f"synth #{run}: {len(self.synthesized)} stack(s) in {self.seconds:.2f}s"]
+        if self.synthesized:
+            parts.append(f"({', '.join(self.synthesized)})")
+        if self.unchanged:
+            parts.append(f"{len(self.unchanged)} unchanged")
+        if self.removed:
+            parts.append(f"removed {', '.join(self.removed)}")
+        return " ".join(parts)
+
+
+class SynthServer:
+    """
+    Long-lived synthesizer for a fleet spec or a cdktf app file.
+
+    Args:
+        outdir: Output directory (cdktf.out layout: stacks/<name>/cdk.tf.json + manifest.json)
+        fleet: Fleet spec JSON (see infrastructure_lib.fleet)
+        app: Python app file that builds an App and calls app.synth() (instead of fleet)
+
+    Example:
+        server = SynthServer("cdktf.out", fleet="fleet.json")
+        print(server.run_once().summary(1))
+        server.serve()  # Ctrl+C to stop
+    """
+
+    def __init__(
+        self,
+        outdir: Union[str, Path] = "cdktf.out",
+        fleet: Optional[Union[str, Path]] = None,
+        app: Optional[Union[str, Path]] = None,
+    ):
+        if (fleet is None) == (app is None):
+            raise ValueError("Provide either a fleet spec or an app file")
+
+        self.outdir = Path(outdir)
+        self.fleet = Path(fleet) if fleet else None
+        self.app = Path(app) if app else None
+        self._fingerprints: dict[str, str] = {}
+        self._app_outputs: dict[str, str] = {}
+        self._mtimes: dict[Path, Optional[float]] = {}
+        self.poll()
+
+    # --- Watching ---
+
+    @property
+    def watched_files(self) -> list[Path]:
+        """Input files: fleet spec, app file and the library sources."""
+        files = [p for p in (self.fleet, self.app) if p is not None]
+        return files + sorted(LIBRARY_DIR.glob("*.py"))
+
+    def poll(self) -> list[Path]:
+        """Return watched files modified (or removed) since the last poll."""
+        changed = []
+        for path in self.watched_files:
+            mtime = path.stat().st_mtime if path.exists() else None
+            if self._mtimes.get(path, -1.0) != mtime:
+                changed.append(path)
+            self._mtimes[path] = mtime
+        return changed
+
+    # --- Synthesis ---
+
+    def run_once(self, changed: Optional[list[Path]] = None) -> SynthRun:
+        """
+        Synthesize what the changed files affect (everything on the first run).
+
+        Args:
+            changed: Files reported by poll(); None re-runs every input
+        """
+        start = time.perf_counter()
+        changed_set = set(changed) if changed is not None else None
+
+        if changed_set is not None and any(p.parent == LIBRARY_DIR for p in changed_set):
+            self._reload_library()
+            changed_set = None
+
+        run = SynthRun()
+        if self.fleet is not None:
+            if changed_set is None or self.fleet in changed_set:
+                self._synth_fleet(self.fleet, run)
+        elif self.app is not None and (changed_set is None or self.app in changed_set):
+            self._synth_app(self.app, run)
+
+        run.seconds = time.perf_counter() - start
+        return run
+
+    def _synth_fleet(self, fleet_path: Path, run: SynthRun) -> None:
+        """Re-synthesize fleet stacks whose spec changed."""
+        load_fleet = importlib.import_module(f"{PACKAGE}.fleet").load_fleet
+        fleet = load_fleet(fleet_path)
+        specs = {spec.name: spec for spec in fleet}
+        if len(specs) != len(fleet):
+            raise ValueError(f"{fleet_path}: platform names ({{prefix}}-{{env}}) must be unique")
+
+        fingerprints = {
+            name: hashlib.sha256(json.dumps(asdict(spec), sort_keys=True).encode()).hexdigest()
+            for name, spec in specs.items()
+        }
+        stale = [n for n in specs if self._fingerprints.get(n) != fingerprints[n]]
+        run.unchanged.extend(n for n in specs if n not in stale)
+
+        if stale:
+            platform_cls = importlib.import_module(f"{PACKAGE}.composites").StandardPlatform
+            provider_cls = importlib.import_module(f"{PACKAGE}.provider").StandardProvider
+            with tempfile.TemporaryDirectory() as staging:
+                app = App(outdir=staging)
+                for name in stale:
+                    spec = specs[name]
+                    stack = TerraformStack(app, name)
+                    provider_cls.for_profile(stack, "google", spec.profile)
+                    platform_cls(
+                        stack,
+                        "platform",
+                        project_id=spec.project_id,
+                        region=spec.region,
+                        env=spec.env,
+                        prefix=spec.prefix,
+                        additional_regions=spec.additional_regions,
+                        **spec.cluster_overrides,
+                    )
+                app.synth()
+                self._merge_output(Path(staging))
+            run.synthesized.extend(stale)
+
+        for name in sorted(set(self._fingerprints) - set(specs)):
+            self._remove_stack(name)
+            run.removed.append(name)
+        self._fingerprints = fingerprints
+
+    def _synth_app(self, app_path: Path, run: SynthRun) -> None:
+        """Execute the app file in-process and report which stacks changed."""
+        # The app picks its own outdir (the jsii kernel keeps the environment it started with)
+        runpy.run_path(str(app_path), run_name="__main__")
+
+        outputs = {
+            p.parent.name: hashlib.sha256(p.read_bytes()).hexdigest()
+            for p in self.outdir.glob("stacks/*/cdk.tf.json")
+        }
+        for name, digest in sorted(outputs.items()):
+            target = run.unchanged if self._app_outputs.get(name) == digest else run.synthesized
+            target.append(name)
+        run.removed.extend(sorted(set(self._app_outputs) - set(outputs)))
+        self._app_outputs = outputs
+
+    def _merge_output(self, staging: Path) -> None:
+        """Copy freshly synthesized stacks into outdir and merge the manifest."""
+        manifest = self._read_manifest()
+        staged = json.loads((staging / MANIFEST).read_text(encoding="utf-8"))
+
+        for name in staged.get("stacks", {}):
+            target = self.outdir / "stacks" / name
+            shutil.rmtree(target, ignore_errors=True)
+            shutil.copytree(staging / "stacks" / name, target)
+
+        manifest["version"] = staged.get("version", manifest.get("version"))
+        manifest.setdefault("stacks", {}).update(staged.get("stacks", {}))
+        self._write_manifest(manifest)
+
+    def _remove_stack(self, name: str) -> None:
+        shutil.rmtree(self.outdir / "stacks" / name, ignore_errors=True)
+        manifest = self._read_manifest()
+        manifest.get("stacks", {}).pop(name, None)
+        self._write_manifest(manifest)
+
+    def _read_manifest(self) -> dict:
+        path = self.outdir / MANIFEST
+        return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+
+    def _write_manifest(self, manifest: dict) -> None:
+        self.outdir.mkdir(parents=True, exist_ok=True)
+        (self.outdir / MANIFEST).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+
+    def _reload_library(self) -> None:
+        """Re-import infrastructure_lib so source edits take effect."""
+        for name in [m for m in sys.modules if m == PACKAGE or m.startswith(f"{PACKAGE}.")]:
+            del sys.modules[name]
+        importlib.import_module(PACKAGE)
+        self._fingerprints = {}
+
+    # --- Serving ---
+
+    def serve(self, interval: float = 0.5, max_runs: Optional[int] = None) -> None:
+        """
+        Synthesize, then poll and re-synthesize on every change until interrupted.
+
+        Args:
+            interval: Seconds between polls
+            max_runs: Stop after this many runs (None = run forever)
+        """
+        runs = 1
+        print(self.run_once().summary(runs), flush=True)
+        while max_runs is None or runs < max_runs:
+            time.sleep(interval)
+            changed = self.poll()
+            if not changed:
+                continue
+            runs += 1
+            try:
+                print(self.run_once(changed).summary(runs), flush=True)
+            except Exception as e:  # keep serving after a broken edit
+                print(f"synth #{runs} failed: {type(e).__name__}: {e}", file=sys.stderr)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Persistent CDKTF synth server with watch mode")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--fleet", help="Fleet spec JSON (one stack per platform)")
+    source.add_argument("--app", help="App file to execute, e.g. main.py")
+    parser.add_argument("--outdir", default="cdktf.out", help="Output directory")
+    parser.add_argument("--interval", type=float, default=0.5, help="Poll interval in seconds")
+    parser.add_argument("--once", action="store_true", help="Synthesize once and exit")
+    args = parser.parse_args(argv)
+
+    server = SynthServer(args.outdir, fleet=args.fleet, app=args.app)
+    if args.once:
+        print(server.run_once().summary(1))
+        return 0
+
+    try:
+        server.serve(interval=args.interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
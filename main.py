@@ -5,12 +5,15 @@ Example usage of x-infra-kit library.
 This file demonstrates how to use the infrastructure library in a real project.
 It can be used as a template for new projects.
 """
+import os
+
+from cdktf import App, GcsBackend, TerraformOutput, TerraformStack
 from constructs import Construct
-from cdktf import App, TerraformStack, TerraformOutput, GcsBackend
-from cdktf_cdktf_provider_google.provider import GoogleProvider
 
 # Option 1: Use StandardPlatform for quick setup
-from infrastructure_lib import StandardPlatform
+from infrastructure_lib import StandardPlatform, StandardProvider, get_profile
+from infrastructure_lib.compact import compact_output
+from infrastructure_lib.provider_lock import write_lock_files
 
 # Option 2: Use building blocks for more control
 # from infrastructure_lib import (
@@ -26,7 +29,6 @@ class DeliveryStack(TerraformStack):
         super().__init__(scope, id)
 
         # --- Load Configuration from Environment ---
-        import os
         from dotenv import load_dotenv
         load_dotenv()
 
@@ -34,11 +36,13 @@ class DeliveryStack(TerraformStack):
         region = os.getenv("GCP_REGION", "us-central1")
         env = os.getenv("ENV", "dev")
         prefix = os.getenv("PREFIX", "delivery")
+        # Optional: comma-separated regions served from the same VPC
+        additional_regions = [r for r in os.getenv("ADDITIONAL_REGIONS", "").split(",") if r]
         
         # --- Provider ---
-        GoogleProvider(self, "Google",
-            project=project_id,
-            region=region
+        # Request batching, tuned timeouts and the profile's common labels
+        StandardProvider.for_profile(self, "google",
+            get_profile(project_id, region, env, prefix)
         )
 
         # --- Remote Backend (Optional) ---
@@ -55,6 +59,7 @@ class DeliveryStack(TerraformStack):
             region=region,
             env=env,
             prefix=prefix,
+            additional_regions=additional_regions,
             # Optional: Secrets
             secret_ids=[
                 "postgres-password",
@@ -77,6 +82,9 @@ class DeliveryStack(TerraformStack):
         TerraformOutput(self, "cluster_endpoint", 
             value=platform.cluster.cluster.endpoint
         )
+        TerraformOutput(self, "cluster_endpoints",
+            value=platform.cluster_endpoints
+        )
         TerraformOutput(self, "vpc_name",
             value=platform.vpc.network.name
         )
@@ -105,3 +113,15 @@ class DeliveryStack(TerraformStack):
 app = App()
 DeliveryStack(app, "x-infra-kit")
 app.synth()
+
+# --- Optional: Compact Output ---
+# COMPACT_SYNTH=1 strips construct metadata and minifies cdk.tf.json,
+# COMPACT_SYNTH=gzip also writes cdk.tf.json.gz for artifact uploads
+if os.getenv("COMPACT_SYNTH"):
+    compact_output(app.outdir, gzip=os.getenv("COMPACT_SYNTH") == "gzip")
+
+# --- Optional: Provider Lock Files ---
+# PROVIDER_LOCK=1 writes a .terraform.lock.hcl per stack and cdktf.out/terraformrc with a
+# shared plugin cache; TF_PROVIDER_MIRROR adds checksums from (and installs from) a local mirror
+if os.getenv("PROVIDER_LOCK"):
+    write_lock_files(app.outdir, mirror=os.getenv("TF_PROVIDER_MIRROR"))
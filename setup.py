@@ -7,8 +7,10 @@ setup(
     install_requires=[
         "cdktf>=0.20.0",
         "cdktf-cdktf-provider-google>=13.0.0",
-        "constructs>=10.0.0"
+        "cdktf-cdktf-provider-random>=11.0.0",
+        "constructs>=10.0.0",
     ],
+    extras_require={"rightsizing": ["numpy>=1.23.0"]},
     description="Generic Infrastructure Library for Cross Platform",
     author="Platform Team",
 )
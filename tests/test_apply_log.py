@@ -0,0 +1,224 @@
+"""
+Tests for the apply-log analyzer and timing database.
+"""
+
+import json
+
+import pytest
+from infrastructure_lib.apply_log import (
+    ERRORED,
+    infer_profile,
+    load_runs,
+    main,
+    parse_apply_log,
+    parse_duration,
+    parse_text_log,
+    record_run,
+    resource_type_of,
+    slowest_resources,
+    timing_stats,
+)
+
+CLUSTER = "google_container_cluster.platform_cluster_platform-cluster_ABC123"
+NETWORK = "google_compute_network.platform_network_vpc_DEF456"
+
+
+def json_message(kind, address, action, timestamp, **hook):
+    """One `terraform apply -json` UI message."""
+    resource_type = address.split(".")[0]
+    return json.dumps(
+        {
+            "@level": "info",
+            "@timestamp": timestamp,
+            "type": kind,
+            "hook": {
+                "resource": {"addr": address, "resource_type": resource_type},
+                "action": action,
+                **hook,
+            },
+        }
+    )
+
+
+def json_log(cluster_seconds, day=1, network_seconds=20):
+    """An apply log creating a network and a cluster."""
+    return "\n".join(
+        [
+            json.dumps({"type": "version", "terraform": "1.9.0"}),
+            json_message("apply_start", NETWORK, "create", f"2026-01-0{day}T10:00:00.123456789Z"),
+            json_message(
+                "apply_complete",
+                NETWORK,
+                "create",
+                f"2026-01-0{day}T10:00:20Z",
+                elapsed_seconds=network_seconds,
+                id_value="projects/acme/global/networks/shop-prod-vpc",
+            ),
+            json_message("apply_start", CLUSTER, "create", f"2026-01-0{day}T10:00:21+00:00"),
+            json_message(
+                "apply_complete",
+                CLUSTER,
+                "create",
+                f"2026-01-0{day}T10:10:21+00:00",
+                elapsed_seconds=cluster_seconds,
+                id_value="projects/acme/locations/us-central1/clusters/shop-prod-cluster",
+            ),
+        ]
+    )
+
+
+TEXT_LOG = """\
+shop-dev  \x1b[0m\x1b[1mgoogle_compute_network.platform_network_vpc_DEF456 (platform/network/vpc): Creating...\x1b[0m
+shop-dev  google_compute_network.platform_network_vpc_DEF456 (platform/network/vpc): Creation complete after 21s [id=projects/acme/global/networks/shop-dev-vpc]
+shop-dev  google_container_cluster.platform_cluster_platform-cluster_ABC123 (platform/cluster/platform-cluster): Creating...
+shop-dev  google_container_cluster.platform_cluster_platform-cluster_ABC123 (platform/cluster/platform-cluster): Still creating... [10s elapsed]
+shop-dev  google_container_cluster.platform_cluster_platform-cluster_ABC123 (platform/cluster/platform-cluster): Creation complete after 7m32s [id=projects/acme/locations/us-central1/clusters/shop-dev-cluster]
+shop-dev  module.nat.google_compute_router_nat.nat[0]: Modifying... [id=shop-dev-nat]
+"""
+
+
+class TestParsing:
+    """Tests for parsing apply logs."""
+
+    def test_duration_and_type(self):
+        """Test Terraform durations and resource types from addresses."""
+        assert parse_duration("7m32s") == 452
+        assert parse_duration("1h2m") == 3720
+        assert parse_duration("4.5s") == 4.5
+        with pytest.raises(ValueError):
+            parse_duration("soon")
+        assert resource_type_of("module.nat.google_compute_router_nat.nat[0]") == (
+            "google_compute_router_nat"
+        )
+
+    def test_json_log(self, tmp_path):
+        """Test that JSON logs yield durations and UTC start/finish times."""
+        path = tmp_path / "shop-prod.jsonl"
+        path.write_text(json_log(600))
+        run = parse_apply_log(path)
+
+        assert run.stack == "shop-prod"
+        assert run.profile == "prod"
+        assert run.started_at == "2026-01-01T10:00:00.123456+00:00"
+        cluster = next(t for t in run.resources if t.address == CLUSTER)
+        assert cluster.resource_type == "google_container_cluster"
+        assert (cluster.status, cluster.seconds) == ("complete", 600)
+        assert cluster.finished_at == "2026-01-01T10:10:21+00:00"
+
+    def test_json_errored_and_unfinished(self, tmp_path):
+        """Test that errored and unfinished resources have no successful duration."""
+        path = tmp_path / "apply.jsonl"
+        path.write_text(
+            "\n".join(
+                [
+                    json_message("apply_start", CLUSTER, "create", "2026-01-01T10:00:00Z"),
+                    json_message("apply_errored", CLUSTER, "create", "2026-01-01T10:05:00Z"),
+                    json_message("apply_start", NETWORK, "delete", "2026-01-01T10:00:00Z"),
+                ]
+            )
+        )
+        timings = parse_apply_log(path, stack="x").resources
+
+        assert [(t.address, t.status) for t in timings] == [
+            (CLUSTER, ERRORED),
+            (NETWORK, ERRORED),
+        ]
+        assert timings[0].seconds == 300
+        assert timings[1].seconds is None
+
+    def test_malformed_json_log(self, tmp_path):
+        """Test that malformed JSON logs raise ValueError."""
+        path = tmp_path / "apply.jsonl"
+        path.write_text('{"type": "version"}\nnot json\n')
+        with pytest.raises(ValueError):
+            parse_apply_log(path)
+
+    def test_text_log(self):
+        """Test that cdktf deploy output is parsed despite prefixes and colors."""
+        timings, ids = parse_text_log(TEXT_LOG.splitlines())
+        by_address = {t.address: t for t in timings}
+
+        assert by_address[CLUSTER].seconds == 452
+        assert by_address[NETWORK].seconds == 21
+        nat = by_address["module.nat.google_compute_router_nat.nat[0]"]
+        assert (nat.action, nat.status, nat.seconds) == ("update", ERRORED, None)
+        assert infer_profile("stack", ids) == "dev"
+
+    def test_infer_profile(self):
+        """Test profile inference from stack names and resource IDs."""
+        assert infer_profile("shop-staging") == "staging"
+        assert infer_profile("production", ["projects/a/global/networks/x-prod-vpc"]) == "prod"
+        assert infer_profile("shop") == "unknown"
+
+
+class TestTimingDatabase:
+    """Tests for the timing database and statistics."""
+
+    def test_record_once(self, tmp_path):
+        """Test that the same log is only recorded once."""
+        db = tmp_path / "timings.jsonl"
+        log = tmp_path / "shop-prod.jsonl"
+        log.write_text(json_log(600))
+        run = parse_apply_log(log)
+
+        assert record_run(db, run)
+        assert not record_run(db, parse_apply_log(log))
+        assert load_runs(db) == [run]
+
+    def test_stats_and_trend(self, tmp_path):
+        """Test percentiles per type and profile and the latest-run trend."""
+        db = tmp_path / "timings.jsonl"
+        for day, seconds in ((1, 400), (2, 500), (3, 600)):
+            log = tmp_path / f"shop-prod-{day}.jsonl"
+            log.write_text(json_log(seconds, day=day))
+            record_run(db, parse_apply_log(log, stack="shop-prod"))
+        runs = load_runs(db)
+
+        stats = {s.resource_type: s for s in timing_stats(runs)}
+        cluster = stats["google_container_cluster"]
+        assert (cluster.profile, cluster.samples, cluster.runs) == ("prod", 3, 3)
+        assert (cluster.p50, cluster.max) == (500, 600)
+        # latest 600s against the earlier median (400, 500 -> 400)
+        assert cluster.trend_pct == 50
+        assert stats["google_compute_network"].trend_pct == 0
+
+        slowest = slowest_resources(runs, top=1)
+        assert [(s.address, s.samples, s.p50) for s in slowest] == [(CLUSTER, 3, 500)]
+
+    def test_invalid_database(self, tmp_path):
+        """Test that malformed database lines raise ValueError."""
+        db = tmp_path / "timings.jsonl"
+        db.write_text('{"run_id": "x"}\n')
+        with pytest.raises(ValueError):
+            load_runs(db)
+
+
+class TestCli:
+    """Tests for the command line."""
+
+    def test_record_and_report(self, tmp_path, capsys):
+        """Test that logs are recorded and reported as tables and JSON."""
+        db = tmp_path / "timings.jsonl"
+        log = tmp_path / "deploy.log"
+        log.write_text(TEXT_LOG)
+
+        assert main([str(log), "--db", str(db), "--stack", "shop-dev"]) == 0
+        out = capsys.readouterr().out
+        assert "7m32s" in out
+        assert "google_container_cluster" in out
+
+        assert main(["--db", str(db), "--json"]) == 0
+        report = json.loads(capsys.readouterr().out)
+        assert report["runs"] == 1
+        assert report["slowest"][0]["address"] == CLUSTER
+        assert report["by_type"][0]["profile"] == "dev"
+
+    def test_no_record(self, tmp_path, capsys):
+        """Test that --no-record leaves the database untouched."""
+        db = tmp_path / "timings.jsonl"
+        log = tmp_path / "deploy.log"
+        log.write_text(TEXT_LOG)
+
+        assert main([str(log), "--db", str(db), "--no-record"]) == 0
+        assert not db.exists()
+        assert "7m32s" in capsys.readouterr().out
@@ -0,0 +1,184 @@
+"""
+Tests for the machine type catalog, fleet specs and capacity report.
+"""
+
+import json
+
+import pytest
+from infrastructure_lib.capacity import (
+    build_capacity_report,
+    fleet_capacity_report,
+    main,
+    max_nodes_for_pod_range,
+)
+from infrastructure_lib.config import ClusterConfig, NetworkConfig
+from infrastructure_lib.fleet import PlatformSpec, default_fleet, load_fleet
+from infrastructure_lib.machine_types import get_machine_type, suggest_machine_types
+
+
+def make_config(**overrides):
+    defaults = {
+        "project_id": "test-project",
+        "region": "us-central1",
+        "env": "dev",
+        "prefix": "myapp",
+    }
+    return ClusterConfig(**{**defaults, **overrides})
+
+
+class TestMachineTypeCatalog:
+    """Tests for the offline machine type catalog."""
+
+    def test_profile_defaults_are_in_catalog(self):
+        """Test that every profile default machine type is known."""
+        for name in ("e2-medium", "n2-standard-2", "n2-standard-4"):
+            assert get_machine_type(name) is not None
+
+    def test_machine_type_shape(self):
+        """Test vCPU, memory and family of a predefined type."""
+        machine = get_machine_type("n2-standard-4")
+        assert machine.family == "n2"
+        assert machine.vcpus == 4
+        assert machine.memory_gb == 16
+        assert machine.supports_disk("pd-standard")
+
+    def test_shared_core(self):
+        """Test that shared-core E2 types are flagged."""
+        assert get_machine_type("e2-medium").shared_core is True
+        assert get_machine_type("e2-standard-2").shared_core is False
+
+    def test_suggestions_for_typo(self):
+        """Test that close matches are suggested for typos."""
+        assert "n2-standard-4" in suggest_machine_types("n2-standrd-4")
+
+
+class TestCapacityReport:
+    """Tests for capacity computation and findings."""
+
+    def test_capacity_range(self):
+        """Test min/max capacity from node counts."""
+        report = build_capacity_report(
+            "p", make_config(machine_type="n2-standard-4", min_nodes=3, max_nodes=10)
+        )
+        assert report.ok
+        assert (report.min_vcpus, report.max_vcpus) == (12, 40)
+        assert (report.min_memory_gb, report.max_memory_gb) == (48, 160)
+        assert (report.min_pods, report.max_pods) == (330, 1100)
+
+    def test_spot_fallback_adds_on_demand_capacity(self):
+        """Test that the fallback pool counts towards the maximum capacity."""
+        report = build_capacity_report(
+            "p",
+            make_config(
+                machine_type="e2-standard-2", max_nodes=4, spot_fallback=True, fallback_max_nodes=2
+            ),
+        )
+        assert (report.min_nodes, report.max_nodes) == (1, 6)
+        assert report.max_vcpus == 12
+
+    def test_unknown_machine_type(self):
+        """Test that typos are reported as errors with suggestions."""
+        report = build_capacity_report("p", make_config(machine_type="e2-meduim"))
+        assert not report.ok
+        assert "e2-medium" in report.errors[0]
+
+    def test_prod_on_shared_core(self):
+        """Test that prod on shared-core machine types is an error."""
+        report = build_capacity_report(
+            "p", make_config(env="prod", machine_type="e2-medium", min_nodes=3, max_nodes=3)
+        )
+        assert any("shared-core" in e for e in report.errors)
+
+    def test_unsupported_disk_type(self):
+        """Test that pd-standard on Hyperdisk-only families is an error."""
+        report = build_capacity_report("p", make_config(machine_type="n4-standard-4"))
+        assert any("pd-standard" in e for e in report.errors)
+
+    def test_pod_range_capacity(self):
+        """Test that max_nodes beyond the pod range is a warning."""
+        assert max_nodes_for_pod_range("10.11.0.0/21") == 8
+        network = NetworkConfig(
+            project_id="test-project", region="us-central1", env="dev", prefix="myapp"
+        )
+        report = build_capacity_report("p", make_config(max_nodes=9), network)
+        assert any("pod range" in w for w in report.warnings)
+
+    def test_autopilot_has_no_node_pool(self):
+        """Test that Autopilot clusters are reported without node capacity."""
+        report = build_capacity_report("p", make_config(autopilot=True))
+        assert report.ok
+        assert report.machine_type == "autopilot"
+        assert report.max_vcpus == 0
+
+
+class TestFleetSpec:
+    """Tests for fleet spec loading."""
+
+    def test_platform_spec_uses_profile(self):
+        """Test that specs resolve the same config as StandardPlatform."""
+        spec = PlatformSpec("test-project", "us-central1", "prod", "myapp", {"max_nodes": 20})
+        config = spec.get_cluster_config()
+        assert config.machine_type == "n2-standard-4"
+        assert config.max_nodes == 20
+
+    def test_load_fleet(self, tmp_path):
+        """Test loading a fleet JSON file and reporting on it."""
+        path = tmp_path / "fleet.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "platforms": [
+                        {"project_id": "p", "region": "us-central1", "env": "dev", "prefix": "a"},
+                        {"project_id": "p", "region": "us-central1", "env": "prod", "prefix": "b"},
+                    ]
+                }
+            )
+        )
+        specs = load_fleet(path)
+        reports = fleet_capacity_report(specs)
+        assert [r.name for r in reports] == ["a-dev", "b-prod"]
+
+    def test_builtin_profiles_fit_their_capacity(self):
+        """Test that every built-in profile passes its own capacity check."""
+        specs = [
+            PlatformSpec(
+                s.project_id, s.region, s.env, s.prefix, additional_regions=["europe-west4"]
+            )
+            for s in default_fleet()
+        ]
+        for report in fleet_capacity_report(specs):
+            assert report.ok, report.errors
+            assert not report.warnings, report.warnings
+
+    def test_fleet_report_covers_every_region(self):
+        """Test that additional regions of a platform get their own report."""
+        spec = PlatformSpec("p", "us-central1", "prod", "shop", additional_regions=["europe-west4"])
+        reports = fleet_capacity_report([spec])
+        assert [r.name for r in reports] == ["shop-prod", "shop-prod/europe-west4"]
+        assert reports[0].max_vcpus == reports[1].max_vcpus
+
+    def test_load_fleet_invalid(self, tmp_path):
+        """Test that unknown keys raise ValueError."""
+        path = tmp_path / "fleet.json"
+        path.write_text(json.dumps([{"project_id": "p", "bogus": 1}]))
+        with pytest.raises(ValueError):
+            load_fleet(path)
+
+    def test_cli_exit_code(self, tmp_path, capsys):
+        """Test that the CLI fails when a platform has errors."""
+        path = tmp_path / "fleet.json"
+        path.write_text(
+            json.dumps(
+                [
+                    {
+                        "project_id": "p",
+                        "region": "us-central1",
+                        "env": "prod",
+                        "prefix": "a",
+                        "cluster_overrides": {"machine_type": "e2-small"},
+                    }
+                ]
+            )
+        )
+        assert main([str(path)]) == 1
+        assert "shared-core" in capsys.readouterr().out
@@ -0,0 +1,131 @@
+"""
+Tests for the compact synthesized output mode.
+"""
+
+import gzip
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from cdktf import TerraformStack, Testing
+from cdktf_cdktf_provider_google.provider import GoogleProvider
+from infrastructure_lib import StandardPlatform
+from infrastructure_lib.compact import (
+    SizeReport,
+    compact_output,
+    compact_synth,
+    format_size_report,
+    main,
+)
+
+
+def platform_stack(env="prod"):
+    """Build a stack with a StandardPlatform."""
+    app = Testing.app()
+    stack = TerraformStack(app, "test")
+    GoogleProvider(stack, "Google", project="test-project", region="us-central1")
+    StandardPlatform(
+        stack,
+        "platform",
+        project_id="test-project",
+        region="us-central1",
+        env=env,
+        prefix="myapp",
+        secret_ids=["api-key"],
+    )
+    return stack
+
+
+def stack_file(outdir):
+    """Path of the single synthesized cdk.tf.json."""
+    return next(Path(outdir).glob("stacks/*/cdk.tf.json"))
+
+
+def full_synth_json(env="prod"):
+    """Synthesized cdk.tf.json including construct metadata."""
+    return json.loads(stack_file(Testing.full_synth(platform_stack(env))).read_text())
+
+
+class TestCompactSynth:
+    """Tests for metadata stripping."""
+
+    def test_keeps_top_level_metadata_only(self):
+        """Test that per-resource metadata is removed and stack metadata kept."""
+        synth = full_synth_json()
+        compact = compact_synth(synth)
+
+        assert compact["//"] == synth["//"]
+        assert any("//" in attrs for attrs in synth["resource"]["google_compute_network"].values())
+        for by_name in compact["resource"].values():
+            for attrs in by_name.values():
+                assert "//" not in attrs
+
+    def test_resources_unchanged(self):
+        """Test that only metadata is removed."""
+        synth = full_synth_json()
+        compact = compact_synth(synth)
+
+        assert sorted(compact["resource"]) == sorted(synth["resource"])
+        nat = next(iter(compact["resource"]["google_compute_router_nat"].values()))
+        assert nat["name"] == "myapp-prod-vpc-nat"
+
+
+class TestCompactOutput:
+    """Tests for rewriting a synthesized output directory."""
+
+    def test_compact_output_is_smaller(self):
+        """Test the size comparison of a prod platform stack."""
+        outdir = Testing.full_synth(platform_stack())
+        original = json.loads(stack_file(outdir).read_text())
+
+        [report] = compact_output(outdir, gzip=True)
+
+        assert report.compact_bytes < report.original_bytes
+        assert report.gzip_bytes < report.compact_bytes
+        assert json.loads(stack_file(outdir).read_text()) == compact_synth(original)
+        assert "\n" not in stack_file(outdir).read_text()
+
+    def test_gzip_round_trip(self):
+        """Test that the gzipped artifact holds the compact JSON."""
+        outdir = Testing.full_synth(platform_stack())
+        compact_output(outdir, gzip=True)
+
+        path = stack_file(outdir)
+        gzipped = path.with_name("cdk.tf.json.gz").read_bytes()
+        assert gzip.decompress(gzipped) == path.read_bytes()
+
+    def test_no_stacks(self, tmp_path):
+        """Test that an empty directory is rejected."""
+        with pytest.raises(ValueError):
+            compact_output(tmp_path)
+
+    @pytest.mark.skipif(shutil.which("terraform") is None, reason="terraform not installed")
+    def test_compact_output_is_valid_terraform(self):
+        """Test that terraform validate still passes after compaction."""
+        outdir = Testing.full_synth(platform_stack())
+        compact_output(outdir)
+
+        assert Testing.to_be_valid_terraform(outdir)
+
+
+class TestReport:
+    """Tests for size report rendering and the CLI."""
+
+    def test_format_size_report_total(self):
+        """Test that multiple stacks get a total row."""
+        reports = [SizeReport("a", 1000, 600, 100), SizeReport("b", 1000, 400, 100)]
+        output = format_size_report(reports)
+
+        assert "GZIP" in output
+        assert output.splitlines()[-1].startswith("TOTAL")
+        assert "90.0%" in output
+
+    def test_main_json(self, capsys):
+        """Test that the CLI prints a JSON size report."""
+        outdir = Testing.full_synth(platform_stack(env="dev"))
+
+        assert main([outdir, "--json"]) == 0
+        [report] = json.loads(capsys.readouterr().out)
+        assert report["gzip_bytes"] is None
+        assert report["compact_bytes"] < report["original_bytes"]
@@ -2,8 +2,10 @@
 Tests for configuration validation and property generation.
 """
 
+import dataclasses
+
 import pytest
-from infrastructure_lib.config import ClusterConfig, NetworkConfig
+from infrastructure_lib.config import CacheConfig, ClusterConfig, DatabaseConfig, NetworkConfig
 
 
 class TestNetworkConfig:
@@ -44,6 +46,148 @@ class TestNetworkConfig:
         )
         assert config.cidr == "10.1.0.0/16"
 
+    def test_flow_logs_off_by_default(self):
+        """Test that telemetry is opt-in when building the config directly."""
+        config = NetworkConfig(
+            project_id="test-project", region="us-central1", env="dev", prefix="myapp"
+        )
+        assert config.flow_logs is False
+        assert config.nat_logging is None
+
+    def test_invalid_flow_log_settings(self):
+        """Test that flow log and NAT log settings are validated."""
+        base = {"project_id": "test-project", "region": "us-central1", "env": "dev", "prefix": "a"}
+        with pytest.raises(ValueError):
+            NetworkConfig(**base, flow_logs_interval="INTERVAL_2_MIN")
+        with pytest.raises(ValueError):
+            NetworkConfig(**base, flow_logs_sampling=0.0)
+        with pytest.raises(ValueError):
+            NetworkConfig(**base, nat_logging="SOME")
+
+    def test_profile_telemetry_defaults(self):
+        """Test that dev logs cheaply and prod logs richly."""
+        from infrastructure_lib.profiles import DevProfile, ProdProfile
+
+        dev = DevProfile("test-project", "us-central1", "dev", "myapp").get_network_config()
+        prod = ProdProfile("test-project", "us-central1", "prod", "myapp").get_network_config()
+
+        assert dev.flow_logs_sampling < prod.flow_logs_sampling
+        assert dev.flow_logs_metadata == "EXCLUDE_ALL_METADATA"
+        assert dev.nat_logging == "ERRORS_ONLY"
+        assert prod.flow_logs_interval == "INTERVAL_5_SEC"
+        assert prod.nat_logging == "ALL"
+
+
+class TestMultiRegion:
+    """Tests for multi-region networks and per-region clusters."""
+
+    base = {"project_id": "test-project", "region": "us-central1", "env": "prod", "prefix": "a"}
+
+    def test_single_region_by_default(self):
+        """Test that the primary subnet keeps the single-region settings."""
+        config = NetworkConfig(**self.base)
+        [subnet] = config.subnets
+        assert not config.is_multi_region
+        assert subnet.subnet_name == config.subnet_name
+        assert subnet.router_name == "a-prod-vpc-router"
+        assert (subnet.cidr, subnet.pod_cidr) == (config.cidr, config.pod_cidr)
+
+    def test_additional_regions_get_shifted_ranges(self):
+        """Test that each region gets its own names and non-overlapping ranges."""
+        config = NetworkConfig(**self.base, additional_regions=["europe-west4", "asia-east1"])
+        assert config.regions == ("us-central1", "europe-west4", "asia-east1")
+
+        eu = config.subnet_for("europe-west4")
+        assert eu.subnet_name == "a-prod-europe-west4-subnet"
+        assert eu.nat_name == "a-prod-vpc-europe-west4-nat"
+        assert (eu.cidr, eu.pod_cidr, eu.service_cidr) == (
+            "10.1.0.0/16",
+            "10.11.8.0/21",
+            "10.12.8.0/21",
+        )
+        assert config.subnet_for("asia-east1").cidr == "10.2.0.0/16"
+        with pytest.raises(ValueError):
+            config.subnet_for("us-east1")
+
+    def test_invalid_regions(self):
+        """Test that duplicate regions and overlapping ranges are rejected."""
+        with pytest.raises(ValueError):
+            NetworkConfig(**self.base, additional_regions=["us-central1"])
+        with pytest.raises(ValueError):
+            NetworkConfig(**self.base, cidr="10.0.0.0/12")
+        with pytest.raises(ValueError):
+            # Primary ranges of regions 1+ would run into the pod range
+            NetworkConfig(**self.base, cidr="10.10.0.0/16", additional_regions=["europe-west4"])
+
+    def test_profile_cluster_per_region(self):
+        """Test that each region gets a cluster with its own name and master range."""
+        from infrastructure_lib.profiles import ProdProfile
+
+        profile = ProdProfile("test-project", "us-central1", "prod", "myapp")
+        network = profile.get_network_config(additional_regions=["europe-west4"])
+        configs = profile.get_cluster_configs(network, zone="us-central1-c", max_nodes=20)
+
+        primary, eu = configs["us-central1"], configs["europe-west4"]
+        assert list(configs) == ["us-central1", "europe-west4"]
+        assert (primary.cluster_name, primary.effective_zone) == (
+            "myapp-prod-cluster",
+            "us-central1-c",
+        )
+        assert (eu.cluster_name, eu.effective_zone) == (
+            "myapp-prod-cluster-euw4",
+            "europe-west4-a",
+        )
+        assert (primary.master_cidr, eu.master_cidr) == ("172.16.0.0/28", "172.16.0.16/28")
+        assert eu.max_nodes == 20
+
+    def test_region_suffix(self):
+        """Test that region suffixes are short and reject non-region names."""
+        from infrastructure_lib.config import region_suffix
+
+        assert region_suffix("europe-west4") == "euw4"
+        assert region_suffix("australia-southeast1") == "ause1"
+        assert region_suffix("northamerica-northeast2") == "nane2"
+        with pytest.raises(ValueError):
+            region_suffix("global")
+
+    def test_cluster_and_pool_name_length(self):
+        """Test that names over GKE's 40 character limit are rejected."""
+        base = {"project_id": "test-project", "region": "us-central1", "env": "staging"}
+        # delivery-staging-cluster-australia-southeast1 (45 characters)
+        with pytest.raises(ValueError):
+            ClusterConfig(**base, prefix="delivery", name_suffix="australia-southeast1")
+        # delivery-staging-cluster-europe-west4-pool (42 characters)
+        with pytest.raises(ValueError):
+            ClusterConfig(**base, prefix="delivery", name_suffix="europe-west4")
+        # Autopilot has no node pool
+        config = ClusterConfig(
+            **base, prefix="deliveryapp", name_suffix="europe-west4", autopilot=True
+        )
+        assert len(config.cluster_name) == 40
+        assert ClusterConfig(**base, prefix="delivery", name_suffix="euw4").cluster_name == (
+            "delivery-staging-cluster-euw4"
+        )
+
+
+class TestPscGoogleApis:
+    """Tests for the Private Service Connect endpoint settings."""
+
+    base = {"project_id": "test-project", "region": "us-central1", "env": "dev", "prefix": "my-app"}
+
+    def test_endpoint_name(self):
+        """Test that the endpoint name is letters and digits only, at most 20 chars."""
+        assert NetworkConfig(**self.base).psc_endpoint_name == "pscmyappdev"
+        config = NetworkConfig(**{**self.base, "prefix": "a-very-long-prefix"})
+        assert config.psc_endpoint_name == "pscaverylongprefixde"
+
+    def test_invalid_settings(self):
+        """Test that unknown bundles and addresses inside subnets are rejected."""
+        with pytest.raises(ValueError):
+            NetworkConfig(**self.base, psc_google_apis="storage")
+        with pytest.raises(ValueError):
+            NetworkConfig(**self.base, psc_google_apis="vpc-sc", psc_address="10.0.0.5")
+        NetworkConfig(**self.base, psc_address="10.0.0.5")  # unused without psc_google_apis
+
 
 class TestClusterConfig:
     """Tests for ClusterConfig dataclass."""
@@ -107,6 +251,458 @@ class TestClusterConfig:
         assert config.master_cidr == "172.16.0.0/28"
 
 
+class TestNodeTuning:
+    """Tests for kubelet and Linux node tuning options."""
+
+    def test_tuning_disabled_by_default(self):
+        """Test that no kubelet or Linux node config is set by default."""
+        config = ClusterConfig(
+            project_id="test-project", region="us-central1", env="dev", prefix="myapp"
+        )
+        assert config.has_kubelet_config is False
+        assert config.has_linux_node_config is False
+
+    def test_high_throughput_preset(self):
+        """Test that the preset fills kubelet and sysctl settings."""
+        config = ClusterConfig(
+            project_id="test-project",
+            region="us-central1",
+            env="prod",
+            prefix="myapp",
+            tuning_preset="high-throughput",
+        )
+        assert config.cpu_manager_policy == "static"
+        assert config.cpu_cfs_quota is False
+        assert config.sysctls["net.core.somaxconn"] == "4096"
+        assert config.has_kubelet_config and config.has_linux_node_config
+
+    def test_explicit_values_override_preset(self):
+        """Test that explicit fields and sysctls win over the preset."""
+        config = ClusterConfig(
+            project_id="test-project",
+            region="us-central1",
+            env="prod",
+            prefix="myapp",
+            tuning_preset="high-throughput",
+            cpu_manager_policy="none",
+            sysctls={"net.core.somaxconn": "8192"},
+        )
+        assert config.cpu_manager_policy == "none"
+        assert config.sysctls["net.core.somaxconn"] == "8192"
+        assert "net.ipv4.tcp_rmem" in config.sysctls
+
+    def test_unsupported_sysctl(self):
+        """Test that sysctls outside the allowlist are rejected."""
+        with pytest.raises(ValueError) as excinfo:
+            ClusterConfig(
+                project_id="test-project",
+                region="us-central1",
+                env="dev",
+                prefix="myapp",
+                sysctls={"kernel.panic": "1"},
+            )
+        assert "kernel.panic" in str(excinfo.value)
+
+    def test_unknown_preset(self):
+        """Test that unknown presets are rejected."""
+        with pytest.raises(ValueError):
+            ClusterConfig(
+                project_id="test-project",
+                region="us-central1",
+                env="dev",
+                prefix="myapp",
+                tuning_preset="turbo",
+            )
+
+    def test_invalid_kubelet_values(self):
+        """Test validation of CPU manager policy and PID limit."""
+        base = {"project_id": "test-project", "region": "us-central1", "env": "dev", "prefix": "a"}
+        with pytest.raises(ValueError):
+            ClusterConfig(**base, cpu_manager_policy="dynamic")
+        with pytest.raises(ValueError):
+            ClusterConfig(**base, pod_pids_limit=10)
+
+
+class TestUpgradeSettings:
+    """Tests for node pool upgrade strategy options."""
+
+    base = {"project_id": "test-project", "region": "us-central1", "env": "dev", "prefix": "a"}
+
+    def test_defaults(self):
+        """Test that GKE defaults are kept and auto repair/upgrade are on."""
+        config = ClusterConfig(**self.base)
+        assert config.upgrade_strategy is None
+        assert config.auto_repair is True
+        assert config.auto_upgrade is True
+
+    def test_blue_green(self):
+        """Test a valid blue-green configuration."""
+        config = ClusterConfig(
+            **self.base,
+            upgrade_strategy="BLUE_GREEN",
+            blue_green_soak_duration="1800s",
+            blue_green_batch_node_count=2,
+        )
+        assert config.blue_green_batch_node_count == 2
+
+    def test_options_require_matching_strategy(self):
+        """Test that surge and blue-green options cannot be mixed."""
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, max_surge=1)
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, upgrade_strategy="SURGE", blue_green_batch_node_count=1)
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, upgrade_strategy="BLUE_GREEN", max_surge=1)
+
+    def test_invalid_values(self):
+        """Test validation of strategy, surge and durations."""
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, upgrade_strategy="ROLLING")
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, upgrade_strategy="SURGE", max_surge=0, max_unavailable=0)
+        with pytest.raises(ValueError):
+            ClusterConfig(
+                **self.base, upgrade_strategy="BLUE_GREEN", blue_green_soak_duration="30m"
+            )
+
+    def test_prod_profile_surge_keeps_capacity(self):
+        """Test that ProdProfile never reduces capacity during upgrades."""
+        from infrastructure_lib.profiles import ProdProfile
+
+        config = ProdProfile("test-project", "us-central1", "prod", "myapp").get_cluster_config()
+        assert config.upgrade_strategy == "SURGE"
+        assert config.max_surge > 0
+        assert config.max_unavailable == 0
+
+    def test_prod_profile_blue_green_override(self):
+        """Test that overriding the strategy drops the surge defaults."""
+        from infrastructure_lib.profiles import ProdProfile
+
+        config = ProdProfile("test-project", "us-central1", "prod", "myapp").get_cluster_config(
+            upgrade_strategy="BLUE_GREEN"
+        )
+        assert config.max_surge is None
+
+
+class TestAutopilot:
+    """Tests for the Autopilot cluster mode."""
+
+    base = {"project_id": "test-project", "region": "us-central1", "env": "dev", "prefix": "a"}
+
+    def test_regional_location(self):
+        """Test that Autopilot clusters are regional and standard clusters zonal."""
+        assert ClusterConfig(**self.base, autopilot=True).location == "us-central1"
+        assert ClusterConfig(**self.base).location == "us-central1-a"
+
+    def test_rejects_node_pool_settings(self):
+        """Test that node tuning and upgrade strategies are rejected."""
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, autopilot=True, tuning_preset="high-throughput")
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, autopilot=True, upgrade_strategy="SURGE")
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, autopilot=True, vertical_pod_autoscaling=False)
+
+    def test_prod_profile_autopilot(self):
+        """Test that ProdProfile drops its surge upgrade defaults for Autopilot."""
+        from infrastructure_lib.profiles import ProdProfile
+
+        config = ProdProfile("test-project", "us-central1", "prod", "myapp").get_cluster_config(
+            autopilot=True
+        )
+        assert config.upgrade_strategy is None
+        assert config.telemetry_preset == "full"
+
+
+class TestSpotFallback:
+    """Tests for the on-demand fallback pool settings."""
+
+    base = {"project_id": "test-project", "region": "us-central1", "env": "dev", "prefix": "a"}
+
+    def test_fallback_node_limit(self):
+        """Test that the fallback maximum follows the ratio and the ceiling."""
+        assert ClusterConfig(**self.base, max_nodes=10).fallback_node_limit == 0
+        assert (
+            ClusterConfig(**self.base, max_nodes=10, spot_fallback=True).fallback_node_limit == 10
+        )
+        config = ClusterConfig(**self.base, max_nodes=5, spot_fallback=True, fallback_ratio=0.5)
+        assert config.fallback_node_limit == 3
+        config = ClusterConfig(**self.base, max_nodes=10, spot_fallback=True, fallback_max_nodes=2)
+        assert config.fallback_node_limit == 2
+
+    def test_invalid_settings(self):
+        """Test that fallback settings are validated."""
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, spot_fallback=True, spot_instances=False)
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, spot_fallback=True, autopilot=True)
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, fallback_ratio=0)
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, fallback_max_nodes=0)
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, autoscaling_profile="OPTIMIZE_COST")
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, autoscaling_profile="BALANCED", autopilot=True)
+
+    def test_ondemand_pool_name_length(self):
+        """Test that the fallback pool name must fit GKE's 40 character limit."""
+        base = {**self.base, "prefix": "delivery", "env": "staging"}
+        # delivery-staging-cluster-euw4-ondemand-pool (43 characters)
+        assert ClusterConfig(**base, name_suffix="euw4").cluster_name
+        with pytest.raises(ValueError):
+            ClusterConfig(**base, name_suffix="euw4", spot_fallback=True)
+        assert ClusterConfig(**base, spot_fallback=True).cluster_name == "delivery-staging-cluster"
+
+
+class TestUsageMetering:
+    """Tests for usage metering and cost allocation settings."""
+
+    base = {"project_id": "test-project", "region": "us-central1", "env": "prod", "prefix": "shop"}
+
+    def test_dataset_id(self):
+        """Test that dataset IDs are valid BigQuery names, one per cluster."""
+        assert ClusterConfig(**self.base).usage_dataset_id == "shop_prod_gke_usage"
+        config = ClusterConfig(**self.base, name_suffix="eu-1")
+        assert config.usage_dataset_id == "shop_prod_gke_usage_eu_1"
+
+    def test_rejected_with_autopilot(self):
+        """Test that usage metering is rejected and cost allocation kept with Autopilot."""
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, autopilot=True, usage_metering=True)
+        assert ClusterConfig(**self.base, autopilot=True, cost_allocation=True).cost_allocation
+
+    def test_default_on_in_prod_only(self):
+        """Test that only the prod profile meters usage and allocates costs."""
+        from infrastructure_lib.profiles import get_profile
+
+        for env in ("dev", "staging", "prod"):
+            config = get_profile("test-project", "us-central1", env, "shop").get_cluster_config()
+            assert config.usage_metering is (env == "prod")
+            assert config.cost_allocation is (env == "prod")
+            assert config.usage_metering_egress
+
+        autopilot = get_profile("test-project", "us-central1", "prod", "shop").get_cluster_config(
+            autopilot=True
+        )
+        assert not autopilot.usage_metering
+        assert autopilot.cost_allocation
+
+
+class TestTelemetry:
+    """Tests for monitoring/logging settings and telemetry presets."""
+
+    base = {"project_id": "test-project", "region": "us-central1", "env": "dev", "prefix": "myapp"}
+
+    def test_gke_defaults_without_preset(self):
+        """Test that telemetry is left to GKE defaults when not configured."""
+        config = ClusterConfig(**self.base)
+        assert config.managed_prometheus is None
+        assert config.monitoring_components is None
+        assert config.has_monitoring_config is False
+
+    def test_preset_fills_unset_fields(self):
+        """Test that explicit fields take precedence over the preset."""
+        config = ClusterConfig(
+            **self.base, telemetry_preset="full", logging_components=["SYSTEM_COMPONENTS"]
+        )
+        assert config.managed_prometheus is True
+        assert "CADVISOR" in config.monitoring_components
+        assert config.logging_components == ("SYSTEM_COMPONENTS",)
+
+    def test_unknown_preset(self):
+        """Test that unknown presets are rejected."""
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, telemetry_preset="verbose")
+
+    def test_invalid_components(self):
+        """Test that components are validated and need SYSTEM_COMPONENTS."""
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, monitoring_components=["SYSTEM_COMPONENTS", "NETWORK"])
+        with pytest.raises(ValueError):
+            ClusterConfig(**self.base, logging_components=["WORKLOADS"])
+
+    def test_empty_components_disable(self):
+        """Test that an empty list is accepted (disables the components)."""
+        config = ClusterConfig(**self.base, logging_components=[])
+        assert config.logging_components == ()
+
+    def test_profile_presets(self):
+        """Test that profiles scale telemetry by environment."""
+        from infrastructure_lib.profiles import DevProfile, ProdProfile, StagingProfile
+
+        dev = DevProfile("test-project", "us-central1", "dev", "myapp").get_cluster_config()
+        staging = StagingProfile("test-project", "us-central1", "staging", "myapp")
+        prod = ProdProfile("test-project", "us-central1", "prod", "myapp").get_cluster_config()
+
+        assert dev.monitoring_components == ("SYSTEM_COMPONENTS",)
+        assert dev.managed_prometheus is False
+        assert staging.get_cluster_config().managed_prometheus is True
+        assert "APISERVER" in prod.monitoring_components
+        assert "SCHEDULER" in prod.logging_components
+
+
+class TestCacheConfig:
+    """Tests for CacheConfig dataclass and profile sizing."""
+
+    base = {"project_id": "test-project", "region": "us-central1", "env": "dev", "prefix": "myapp"}
+
+    def test_defaults(self):
+        """Test default sizing and naming."""
+        config = CacheConfig(**self.base)
+        assert config.instance_name == "myapp-dev-cache"
+        assert config.tier == "BASIC"
+        assert config.memory_size_gb == 1
+
+    def test_replicas_require_standard_ha(self):
+        """Test that BASIC instances cannot have replicas."""
+        with pytest.raises(ValueError):
+            CacheConfig(**self.base, replica_count=2)
+
+    def test_read_replicas_require_memory(self):
+        """Test that read replicas need at least 5 GB."""
+        with pytest.raises(ValueError):
+            CacheConfig(**self.base, tier="STANDARD_HA", replica_count=1, read_replicas=True)
+
+    def test_profile_sizing(self):
+        """Test that profiles scale cache sizing by environment."""
+        from infrastructure_lib.profiles import DevProfile, ProdProfile, StagingProfile
+
+        dev = DevProfile("test-project", "us-central1", "dev", "myapp").get_cache_config()
+        staging = StagingProfile("test-project", "us-central1", "staging", "myapp")
+        prod = ProdProfile("test-project", "us-central1", "prod", "myapp").get_cache_config()
+
+        assert dev.tier == "BASIC"
+        assert staging.get_cache_config().tier == "STANDARD_HA"
+        assert prod.tier == "STANDARD_HA"
+        assert prod.read_replicas is True
+        assert prod.replica_count == 2
+
+
+class TestDatabaseConfig:
+    """Tests for DatabaseConfig dataclass and profile sizing."""
+
+    base = {"project_id": "test-project", "region": "us-central1", "env": "dev", "prefix": "myapp"}
+
+    def test_defaults(self):
+        """Test default sizing and naming."""
+        config = DatabaseConfig(**self.base)
+        assert config.instance_name == "myapp-dev-db"
+        assert config.password_secret_id == "myapp-dev-db-password"
+        assert config.replica_name(0) == "myapp-dev-db-replica-0"
+        assert config.availability_type == "ZONAL"
+        assert config.query_insights is True
+
+    def test_invalid_availability_type(self):
+        """Test that only ZONAL and REGIONAL are accepted."""
+        with pytest.raises(ValueError):
+            DatabaseConfig(**self.base, availability_type="MULTI")
+
+    def test_read_replicas_require_backups(self):
+        """Test that replicas cannot be created without backups."""
+        with pytest.raises(ValueError):
+            DatabaseConfig(**self.base, read_replicas=1, backups=False)
+
+    def test_profile_sizing(self):
+        """Test that profiles scale database sizing by environment."""
+        from infrastructure_lib.profiles import DevProfile, ProdProfile
+
+        dev = DevProfile("test-project", "us-central1", "dev", "myapp").get_database_config()
+        prod = ProdProfile("test-project", "us-central1", "prod", "myapp").get_database_config()
+
+        assert dev.read_replicas == 0
+        assert dev.deletion_protection is False
+        assert prod.availability_type == "REGIONAL"
+        assert prod.read_replicas == 1
+        assert prod.deletion_protection is True
+        assert prod.database_flags == {"log_min_duration_statement": "500"}
+
+    def test_prod_mysql_skips_postgres_flags(self):
+        """Test that PostgreSQL-only flags are not applied to MySQL."""
+        from infrastructure_lib.profiles import ProdProfile
+
+        profile = ProdProfile("test-project", "us-central1", "prod", "myapp")
+        assert profile.get_database_config(database_version="MYSQL_8_0").database_flags == {}
+
+
+class TestFrozenConfigs:
+    """Tests for immutable, hashable and fingerprinted configs."""
+
+    base = {"project_id": "test-project", "region": "us-central1", "env": "dev", "prefix": "myapp"}
+
+    def test_configs_are_immutable(self):
+        """Test that fields and dict/list values cannot be changed in place."""
+        network = NetworkConfig(**self.base, additional_regions=["europe-west4"])
+        cluster = ClusterConfig(**self.base, tuning_preset="high-throughput")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            network.cidr = "10.1.0.0/16"
+        with pytest.raises(TypeError):
+            cluster.sysctls["net.core.somaxconn"] = "1"
+        assert network.additional_regions == ("europe-west4",)
+
+    def test_mutation_raises(self):
+        """Test that every field, derived value and new attribute is read-only."""
+        for config in (NetworkConfig(**self.base), ClusterConfig(**self.base)):
+            names = [f.name for f in dataclasses.fields(config)] + ["fingerprint", "extra"]
+            for name in names:
+                with pytest.raises(dataclasses.FrozenInstanceError):
+                    setattr(config, name, None)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            del config.max_nodes
+
+    def test_equal_configs_hash_equal(self):
+        """Test structural equality and use as dict keys."""
+        a = ClusterConfig(**self.base, sysctls={"net.core.somaxconn": "4096"})
+        b = ClusterConfig(**self.base, sysctls={"net.core.somaxconn": "4096"})
+        assert a == b and hash(a) == hash(b)
+        assert len({a: 1, b: 2, NetworkConfig(**self.base): 3}) == 2
+
+    def test_fingerprint_is_canonical(self):
+        """Test that the fingerprint depends on values, not argument order."""
+        a = ClusterConfig(**self.base, machine_type="e2-standard-4", max_nodes=5)
+        b = ClusterConfig(max_nodes=5, machine_type="e2-standard-4", **self.base)
+        assert a.fingerprint == b.fingerprint
+        assert len(a.fingerprint) == 64
+        assert ClusterConfig(**self.base).fingerprint != a.fingerprint
+        assert a.canonical_json().startswith('{"fields":{"auto_repair":true,')
+
+    def test_replace_recomputes_derived_values(self):
+        """Test that dataclasses.replace yields a validated config with new names."""
+        config = ClusterConfig(**self.base)
+        renamed = dataclasses.replace(config, name_suffix="eu", zone="us-central1-b")
+        assert renamed.cluster_name == "myapp-dev-cluster-eu"
+        assert renamed.effective_zone == "us-central1-b"
+        with pytest.raises(ValueError):
+            dataclasses.replace(config, min_nodes=5)
+
+    def test_profile_configs_are_memoized(self):
+        """Test that equal profiles and overrides return the same instance."""
+        from infrastructure_lib.profiles import DevProfile, ProdProfile
+
+        profile = DevProfile(**self.base)
+        config = profile.get_cluster_config(max_nodes=5, machine_type="e2-standard-4")
+        again = DevProfile(**self.base).get_cluster_config(
+            machine_type="e2-standard-4", max_nodes=5
+        )
+        assert config is again
+        assert profile.get_network_config() is profile.get_network_config()
+        assert profile.get_cluster_config(autopilot=1) is not profile.get_cluster_config(
+            autopilot=True
+        )
+        assert ProdProfile(**self.base).get_cluster_config() is not profile.get_cluster_config()
+
+    def test_changed_profile_gets_new_configs(self):
+        """Test that the cache key is a snapshot of the profile arguments."""
+        from infrastructure_lib.profiles import DevProfile
+
+        profile = DevProfile(**self.base)
+        assert profile.get_cluster_config().cluster_name == "myapp-dev-cluster"
+        profile.prefix = "shop"
+        assert profile.get_cluster_config().cluster_name == "shop-dev-cluster"
+        assert DevProfile(**self.base).get_cluster_config().cluster_name == "myapp-dev-cluster"
+
+
 class TestProfileIntegration:
     """Tests for profile configuration generation."""
 
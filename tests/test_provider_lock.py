@@ -0,0 +1,164 @@
+"""
+Tests for provider lock files and the shared plugin cache configuration.
+"""
+
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+from cdktf import TerraformStack, Testing
+from cdktf_cdktf_provider_google.provider import GoogleProvider
+from infrastructure_lib import StandardPlatform
+from infrastructure_lib.provider_lock import (
+    CLI_CONFIG_FILE,
+    LOCK_FILE,
+    ProviderPin,
+    format_lock_file,
+    installed_provider_pin,
+    main,
+    mirror_packages,
+    package_hashes,
+    provider_source,
+    required_providers,
+    write_lock_files,
+)
+
+GOOGLE = "registry.terraform.io/hashicorp/google"
+
+
+def synth_outdir():
+    """Fully synthesize a stack with a StandardPlatform."""
+    app = Testing.app()
+    stack = TerraformStack(app, "shop-prod")
+    GoogleProvider(stack, "Google", project="acme-prod", region="us-central1")
+    StandardPlatform(
+        stack, "platform", project_id="acme-prod", region="us-central1", env="prod", prefix="shop"
+    )
+    return Path(Testing.full_synth(stack))
+
+
+def make_mirror(root, version, platforms=("linux_amd64", "darwin_arm64")):
+    """A packed filesystem mirror with a fake google provider per platform."""
+    provider_dir = root.joinpath(*GOOGLE.split("/"))
+    provider_dir.mkdir(parents=True)
+    for platform in platforms:
+        name = f"terraform-provider-google_{version}_{platform}.zip"
+        with zipfile.ZipFile(provider_dir / name, "w") as archive:
+            archive.writestr(f"terraform-provider-google_v{version}_x5", platform)
+    return root
+
+
+class TestPins:
+    """Tests for resolving provider versions."""
+
+    def test_provider_source(self):
+        """Test that short sources are qualified with the default registry."""
+        assert provider_source("google") == GOOGLE
+        assert provider_source("hashicorp/google-beta") == (
+            "registry.terraform.io/hashicorp/google-beta"
+        )
+        with pytest.raises(ValueError):
+            provider_source("a/b/c/d")
+
+    def test_installed_bindings_match_synth(self):
+        """Test that the installed bindings pin the synthesized google provider version."""
+        pin = installed_provider_pin()
+        assert pin is not None and pin.source == GOOGLE
+
+        google = {"source": "google", "version": pin.version}
+        synth = {"terraform": {"required_providers": {"google": google}}}
+        assert required_providers(synth, [pin]) == [pin]
+        assert installed_provider_pin("no_such_package") is None
+
+    def test_unpinned_and_stale_versions(self):
+        """Test that ranges take the installed version and mismatches are rejected."""
+        installed = [ProviderPin(GOOGLE, "6.50.0")]
+        ranged = {"terraform": {"required_providers": {"google": {"version": "~> 6.0"}}}}
+        assert required_providers(ranged, installed) == installed
+        with pytest.raises(ValueError):
+            required_providers(ranged)
+
+        stale = {"terraform": {"required_providers": {"google": {"version": "6.40.0"}}}}
+        with pytest.raises(ValueError):
+            required_providers(stale, installed)
+
+
+class TestChecksums:
+    """Tests for package checksums and the lock file layout."""
+
+    def test_packed_and_unpacked_hashes_agree(self, tmp_path):
+        """Test that a zip and its extracted directory share the h1 checksum."""
+        mirror = make_mirror(tmp_path / "mirror", "6.50.0", platforms=("linux_amd64",))
+        (package,) = mirror_packages(mirror, ProviderPin(GOOGLE, "6.50.0"))
+        unpacked = tmp_path / "unpacked"
+        zipfile.ZipFile(package).extractall(unpacked)
+
+        h1, zh = package_hashes(package)
+        assert h1.startswith("h1:") and zh.startswith("zh:")
+        assert package_hashes(unpacked) == [h1]
+
+    def test_mirror_layouts(self, tmp_path):
+        """Test that packed and unpacked mirror entries of the version are found."""
+        mirror = make_mirror(tmp_path, "6.50.0")
+        mirror.joinpath(*GOOGLE.split("/"), "6.50.0", "windows_amd64").mkdir(parents=True)
+        make_mirror(tmp_path / "other", "6.49.0")
+
+        packages = mirror_packages(mirror, ProviderPin(GOOGLE, "6.50.0"))
+        assert [p.name for p in packages] == [
+            "windows_amd64",
+            "terraform-provider-google_6.50.0_darwin_arm64.zip",
+            "terraform-provider-google_6.50.0_linux_amd64.zip",
+        ]
+
+    def test_lock_file_layout(self):
+        """Test the provider block terraform init writes."""
+        lock = format_lock_file([ProviderPin(GOOGLE, "6.50.0")], {GOOGLE: ["zh:b", "h1:a"]})
+        assert lock.endswith(
+            f'\nprovider "{GOOGLE}" {{\n'
+            '  version     = "6.50.0"\n'
+            '  constraints = "6.50.0"\n'
+            "  hashes = [\n"
+            '    "h1:a",\n'
+            '    "zh:b",\n'
+            "  ]\n"
+            "}\n"
+        )
+
+
+class TestWriteLockFiles:
+    """Tests for preparing synthesized output."""
+
+    def test_lock_files_with_mirror(self, tmp_path):
+        """Test that every stack is locked with mirror checksums and the CLI config uses the mirror."""
+        outdir = synth_outdir()
+        version = installed_provider_pin().version
+        mirror = make_mirror(tmp_path / "mirror", version)
+        cache = tmp_path / "plugin-cache"
+
+        (report,) = write_lock_files(outdir, mirror=mirror, plugin_cache_dir=cache)
+
+        assert report.providers == {GOOGLE: version}
+        assert report.hashes == {GOOGLE: 4}
+        lock = (outdir / "stacks" / "shop-prod" / LOCK_FILE).read_text()
+        assert f'version     = "{version}"' in lock
+        assert lock.count('"h1:') == 2
+
+        config = (outdir / CLI_CONFIG_FILE).read_text()
+        assert f'plugin_cache_dir = "{cache.resolve()}"' in config
+        assert f'path    = "{mirror.resolve()}"' in config
+        assert f'exclude = ["{GOOGLE}"]' in config
+        assert cache.is_dir()
+
+    def test_cli_without_mirror(self, tmp_path, capsys):
+        """Test that without a mirror versions are pinned and the cache configured."""
+        outdir = synth_outdir()
+        cache = tmp_path / "plugin-cache"
+
+        assert main([str(outdir), "--plugin-cache", str(cache), "--json"]) == 0
+        result = json.loads(capsys.readouterr().out)
+
+        assert result["stacks"][0]["hashes"] == {GOOGLE: 0}
+        lock = (outdir / "stacks" / "shop-prod" / LOCK_FILE).read_text()
+        assert "hashes" not in lock
+        assert "provider_installation" not in Path(result["cli_config"]).read_text()
@@ -0,0 +1,160 @@
+"""
+Tests for the quota and address-space estimator.
+"""
+
+import json
+
+import pytest
+from cdktf import TerraformStack, Testing
+from cdktf_cdktf_provider_google.provider import GoogleProvider
+from infrastructure_lib import StandardPlatform
+from infrastructure_lib.fleet import PlatformSpec
+from infrastructure_lib.quota import (
+    Footprint,
+    NodePoolFootprint,
+    estimate,
+    footprint_from_specs,
+    footprint_from_synth,
+    load_quotas,
+    main,
+    nat_ips_needed,
+    worst_case_nodes,
+)
+
+
+def usages_by_metric(usages, region="us-central1"):
+    """Map metric (and subnet for address-space metrics) to usage for one region."""
+    return {
+        (f"{u.metric}/{u.scope}" if u.scope else u.metric): u for u in usages if u.region == region
+    }
+
+
+class TestDemand:
+    """Tests for worst-case demand rules."""
+
+    def test_worst_case_nodes(self):
+        """Test that upgrades add surge nodes or a second blue-green pool."""
+        assert worst_case_nodes(10, "SURGE", 2) == 12
+        assert worst_case_nodes(10, None, None) == 11
+        assert worst_case_nodes(10, "BLUE_GREEN", None) == 20
+
+    def test_nat_ips(self):
+        """Test that one NAT address serves 1008 VMs at 64 ports each."""
+        assert nat_ips_needed(0) == 1
+        assert nat_ips_needed(1008) == 1
+        assert nat_ips_needed(1009) == 2
+
+    def test_prod_spec_demand(self):
+        """Test vCPU, disk, NAT and address-space demand of a prod platform."""
+        spec = PlatformSpec("acme-prod", "us-central1", "prod", "shop", {"max_nodes": 6})
+        usages = usages_by_metric(estimate(footprint_from_specs([spec])))
+
+        # 6 max nodes + 2 surge, n2-standard-4, 100GB pd-standard
+        assert usages["N2_CPUS"].demand == 32
+        assert usages["DISKS_TOTAL_GB"].demand == 800
+        assert usages["IN_USE_ADDRESSES"].demand == 1
+        assert usages["NODE_IPS/shop-prod-subnet"].limit == 65532
+        assert usages["POD_RANGE_NODES/shop-prod-subnet"].limit == 16
+        assert usages["POD_RANGE_NODES/shop-prod-subnet"].headroom == 8
+
+    def test_multi_region_demand_per_region(self):
+        """Test that each region of a multi-region platform is counted separately."""
+        spec = PlatformSpec(
+            "acme-prod", "us-central1", "prod", "shop", additional_regions=["europe-west4"]
+        )
+        usages = estimate(footprint_from_specs([spec]))
+        eu = usages_by_metric(usages, "europe-west4")
+        assert eu["N2_CPUS"].demand == 48
+        assert "NODE_IPS/shop-prod-europe-west4-subnet" in eu
+
+    def test_spot_fallback_pool_demand(self):
+        """Test that the on-demand fallback pool adds vCPUs and node IPs."""
+        spec = PlatformSpec(
+            "acme", "us-central1", "dev", "a", {"spot_fallback": True, "fallback_max_nodes": 2}
+        )
+        usages = usages_by_metric(estimate(footprint_from_specs([spec])))
+        # (3 + 1 surge) spot + (2 + 1 surge) on-demand e2-medium nodes
+        assert usages["CPUS"].demand == 7
+        assert usages["NODE_IPS/a-dev-subnet"].demand == 7
+
+    def test_regions_and_projects_aggregated(self):
+        """Test that platforms sharing a project and region add up."""
+        specs = [
+            PlatformSpec("acme", "us-central1", "dev", "a"),
+            PlatformSpec("acme", "us-central1", "dev", "b"),
+        ]
+        usages = usages_by_metric(estimate(footprint_from_specs(specs)))
+        # 2 x (3 max nodes + 1 default surge) x e2-medium (1 vCPU)
+        assert usages["CPUS"].demand == 8
+        assert usages["IN_USE_ADDRESSES"].demand == 2
+
+    def test_unknown_machine_type(self):
+        """Test that machine types missing from the catalog are rejected."""
+        pool = NodePoolFootprint("p", "us-central1", "pool", "x1-huge", 1, "pd-ssd", 10, "s")
+        with pytest.raises(ValueError):
+            estimate(Footprint(node_pools=[pool]))
+
+
+class TestQuotas:
+    """Tests for quota limits and headroom."""
+
+    def test_limits_and_headroom(self, tmp_path):
+        """Test that limits from the quota file produce headroom and status."""
+        path = tmp_path / "quotas.json"
+        path.write_text(
+            json.dumps({"acme-prod": {"us-central1": {"N2_CPUS": 40, "IN_USE_ADDRESSES": 1}}})
+        )
+        spec = PlatformSpec("acme-prod", "us-central1", "prod", "shop")
+        usages = usages_by_metric(estimate(footprint_from_specs([spec]), load_quotas(path)))
+
+        assert usages["N2_CPUS"].exceeded
+        assert usages["N2_CPUS"].headroom == -8
+        assert not usages["IN_USE_ADDRESSES"].exceeded
+        assert usages["IN_USE_ADDRESSES"].low
+        assert usages["DISKS_TOTAL_GB"].limit is None
+
+    def test_invalid_quota_file(self, tmp_path):
+        """Test that malformed quota files raise ValueError."""
+        path = tmp_path / "quotas.json"
+        path.write_text(json.dumps({"acme": ["CPUS"]}))
+        with pytest.raises(ValueError):
+            load_quotas(path)
+
+
+class TestSynth:
+    """Tests for estimating from synthesized stacks."""
+
+    def test_synth_matches_specs(self):
+        """Test that synthesized output yields the same demand as the spec."""
+        app = Testing.app()
+        stack = TerraformStack(app, "test")
+        GoogleProvider(stack, "Google", project="acme-prod", region="us-central1")
+        StandardPlatform(
+            stack,
+            "platform",
+            project_id="acme-prod",
+            region="us-central1",
+            env="prod",
+            prefix="shop",
+            additional_regions=["europe-west4"],
+        )
+        outdir = Testing.full_synth(stack)
+
+        spec = PlatformSpec(
+            "acme-prod", "us-central1", "prod", "shop", additional_regions=["europe-west4"]
+        )
+        from_synth = estimate(footprint_from_synth(outdir))
+        from_specs = estimate(footprint_from_specs([spec]))
+
+        def key(u):
+            return (u.project, u.region, u.metric, u.scope)
+
+        assert sorted(from_synth, key=key) == sorted(from_specs, key=key)
+
+    def test_cli_exit_code(self, tmp_path, capsys):
+        """Test that the CLI fails when a quota is exceeded."""
+        quotas = tmp_path / "quotas.json"
+        quotas.write_text(json.dumps({"my-project": {"us-central1": {"N2_CPUS": 1}}}))
+
+        assert main(["--quotas", str(quotas)]) == 1
+        assert "EXCEEDED" in capsys.readouterr().out
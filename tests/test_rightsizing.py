@@ -0,0 +1,218 @@
+"""
+Tests for the right-sizing advisor.
+"""
+
+import csv
+import json
+
+import pytest
+from infrastructure_lib.fleet import PlatformSpec, load_fleet
+from infrastructure_lib.rightsizing import (
+    UtilizationSummary,
+    aggregate_utilization,
+    apply_recommendations,
+    load_utilization,
+    main,
+    percentile,
+    read_columns,
+    read_samples,
+    recommend,
+)
+
+
+def write_csv(path, rows):
+    """Write utilization rows with the exported CSV header."""
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["platform", "timestamp", "node", "cpu_cores", "memory_gb"])
+        writer.writerows(rows)
+
+
+def summary(cpu_p50, cpu_p95, memory_p50, memory_p95):
+    """UtilizationSummary with peaks equal to p95."""
+    return UtilizationSummary(100, cpu_p50, cpu_p95, cpu_p95, memory_p50, memory_p95, memory_p95)
+
+
+class TestAggregation:
+    """Tests for loading and aggregating utilization samples."""
+
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentiles."""
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile([], 95) == 0.0
+
+    def test_rows_summed_per_timestamp(self, tmp_path):
+        """Test that per-node rows add up to cluster demand per timestamp."""
+        path = tmp_path / "usage.csv"
+        rows = []
+        for minute in range(20):
+            for node in range(2):
+                rows.append(["a-dev", f"t{minute:02d}", f"n{node}", minute + 1, 2 * (minute + 1)])
+        rows.append(["b-dev", "t00", "n0", 1, 1])
+        write_csv(path, rows)
+
+        summaries = aggregate_utilization(read_samples(path))
+
+        a = summaries["a-dev"]
+        assert a.samples == 20
+        assert (a.cpu_p50, a.cpu_p95, a.cpu_peak) == (20, 38, 40)
+        assert a.memory_peak == 80
+        assert summaries["b-dev"].samples == 1
+
+    def test_json_with_memory_bytes(self, tmp_path):
+        """Test JSON input with memory in bytes."""
+        path = tmp_path / "usage.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "samples": [
+                        {
+                            "platform": "a-dev",
+                            "timestamp": "t0",
+                            "cpu_cores": 1,
+                            "memory_bytes": 2**31,
+                        }
+                    ]
+                }
+            )
+        )
+        [sample] = read_samples(path)
+        assert sample == ("a-dev", "t0", 1.0, 2.0)
+
+    def test_vectorized_matches_rows(self, tmp_path):
+        """Test that column-wise aggregation gives the row-by-row summaries."""
+        pytest.importorskip("numpy")
+        path = tmp_path / "usage.csv"
+        rows = [
+            [f"{platform}-dev", f"t{minute:02d}", f"n{node}", minute * 0.1 + node, 3.3 * node]
+            for platform in ("a", "b")
+            for node in range(3)
+            for minute in range(30)
+        ]
+        write_csv(path, rows)
+
+        assert load_utilization(path) == aggregate_utilization(read_samples(path))
+        write_csv(path, [])
+        assert load_utilization(path) == {}
+
+    def test_non_ascii_platform_names(self, tmp_path):
+        """Test that non-ASCII platform names give the same keys on both paths."""
+        pytest.importorskip("numpy")
+        path = tmp_path / "usage.csv"
+        for names in (["shöp-dev"], ["şop-dev"], ["shöp-dev", "şop-dev"]):
+            write_csv(path, [[name, "t0", "n0", 1, 2] for name in names])
+            assert list(load_utilization(path)) == names
+            assert load_utilization(path) == aggregate_utilization(read_samples(path))
+
+    def test_columns_fall_back_to_rows(self, tmp_path):
+        """Test that exports numpy cannot parse are read row by row."""
+        pytest.importorskip("numpy")
+        path = tmp_path / "usage.csv"
+        path.write_text(
+            "platform,timestamp,cpu_cores,memory_gb,memory_bytes\n"
+            f"a-dev,t0,1,,{2**31}\n"
+            '"a-dev",t0,0.5,1,\n'
+        )
+        platforms, _, cpu, memory = read_columns(path)
+        assert list(platforms) == ["a-dev", "a-dev"]
+        assert (cpu.sum(), memory.sum()) == (1.5, 3.0)
+        assert load_utilization(path)["a-dev"].memory_peak == 3.0
+
+        path.write_text("platform,timestamp,cpu_cores,memory_gb\na-dev,t0,lots,1\n")
+        with pytest.raises(ValueError):
+            read_columns(path)
+
+    def test_invalid_sample(self, tmp_path):
+        """Test that rows without usage columns raise ValueError."""
+        path = tmp_path / "usage.json"
+        path.write_text(json.dumps([{"platform": "a-dev", "timestamp": "t0"}]))
+        with pytest.raises(ValueError):
+            list(read_samples(path))
+
+
+class TestRecommend:
+    """Tests for override recommendations."""
+
+    def test_prod_scales_up_and_keeps_ha(self):
+        """Test that busy prod gets a larger machine, 3+ nodes and no spot VMs."""
+        spec = PlatformSpec("p", "us-central1", "prod", "shop")
+        r = recommend(spec, summary(20, 30, 70, 100), max_nodes_limit=8)
+
+        assert r.overrides == {
+            "machine_type": "n2-standard-8",
+            "min_nodes": 4,
+            "max_nodes": 6,
+            "spot_instances": False,
+        }
+        assert not r.warnings
+
+    def test_idle_dev_scales_down(self):
+        """Test that an idle dev cluster shrinks to one node and keeps spot VMs."""
+        spec = PlatformSpec("p", "us-central1", "dev", "shop")
+        r = recommend(spec, summary(0.2, 0.5, 1, 2))
+
+        assert r.overrides["machine_type"] == "e2-standard-2"
+        assert (r.overrides["min_nodes"], r.overrides["max_nodes"]) == (1, 1)
+        assert r.overrides["spot_instances"] is True
+        assert r.changed == {"machine_type": "e2-standard-2", "max_nodes": 1}
+
+    def test_multi_region_sizes_every_cluster(self):
+        """Test that multi-region platforms are sized within every regional pod range."""
+        single = PlatformSpec("p", "us-central1", "prod", "shop")
+        multi = PlatformSpec(
+            "p", "us-central1", "prod", "shop", additional_regions=["europe-west4"]
+        )
+        demand = summary(20, 30, 70, 100)
+        assert recommend(multi, demand).overrides == recommend(single, demand).overrides
+
+    def test_memory_heavy_demand_uses_highmem(self):
+        """Test that the machine shape follows the memory/CPU ratio."""
+        spec = PlatformSpec("p", "us-central1", "staging", "shop")
+        r = recommend(spec, summary(2, 4, 40, 60))
+        assert r.overrides["machine_type"].startswith("n2-highmem-")
+
+    def test_demand_above_limit_warns(self):
+        """Test that demand beyond the largest machine at max_nodes is reported."""
+        spec = PlatformSpec("p", "us-central1", "prod", "shop")
+        r = recommend(spec, summary(500, 1000, 2000, 4000), max_nodes_limit=4)
+        assert r.overrides["machine_type"] == "n2-standard-64"
+        assert "above the limit" in r.warnings[0]
+
+    def test_autopilot_is_left_alone(self):
+        """Test that Autopilot platforms get no node overrides."""
+        spec = PlatformSpec("p", "us-central1", "dev", "shop", {"autopilot": True})
+        r = recommend(spec, summary(1, 2, 4, 8))
+        assert r.changed == {}
+
+    def test_invalid_target(self):
+        """Test that the target utilization is validated."""
+        spec = PlatformSpec("p", "us-central1", "dev", "shop")
+        with pytest.raises(ValueError):
+            recommend(spec, summary(1, 2, 4, 8), target_utilization=1.5)
+
+    def test_apply_recommendations(self):
+        """Test that recommendations merge into existing cluster overrides."""
+        spec = PlatformSpec("p", "us-central1", "prod", "shop", {"disk_size": 200})
+        r = recommend(spec, summary(20, 30, 70, 100), max_nodes_limit=8)
+        [sized] = apply_recommendations([spec], [r])
+        assert sized.cluster_overrides["disk_size"] == 200
+        assert sized.get_cluster_config().machine_type == "n2-standard-8"
+
+
+class TestCli:
+    """Tests for the command line interface."""
+
+    def test_write_fleet(self, tmp_path, capsys):
+        """Test that the CLI prints a table and writes a sized fleet spec."""
+        usage = tmp_path / "usage.csv"
+        write_csv(usage, [["platform-prod", "t0", "n0", 30, 100]])
+        out = tmp_path / "sized.json"
+
+        assert main([str(usage), "--max-nodes", "8", "--write-fleet", str(out)]) == 0
+
+        assert "platform-prod" in capsys.readouterr().out
+        specs = {s.name: s for s in load_fleet(out)}
+        assert specs["platform-prod"].cluster_overrides["machine_type"] == "n2-standard-8"
+        assert specs["platform-dev"].cluster_overrides == {}
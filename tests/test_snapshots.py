@@ -5,6 +5,8 @@ These tests verify that the synthesized Terraform JSON output
 matches expected baselines, catching unintended changes.
 """
 
+import json
+
 import pytest
 from cdktf import App, TerraformStack, Testing
 from cdktf_cdktf_provider_google.provider import GoogleProvider
@@ -15,7 +17,15 @@ from infrastructure_lib import (
     StandardCluster,
     StandardSecrets,
     StandardIdentity,
+    StandardRegistry,
+    StandardIngress,
+    StandardCache,
+    StandardDatabase,
+    StandardProvider,
+    StandardServices,
+    IngressBackend,
     DevProfile,
+    StagingProfile,
     ProdProfile,
 )
 
@@ -28,6 +38,69 @@ class TestStack(TerraformStack):
         GoogleProvider(self, "Google", project="test-project", region="us-central1")
 
 
+class TestStandardProviderSnapshot:
+    """Snapshot tests for StandardProvider construct."""
+
+    def test_provider_batching_and_labels(self):
+        """Test that the provider batches requests and labels resources."""
+        app = Testing.app()
+        stack = TerraformStack(app, "test")
+
+        profile = ProdProfile("test-project", "us-central1", "prod", "myapp")
+        StandardProvider.for_profile(stack, "google", profile, labels={"team": "platform"})
+
+        synth = Testing.synth(stack)
+
+        assert Testing.to_have_provider_with_properties(
+            synth,
+            "google",
+            {
+                "project": "test-project",
+                "region": "us-central1",
+                "batching": [{"enable_batching": True, "send_after": "10s"}],
+                "request_timeout": "60s",
+                "user_project_override": False,
+                "default_labels": {
+                    "environment": "prod",
+                    "managed-by": "cdktf",
+                    "project": "test-project",
+                    "team": "platform",
+                },
+            },
+        )
+        assert "billing_project" not in json.loads(synth)["provider"]["google"][0]
+
+    def test_provider_user_project_override_opt_in(self):
+        """Test that quota billing to another project is opt-in."""
+        app = Testing.app()
+        stack = TerraformStack(app, "test")
+
+        StandardProvider(
+            stack,
+            "google",
+            project_id="test-project",
+            region="us-central1",
+            user_project_override=True,
+            billing_project="quota-project",
+        )
+
+        assert Testing.to_have_provider_with_properties(
+            Testing.synth(stack),
+            "google",
+            {"user_project_override": True, "billing_project": "quota-project"},
+        )
+
+    def test_provider_rejects_invalid_duration(self):
+        """Test that batching and timeout durations are validated."""
+        app = Testing.app()
+        stack = TerraformStack(app, "test")
+
+        with pytest.raises(ValueError):
+            StandardProvider(
+                stack, "google", project_id="test-project", region="us-central1", send_after="10"
+            )
+
+
 class TestStandardVPCSnapshot:
     """Snapshot tests for StandardVPC construct."""
 
@@ -64,6 +137,150 @@ class TestStandardVPCSnapshot:
             synth, "google_compute_subnetwork", {"name": "myapp-dev-subnet"}
         )
 
+    def test_multi_region_vpc(self):
+        """Test that each region gets its own subnet, router and NAT in one VPC."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = ProdProfile("test-project", "us-central1", "prod", "myapp")
+        vpc = StandardVPC(
+            stack,
+            "vpc",
+            config=profile.get_network_config(additional_regions=["europe-west4"]),
+        )
+
+        resources = json.loads(Testing.synth(stack))["resource"]
+
+        assert len(resources["google_compute_network"]) == 1
+        assert len(resources["google_compute_router"]) == 2
+        assert len(resources["google_compute_router_nat"]) == 2
+        subnets = {s["region"]: s for s in resources["google_compute_subnetwork"].values()}
+        assert subnets["us-central1"]["ip_cidr_range"] == "10.0.0.0/16"
+        assert subnets["europe-west4"]["ip_cidr_range"] == "10.1.0.0/16"
+        assert subnets["europe-west4"]["name"] == "myapp-prod-europe-west4-subnet"
+        assert vpc.subnet is vpc.subnets["us-central1"]
+
+    def test_vpc_private_services_access(self):
+        """Test that private services access adds a peering range and connection."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = DevProfile("test-project", "us-central1", "dev", "myapp")
+        vpc = StandardVPC(
+            stack, "vpc", config=profile.get_network_config(private_services_access=True)
+        )
+
+        synth = Testing.synth(stack)
+
+        assert vpc.has_private_services_access
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_compute_global_address",
+            {
+                "name": "myapp-dev-psa-range",
+                "purpose": "VPC_PEERING",
+                "address": "10.20.0.0",
+                "prefix_length": 16,
+            },
+        )
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_service_networking_connection",
+            {"service": "servicenetworking.googleapis.com"},
+        )
+
+    def test_vpc_flow_logs_and_nat_logging(self):
+        """Test that profile telemetry settings reach the subnet and NAT."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = ProdProfile("test-project", "us-central1", "prod", "myapp")
+        StandardVPC(stack, "vpc", config=profile.get_network_config())
+
+        synth = Testing.synth(stack)
+
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_compute_subnetwork",
+            {
+                "log_config": {
+                    "aggregation_interval": "INTERVAL_5_SEC",
+                    "flow_sampling": 0.5,
+                    "metadata": "INCLUDE_ALL_METADATA",
+                }
+            },
+        )
+        assert Testing.to_have_resource_with_properties(
+            synth, "google_compute_router_nat", {"log_config": {"enable": True, "filter": "ALL"}}
+        )
+
+    def test_vpc_without_flow_logs(self):
+        """Test that disabling flow logs omits the subnet log config."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = DevProfile("test-project", "us-central1", "dev", "myapp")
+        StandardVPC(
+            stack, "vpc", config=profile.get_network_config(flow_logs=False, nat_logging=None)
+        )
+
+        synth = Testing.synth(stack)
+
+        assert not Testing.to_have_resource_with_properties(
+            synth, "google_compute_subnetwork", {"log_config": {"metadata": "EXCLUDE_ALL_METADATA"}}
+        )
+        assert not Testing.to_have_resource_with_properties(
+            synth, "google_compute_router_nat", {"log_config": {"enable": True}}
+        )
+
+    def test_vpc_psc_google_apis(self):
+        """Test that the PSC endpoint and private DNS zones route Google APIs internally."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = DevProfile("test-project", "us-central1", "dev", "myapp")
+        vpc = StandardVPC(
+            stack, "vpc", config=profile.get_network_config(psc_google_apis="all-apis")
+        )
+        services = StandardServices(stack, "services", project_id="test-project")
+
+        resources = json.loads(Testing.synth(stack))["resource"]
+
+        assert vpc.has_psc_google_apis
+        [address] = resources["google_compute_global_address"].values()
+        assert address["purpose"] == "PRIVATE_SERVICE_CONNECT"
+        assert address["address"] == "10.254.0.2"
+        [endpoint] = resources["google_compute_global_forwarding_rule"].values()
+        assert endpoint["name"] == "pscmyappdev"
+        assert endpoint["target"] == "all-apis"
+        assert endpoint["load_balancing_scheme"] == ""
+
+        zones = {z["dns_name"]: z for z in resources["google_dns_managed_zone"].values()}
+        assert set(zones) == {"googleapis.com.", "pkg.dev."}
+        assert all(z["visibility"] == "private" for z in zones.values())
+        records = {
+            (r["name"], r["type"]): r["rrdatas"]
+            for r in resources["google_dns_record_set"].values()
+        }
+        assert records[("googleapis.com.", "A")] == ["10.254.0.2"]
+        assert records[("*.googleapis.com.", "CNAME")] == ["googleapis.com."]
+        assert records[("*.pkg.dev.", "CNAME")] == ["pkg.dev."]
+        assert "dns.googleapis.com" in services.service_names
+
+    def test_vpc_without_private_services_access(self):
+        """Test that private services access is off by default."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = DevProfile("test-project", "us-central1", "dev", "myapp")
+        StandardVPC(stack, "vpc", config=profile.get_network_config())
+
+        synth = Testing.synth(stack)
+
+        assert not Testing.to_have_resource(synth, "google_service_networking_connection")
+        assert not Testing.to_have_resource(synth, "google_compute_global_forwarding_rule")
+        assert not Testing.to_have_resource(synth, "google_dns_managed_zone")
+
 
 class TestStandardClusterSnapshot:
     """Snapshot tests for StandardCluster construct."""
@@ -94,6 +311,55 @@ class TestStandardClusterSnapshot:
         assert Testing.to_have_resource(synth, "google_container_cluster")
         assert Testing.to_have_resource(synth, "google_container_node_pool")
 
+    def test_prod_cluster_telemetry(self):
+        """Test that the prod preset enables managed Prometheus and control plane metrics."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = ProdProfile("test-project", "us-central1", "prod", "myapp")
+        StandardCluster(
+            stack,
+            "cluster",
+            config=profile.get_cluster_config(),
+            network_id="mock-network-id",
+            subnet_id="mock-subnet-id",
+        )
+
+        synth = Testing.synth(stack)
+
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_container_cluster",
+            {
+                "monitoring_config": {
+                    "managed_prometheus": {"enabled": True},
+                    "enable_components": [
+                        "SYSTEM_COMPONENTS",
+                        "APISERVER",
+                        "SCHEDULER",
+                        "CONTROLLER_MANAGER",
+                        "STORAGE",
+                        "HPA",
+                        "POD",
+                        "DAEMONSET",
+                        "DEPLOYMENT",
+                        "STATEFULSET",
+                        "KUBELET",
+                        "CADVISOR",
+                    ],
+                },
+                "logging_config": {
+                    "enable_components": [
+                        "SYSTEM_COMPONENTS",
+                        "APISERVER",
+                        "CONTROLLER_MANAGER",
+                        "SCHEDULER",
+                        "WORKLOADS",
+                    ]
+                },
+            },
+        )
+
     def test_dev_cluster_uses_spot_instances(self):
         """Test that DevProfile enables spot instances."""
         app = Testing.app()
@@ -142,6 +408,281 @@ class TestStandardClusterSnapshot:
             {"node_config": {"spot": False}},
         )
 
+    def test_prod_cluster_surge_upgrades(self):
+        """Test that ProdProfile renders surge upgrade settings and management."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = ProdProfile("test-project", "us-central1", "prod", "myapp")
+        StandardCluster(
+            stack,
+            "cluster",
+            config=profile.get_cluster_config(),
+            network_id="mock-network-id",
+            subnet_id="mock-subnet-id",
+        )
+
+        synth = Testing.synth(stack)
+
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_container_node_pool",
+            {
+                "management": {"auto_repair": True, "auto_upgrade": True},
+                "upgrade_settings": {"strategy": "SURGE", "max_surge": 2, "max_unavailable": 0},
+            },
+        )
+
+    def test_cluster_blue_green_upgrades(self):
+        """Test that blue-green settings render the rollout policy."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = DevProfile("test-project", "us-central1", "dev", "myapp")
+        StandardCluster(
+            stack,
+            "cluster",
+            config=profile.get_cluster_config(
+                upgrade_strategy="BLUE_GREEN",
+                blue_green_soak_duration="1800s",
+                blue_green_batch_node_count=1,
+            ),
+            network_id="mock-network-id",
+            subnet_id="mock-subnet-id",
+        )
+
+        synth = Testing.synth(stack)
+
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_container_node_pool",
+            {
+                "upgrade_settings": {
+                    "strategy": "BLUE_GREEN",
+                    "blue_green_settings": {
+                        "node_pool_soak_duration": "1800s",
+                        "standard_rollout_policy": {"batch_node_count": 1},
+                    },
+                }
+            },
+        )
+
+    def test_cluster_node_tuning(self):
+        """Test that the high-throughput preset renders kubelet and Linux node config."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = ProdProfile("test-project", "us-central1", "prod", "myapp")
+        cluster_config = profile.get_cluster_config(
+            tuning_preset="high-throughput", hugepages_2m=512
+        )
+
+        StandardCluster(
+            stack,
+            "cluster",
+            config=cluster_config,
+            network_id="mock-network-id",
+            subnet_id="mock-subnet-id",
+        )
+
+        synth = Testing.synth(stack)
+
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_container_node_pool",
+            {
+                "node_config": {
+                    "kubelet_config": {
+                        "cpu_manager_policy": "static",
+                        "cpu_cfs_quota": False,
+                        "pod_pids_limit": 4096,
+                    },
+                    "linux_node_config": {
+                        "cgroup_mode": "CGROUP_MODE_V2",
+                        "sysctls": {"net.core.somaxconn": "4096"},
+                        "hugepages_config": {"hugepage_size_2m": 512},
+                    },
+                }
+            },
+        )
+
+    @staticmethod
+    def _synth_cluster(**overrides):
+        """Synthesize a prod cluster and return its google_container_cluster block."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = ProdProfile("test-project", "us-central1", "prod", "myapp")
+        vpc_config = profile.get_network_config()
+        cluster = StandardCluster(
+            stack,
+            "cluster",
+            config=profile.get_cluster_config(
+                pod_range_name=vpc_config.pod_range_name,
+                service_range_name=vpc_config.service_range_name,
+                **overrides,
+            ),
+            network_id="mock-network-id",
+            subnet_id="mock-subnet-id",
+        )
+        resources = json.loads(Testing.synth(stack))["resource"]
+        return cluster, resources
+
+    def test_autopilot_cluster(self):
+        """Test that autopilot creates a regional Autopilot cluster without node pool."""
+        cluster, resources = self._synth_cluster(autopilot=True)
+
+        [attrs] = resources["google_container_cluster"].values()
+        assert cluster.node_pool is None
+        assert "google_container_node_pool" not in resources
+        assert attrs["enable_autopilot"] is True
+        assert attrs["location"] == "us-central1"
+        assert "remove_default_node_pool" not in attrs
+
+    def test_autopilot_matches_standard_networking(self):
+        """Test that Autopilot keeps the private networking and Workload Identity setup."""
+        _, standard = self._synth_cluster()
+        _, autopilot = self._synth_cluster(autopilot=True)
+
+        [standard_attrs] = standard["google_container_cluster"].values()
+        [autopilot_attrs] = autopilot["google_container_cluster"].values()
+        for key in (
+            "name",
+            "network",
+            "subnetwork",
+            "ip_allocation_policy",
+            "private_cluster_config",
+            "workload_identity_config",
+            "monitoring_config",
+            "logging_config",
+            "deletion_protection",
+        ):
+            assert autopilot_attrs[key] == standard_attrs[key], key
+
+    @pytest.mark.parametrize(
+        "profile_class,env",
+        [(DevProfile, "dev"), (StagingProfile, "staging"), (ProdProfile, "prod")],
+    )
+    def test_profile_pod_autoscaling_addons(self, profile_class, env):
+        """Test that every profile enables VPA and the HPA addon on the cluster."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = profile_class("test-project", "us-central1", env, "myapp")
+        StandardCluster(
+            stack,
+            "cluster",
+            config=profile.get_cluster_config(),
+            network_id="mock-network-id",
+            subnet_id="mock-subnet-id",
+        )
+
+        synth = Testing.synth(stack)
+
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_container_cluster",
+            {
+                "name": f"myapp-{env}-cluster",
+                "vertical_pod_autoscaling": {"enabled": True},
+                "addons_config": {"horizontal_pod_autoscaling": {"disabled": False}},
+            },
+        )
+
+    def test_pod_autoscaling_defaults_omitted(self):
+        """Test that unset addons and Autopilot clusters keep the GKE defaults."""
+        _, resources = self._synth_cluster(
+            vertical_pod_autoscaling=None, horizontal_pod_autoscaling=None
+        )
+        [attrs] = resources["google_container_cluster"].values()
+        assert "vertical_pod_autoscaling" not in attrs
+        assert "addons_config" not in attrs
+
+        _, resources = self._synth_cluster(autopilot=True)
+        [attrs] = resources["google_container_cluster"].values()
+        assert "vertical_pod_autoscaling" not in attrs
+
+    def test_usage_metering(self):
+        """Test that prod exports usage to a regional BigQuery dataset with cost allocation."""
+        cluster, resources = self._synth_cluster()
+
+        dataset = resources["google_bigquery_dataset"][cluster.usage_dataset.friendly_unique_id]
+        assert dataset["dataset_id"] == "myapp_prod_gke_usage"
+        assert dataset["location"] == "us-central1"
+        assert dataset["delete_contents_on_destroy"] is False
+        assert cluster.has_usage_metering
+
+        dataset_key = cluster.usage_dataset.friendly_unique_id
+        [attrs] = resources["google_container_cluster"].values()
+        assert attrs["resource_usage_export_config"] == {
+            "bigquery_destination": {
+                "dataset_id": f"${{google_bigquery_dataset.{dataset_key}.dataset_id}}"
+            },
+            "enable_network_egress_metering": True,
+            "enable_resource_consumption_metering": True,
+        }
+        assert attrs["cost_management_config"] == {"enabled": True}
+
+    def test_usage_metering_off(self):
+        """Test that disabled metering creates no dataset and Autopilot keeps cost allocation."""
+        cluster, resources = self._synth_cluster(usage_metering=False, cost_allocation=False)
+        [attrs] = resources["google_container_cluster"].values()
+        assert "google_bigquery_dataset" not in resources
+        assert "resource_usage_export_config" not in attrs
+        assert "cost_management_config" not in attrs
+        assert not cluster.has_usage_metering
+
+        _, resources = self._synth_cluster(autopilot=True)
+        [attrs] = resources["google_container_cluster"].values()
+        assert "google_bigquery_dataset" not in resources
+        assert attrs["cost_management_config"] == {"enabled": True}
+
+    def test_spot_fallback_pools(self):
+        """Test that spot_fallback pairs the spot pool with a tainted on-demand pool."""
+        cluster, resources = self._synth_cluster(
+            spot_instances=True, spot_fallback=True, fallback_ratio=0.5
+        )
+
+        pools = resources["google_container_node_pool"]
+        spot = pools[cluster.node_pool.friendly_unique_id]
+        fallback = pools[cluster.fallback_node_pool.friendly_unique_id]
+        assert spot["node_config"]["spot"] is True
+        assert spot["node_config"]["labels"] == {"x-infra-kit/capacity": "spot"}
+        assert "taint" not in spot["node_config"]
+
+        assert fallback["name"] == "myapp-prod-cluster-ondemand-pool"
+        assert fallback["node_config"]["spot"] is False
+        assert fallback["node_config"]["labels"] == {"x-infra-kit/capacity": "on-demand"}
+        assert fallback["node_config"]["taint"] == [
+            {"key": "x-infra-kit/capacity", "value": "on-demand", "effect": "PREFER_NO_SCHEDULE"}
+        ]
+        assert fallback["initial_node_count"] == 0
+        assert fallback["autoscaling"]["min_node_count"] == 0
+        assert fallback["autoscaling"]["max_node_count"] == 5
+        assert fallback["node_config"]["machine_type"] == spot["node_config"]["machine_type"]
+
+        # The autoscaling profile is cluster-wide and opt-in
+        [attrs] = resources["google_container_cluster"].values()
+        assert "cluster_autoscaling" not in attrs
+
+    def test_autoscaling_profile(self):
+        """Test that autoscaling_profile sets the cluster autoscaler profile."""
+        _, resources = self._synth_cluster(autoscaling_profile="OPTIMIZE_UTILIZATION")
+
+        [attrs] = resources["google_container_cluster"].values()
+        assert attrs["cluster_autoscaling"]["autoscaling_profile"] == "OPTIMIZE_UTILIZATION"
+
+    def test_no_fallback_pool_by_default(self):
+        """Test that clusters without spot_fallback keep a single unlabelled pool."""
+        cluster, resources = self._synth_cluster()
+
+        [pool] = resources["google_container_node_pool"].values()
+        assert cluster.fallback_node_pool is None
+        assert "labels" not in pool["node_config"]
+        assert "cluster_autoscaling" not in next(
+            iter(resources["google_container_cluster"].values())
+        )
+
 
 class TestStandardSecretsSnapshot:
     """Snapshot tests for StandardSecrets construct."""
@@ -183,49 +724,424 @@ class TestStandardIdentitySnapshot:
         assert Testing.to_have_resource(synth, "google_service_account_iam_binding")
 
 
-class TestStandardPlatformSnapshot:
-    """Snapshot tests for StandardPlatform composite construct."""
+class TestStandardRegistrySnapshot:
+    """Snapshot tests for StandardRegistry construct."""
 
-    def test_platform_creates_all_resources(self):
-        """Test that StandardPlatform creates complete infrastructure."""
+    def test_registry_creates_expected_resources(self):
+        """Test that StandardRegistry creates a regional repository and reader IAM."""
         app = Testing.app()
         stack = TestStack(app, "test")
 
-        StandardPlatform(
+        StandardRegistry(
             stack,
-            "platform",
+            "registry",
             project_id="test-project",
             region="us-central1",
-            env="dev",
-            prefix="myapp",
+            repository_id="myapp",
+            reader_service_accounts=["nodes@test-project.iam.gserviceaccount.com"],
         )
 
         synth = Testing.synth(stack)
 
-        # Networking
-        assert Testing.to_have_resource(synth, "google_compute_network")
-        assert Testing.to_have_resource(synth, "google_compute_subnetwork")
-        assert Testing.to_have_resource(synth, "google_compute_router")
-        assert Testing.to_have_resource(synth, "google_compute_router_nat")
-
-        # GKE
-        assert Testing.to_have_resource(synth, "google_container_cluster")
-        assert Testing.to_have_resource(synth, "google_container_node_pool")
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_artifact_registry_repository",
+            {"location": "us-central1", "repository_id": "myapp", "format": "DOCKER"},
+        )
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_artifact_registry_repository_iam_member",
+            {
+                "role": "roles/artifactregistry.reader",
+                "member": "serviceAccount:nodes@test-project.iam.gserviceaccount.com",
+            },
+        )
 
-    def test_platform_with_secrets_and_identity(self):
-        """Test StandardPlatform with optional secrets and identity."""
+    def test_registry_docker_hub_cache(self):
+        """Test that the Docker Hub cache is a remote repository."""
         app = Testing.app()
         stack = TestStack(app, "test")
 
-        StandardPlatform(
+        registry = StandardRegistry(
             stack,
-            "platform",
+            "registry",
             project_id="test-project",
             region="us-central1",
-            env="prod",
-            prefix="myapp",
-            secret_ids=["db-password"],
-            workload_identity={
+            repository_id="myapp",
+            docker_hub_cache=True,
+        )
+
+        synth = Testing.synth(stack)
+
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_artifact_registry_repository",
+            {
+                "repository_id": "myapp-dockerhub",
+                "mode": "REMOTE_REPOSITORY",
+                "remote_repository_config": {
+                    "docker_repository": {"public_repository": "DOCKER_HUB"}
+                },
+            },
+        )
+        assert Testing.to_have_data_source(synth, "google_compute_default_service_account")
+        assert registry.cache_repository_url == (
+            "us-central1-docker.pkg.dev/test-project/myapp-dockerhub"
+        )
+
+    def test_registry_invalid_repository_id(self):
+        """Test that invalid repository IDs are rejected."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        with pytest.raises(ValueError):
+            StandardRegistry(
+                stack,
+                "registry",
+                project_id="test-project",
+                region="us-central1",
+                repository_id="My_Repo",
+            )
+
+
+class TestStandardIngressSnapshot:
+    """Snapshot tests for StandardIngress construct."""
+
+    def synth_ingress(self, **kwargs):
+        app = Testing.app()
+        stack = TestStack(app, "test")
+        StandardIngress(
+            stack,
+            "ingress",
+            project_id="test-project",
+            name="myapp-prod",
+            network_id="mock-network-id",
+            zones=["us-central1-a", "us-central1-b"],
+            backends=[
+                IngressBackend(name="web", neg_name="web-neg", port=8080),
+                IngressBackend(
+                    name="static", neg_name="static-neg", port=80, paths=["/static/*"], cdn=True
+                ),
+            ],
+            **kwargs,
+        )
+        return Testing.synth(stack)
+
+    def test_ingress_container_native_backends(self):
+        """Test that backends point at the NEGs in every zone."""
+        synth = self.synth_ingress()
+
+        assert Testing.to_have_resource(synth, "google_compute_global_address")
+        assert Testing.to_have_resource(synth, "google_compute_health_check")
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_compute_backend_service",
+            {
+                "name": "myapp-prod-web",
+                "load_balancing_scheme": "EXTERNAL_MANAGED",
+                "backend": [
+                    {
+                        "group": "projects/test-project/zones/us-central1-a/networkEndpointGroups/web-neg",
+                        "balancing_mode": "RATE",
+                    },
+                    {
+                        "group": "projects/test-project/zones/us-central1-b/networkEndpointGroups/web-neg"
+                    },
+                ],
+            },
+        )
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_compute_backend_service",
+            {"name": "myapp-prod-static", "enable_cdn": True},
+        )
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_compute_firewall",
+            {"source_ranges": ["35.191.0.0/16", "130.211.0.0/22"], "target_tags": ["gke-node"]},
+        )
+
+    def test_ingress_http_only_without_domains(self):
+        """Test that no certificate or HTTPS proxy is created without domains."""
+        synth = self.synth_ingress()
+
+        assert not Testing.to_have_resource(synth, "google_compute_managed_ssl_certificate")
+        assert not Testing.to_have_resource(synth, "google_compute_target_https_proxy")
+        assert Testing.to_have_resource_with_properties(
+            synth, "google_compute_global_forwarding_rule", {"port_range": "80"}
+        )
+
+    def test_ingress_https_with_domains(self):
+        """Test managed certificate, HTTPS frontend and HTTP redirect."""
+        synth = self.synth_ingress(domains=["shop.example.com"])
+
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_compute_managed_ssl_certificate",
+            {"managed": {"domains": ["shop.example.com"]}},
+        )
+        assert Testing.to_have_resource_with_properties(
+            synth, "google_compute_global_forwarding_rule", {"port_range": "443"}
+        )
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_compute_url_map",
+            {"default_url_redirect": {"https_redirect": True}},
+        )
+
+    def test_firewall_opens_target_ports(self):
+        """Test that the firewall opens the pods' target ports, not the Service ports."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+        ingress = StandardIngress(
+            stack,
+            "ingress",
+            project_id="test-project",
+            name="myapp-prod",
+            network_id="mock-network-id",
+            zones=["us-central1-a"],
+            backends=[
+                IngressBackend(name="web", neg_name="web-neg", port=80, target_port=8080),
+                IngressBackend(name="api", neg_name="api-neg", port=443, paths=["/api/*"]),
+            ],
+        )
+        resources = json.loads(Testing.synth(stack))["resource"]
+
+        firewall = resources["google_compute_firewall"][
+            ingress.health_check_firewall.friendly_unique_id
+        ]
+        assert firewall["allow"] == [{"protocol": "tcp", "ports": ["443", "8080"]}]
+        # The NEG annotation still names the Service port
+        backend = IngressBackend(name="web", neg_name="web-neg", port=80, target_port=8080)
+        assert StandardIngress.neg_annotation(backend) == (
+            '{"exposed_ports": {"80": {"name": "web-neg"}}}'
+        )
+
+    def test_neg_annotation(self):
+        """Test the Service annotation value for standalone NEGs."""
+        backend = IngressBackend(name="web", neg_name="web-neg", port=8080)
+        assert StandardIngress.neg_annotation(backend) == (
+            '{"exposed_ports": {"8080": {"name": "web-neg"}}}'
+        )
+
+
+class TestStandardCacheSnapshot:
+    """Snapshot tests for StandardCache construct."""
+
+    def test_prod_cache_uses_private_service_access_and_read_replicas(self):
+        """Test that the prod cache is private, HA and read-scaled."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = ProdProfile("test-project", "us-central1", "prod", "myapp")
+        StandardCache(
+            stack,
+            "cache",
+            config=profile.get_cache_config(),
+            network_id="mock-network-id",
+            reserved_ip_range="myapp-prod-psa-range",
+        )
+
+        synth = Testing.synth(stack)
+
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_redis_instance",
+            {
+                "name": "myapp-prod-cache",
+                "connect_mode": "PRIVATE_SERVICE_ACCESS",
+                "authorized_network": "mock-network-id",
+                "reserved_ip_range": "myapp-prod-psa-range",
+                "tier": "STANDARD_HA",
+                "replica_count": 2,
+                "read_replicas_mode": "READ_REPLICAS_ENABLED",
+            },
+        )
+
+
+class TestStandardDatabaseSnapshot:
+    """Snapshot tests for StandardDatabase construct."""
+
+    def test_prod_database_is_private_with_replica(self):
+        """Test that the prod database has no public IP and a read replica."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = ProdProfile("test-project", "us-central1", "prod", "myapp")
+        database = StandardDatabase(
+            stack,
+            "db",
+            config=profile.get_database_config(),
+            network_id="mock-network-id",
+            allocated_ip_range="myapp-prod-psa-range",
+        )
+
+        synth = Testing.synth(stack)
+
+        assert len(database.replicas) == 1
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_sql_database_instance",
+            {
+                "name": "myapp-prod-db",
+                "deletion_protection": True,
+                "settings": {
+                    "tier": "db-custom-4-16384",
+                    "availability_type": "REGIONAL",
+                    "ip_configuration": {
+                        "ipv4_enabled": False,
+                        "private_network": "mock-network-id",
+                        "allocated_ip_range": "myapp-prod-psa-range",
+                    },
+                    "insights_config": {"query_insights_enabled": True},
+                    "database_flags": [{"name": "log_min_duration_statement", "value": "500"}],
+                },
+            },
+        )
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_sql_database_instance",
+            {"name": "myapp-prod-db-replica-0", "settings": {"availability_type": "ZONAL"}},
+        )
+
+    def test_password_stored_in_secret_manager(self):
+        """Test that the generated password is written to Secret Manager."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = DevProfile("test-project", "us-central1", "dev", "myapp")
+        StandardDatabase(
+            stack,
+            "db",
+            config=profile.get_database_config(),
+            network_id="mock-network-id",
+            allocated_ip_range="myapp-dev-psa-range",
+        )
+
+        synth = Testing.synth(stack)
+
+        assert Testing.to_have_resource(synth, "random_password")
+        assert Testing.to_have_resource_with_properties(
+            synth, "google_secret_manager_secret", {"secret_id": "myapp-dev-db-password"}
+        )
+        assert Testing.to_have_resource(synth, "google_secret_manager_secret_version")
+        assert Testing.to_have_resource_with_properties(synth, "google_sql_user", {"name": "app"})
+        assert not Testing.to_have_resource_with_properties(
+            synth, "google_sql_database_instance", {"master_instance_name": "myapp-dev-db"}
+        )
+
+
+class TestStandardServicesSnapshot:
+    """Snapshot tests for StandardServices construct."""
+
+    def test_services_derived_from_constructs(self):
+        """Test that only the APIs of the constructs in use are enabled."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = DevProfile("test-project", "us-central1", "dev", "myapp")
+        StandardVPC(stack, "vpc", config=profile.get_network_config())
+        StandardSecrets(stack, "secrets", secret_ids=["api-key"])
+        services = StandardServices(stack, "services", project_id="test-project")
+
+        synth = Testing.synth(stack)
+
+        assert services.service_names == ["compute.googleapis.com", "secretmanager.googleapis.com"]
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_project_service",
+            {
+                "service": "compute.googleapis.com",
+                "disable_on_destroy": False,
+                "disable_dependent_services": False,
+            },
+        )
+        assert not Testing.to_have_resource_with_properties(
+            synth, "google_project_service", {"service": "container.googleapis.com"}
+        )
+
+    def test_resources_depend_on_their_services(self):
+        """Test that resources wait for the APIs they use, and only those."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = DevProfile("test-project", "us-central1", "dev", "myapp")
+        StandardVPC(stack, "vpc", config=profile.get_network_config())
+        StandardSecrets(stack, "secrets", secret_ids=["api-key"])
+        StandardServices(stack, "services", project_id="test-project")
+
+        synth = Testing.synth(stack)
+
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_compute_network",
+            {"depends_on": ["google_project_service.services_compute_514B51F8"]},
+        )
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_secret_manager_secret",
+            {"depends_on": ["google_project_service.services_secretmanager_C625173F"]},
+        )
+
+    def test_construct_subclasses_get_services(self):
+        """Test that subclasses of x-infra-kit constructs need the same APIs."""
+
+        class CustomVPC(StandardVPC):
+            pass
+
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        profile = DevProfile("test-project", "us-central1", "dev", "myapp")
+        CustomVPC(stack, "vpc", config=profile.get_network_config())
+        services = StandardServices(stack, "services", project_id="test-project")
+
+        assert services.service_names == ["compute.googleapis.com"]
+
+
+class TestStandardPlatformSnapshot:
+    """Snapshot tests for StandardPlatform composite construct."""
+
+    def test_platform_creates_all_resources(self):
+        """Test that StandardPlatform creates complete infrastructure."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        StandardPlatform(
+            stack,
+            "platform",
+            project_id="test-project",
+            region="us-central1",
+            env="dev",
+            prefix="myapp",
+        )
+
+        synth = Testing.synth(stack)
+
+        # Networking
+        assert Testing.to_have_resource(synth, "google_compute_network")
+        assert Testing.to_have_resource(synth, "google_compute_subnetwork")
+        assert Testing.to_have_resource(synth, "google_compute_router")
+        assert Testing.to_have_resource(synth, "google_compute_router_nat")
+
+        # GKE
+        assert Testing.to_have_resource(synth, "google_container_cluster")
+        assert Testing.to_have_resource(synth, "google_container_node_pool")
+
+    def test_platform_with_secrets_and_identity(self):
+        """Test StandardPlatform with optional secrets and identity."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        StandardPlatform(
+            stack,
+            "platform",
+            project_id="test-project",
+            region="us-central1",
+            env="prod",
+            prefix="myapp",
+            secret_ids=["db-password"],
+            workload_identity={
                 "sa_id": "workload-identity-sa",
                 "k8s_namespace": "default",
                 "k8s_sa_name": "app-sa",
@@ -242,6 +1158,265 @@ class TestStandardPlatformSnapshot:
         assert Testing.to_have_resource(synth, "google_service_account")
         assert Testing.to_have_resource(synth, "google_service_account_iam_binding")
 
+    def test_platform_with_registry_enables_image_streaming(self):
+        """Test that a registry wires image streaming into the node pool."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        platform = StandardPlatform(
+            stack,
+            "platform",
+            project_id="test-project",
+            region="us-central1",
+            env="dev",
+            prefix="myapp",
+            registry={},
+        )
+
+        synth = Testing.synth(stack)
+
+        assert platform.has_registry
+        assert Testing.to_have_resource_with_properties(
+            synth, "google_artifact_registry_repository", {"repository_id": "myapp-dev"}
+        )
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_container_node_pool",
+            {"node_config": {"gcfs_config": {"enabled": True}}},
+        )
+
+    def test_platform_with_ingress(self):
+        """Test that the ingress uses the platform network and cluster zone."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        platform = StandardPlatform(
+            stack,
+            "platform",
+            project_id="test-project",
+            region="us-central1",
+            env="dev",
+            prefix="myapp",
+            ingress={"backends": [{"name": "web", "neg_name": "web-neg", "port": 8080}]},
+        )
+
+        synth = Testing.synth(stack)
+
+        assert platform.has_ingress
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_compute_backend_service",
+            {
+                "backend": [
+                    {
+                        "group": "projects/test-project/zones/us-central1-a/networkEndpointGroups/web-neg"
+                    }
+                ]
+            },
+        )
+
+    def test_platform_autopilot(self):
+        """Test that StandardPlatform provisions Autopilot when selected."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        platform = StandardPlatform(
+            stack,
+            "platform",
+            project_id="test-project",
+            region="us-central1",
+            env="dev",
+            prefix="myapp",
+            autopilot=True,
+            ingress={
+                "backends": [{"name": "web", "neg_name": "web-neg", "port": 8080}],
+                "zones": ["us-central1-a", "us-central1-b"],
+            },
+        )
+
+        synth = Testing.synth(stack)
+
+        assert platform.cluster.node_pool is None
+        assert not Testing.to_have_resource(synth, "google_container_node_pool")
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_container_cluster",
+            {"enable_autopilot": True, "location": "us-central1"},
+        )
+        resources = json.loads(synth)["resource"]
+        [backend_service] = resources["google_compute_backend_service"].values()
+        assert len(backend_service["backend"]) == 2
+
+        # Health-check firewall targets the tag GKE puts on Autopilot nodes
+        [cluster] = resources["google_container_cluster"].values()
+        node_tags = cluster["node_pool_auto_config"]["network_tags"]["tags"]
+        [firewall] = resources["google_compute_firewall"].values()
+        assert firewall["target_tags"] == ["gke-node"]
+        assert set(firewall["target_tags"]) <= set(node_tags)
+
+    def test_platform_autopilot_ingress_requires_zones(self):
+        """Test that Autopilot ingress needs explicit NEG zones."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        with pytest.raises(ValueError):
+            StandardPlatform(
+                stack,
+                "platform",
+                project_id="test-project",
+                region="us-central1",
+                env="dev",
+                prefix="myapp",
+                autopilot=True,
+                ingress={"backends": [{"name": "web", "neg_name": "web-neg", "port": 8080}]},
+            )
+
+    def test_platform_multi_region(self):
+        """Test that every region gets a cluster on its own subnet."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        platform = StandardPlatform(
+            stack,
+            "platform",
+            project_id="test-project",
+            region="us-central1",
+            env="prod",
+            prefix="myapp",
+            additional_regions=["europe-west4"],
+            ingress={"backends": [{"name": "web", "neg_name": "web-neg", "port": 8080}]},
+        )
+
+        resources = json.loads(Testing.synth(stack))["resource"]
+
+        clusters = {c["name"]: c for c in resources["google_container_cluster"].values()}
+        assert sorted(clusters) == ["myapp-prod-cluster", "myapp-prod-cluster-euw4"]
+        eu = clusters["myapp-prod-cluster-euw4"]
+        assert eu["location"] == "europe-west4-a"
+        assert "platform_networking_subnet_europe-west4" in eu["subnetwork"]
+        assert eu["private_cluster_config"]["master_ipv4_cidr_block"] == "172.16.0.16/28"
+        assert len(resources["google_container_node_pool"]) == 2
+        assert sorted(platform.cluster_endpoints) == ["europe-west4", "us-central1"]
+
+        # The global load balancer gets NEGs in both regions
+        [backend_service] = resources["google_compute_backend_service"].values()
+        assert len(backend_service["backend"]) == 2
+
+    def test_platform_with_cache(self):
+        """Test that a cache enables private services access on the VPC."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        platform = StandardPlatform(
+            stack,
+            "platform",
+            project_id="test-project",
+            region="us-central1",
+            env="dev",
+            prefix="myapp",
+            cache={"memory_size_gb": 2},
+        )
+
+        synth = Testing.synth(stack)
+
+        assert platform.has_cache
+        assert Testing.to_have_resource(synth, "google_service_networking_connection")
+        assert Testing.to_have_resource_with_properties(
+            synth, "google_redis_instance", {"tier": "BASIC", "memory_size_gb": 2}
+        )
+
+    def test_platform_with_database(self):
+        """Test that a database enables private services access on the VPC."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        platform = StandardPlatform(
+            stack,
+            "platform",
+            project_id="test-project",
+            region="us-central1",
+            env="dev",
+            prefix="myapp",
+            database={"tier": "db-custom-2-7680"},
+        )
+
+        synth = Testing.synth(stack)
+
+        assert platform.has_database
+        assert not platform.has_cache
+        assert Testing.to_have_resource(synth, "google_service_networking_connection")
+        assert Testing.to_have_resource_with_properties(
+            synth,
+            "google_sql_database_instance",
+            {"name": "myapp-dev-db", "settings": {"tier": "db-custom-2-7680"}},
+        )
+
+    def test_platform_enables_services(self):
+        """Test that the platform enables exactly the APIs it uses."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        platform = StandardPlatform(
+            stack,
+            "platform",
+            project_id="test-project",
+            region="us-central1",
+            env="dev",
+            prefix="myapp",
+            cache={},
+        )
+
+        assert platform.services.service_names == [
+            "compute.googleapis.com",
+            "container.googleapis.com",
+            "redis.googleapis.com",
+            "servicenetworking.googleapis.com",
+        ]
+
+    def test_prod_platform_enables_bigquery(self):
+        """Test that usage metering in prod enables BigQuery before the dataset is created."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        platform = StandardPlatform(
+            stack,
+            "platform",
+            project_id="test-project",
+            region="us-central1",
+            env="prod",
+            prefix="myapp",
+        )
+
+        assert "bigquery.googleapis.com" in platform.services.service_names
+        bigquery = platform.services.services["bigquery.googleapis.com"]
+        resources = json.loads(Testing.synth(stack))["resource"]
+        dataset = resources["google_bigquery_dataset"][
+            platform.cluster.usage_dataset.friendly_unique_id
+        ]
+        assert f"google_project_service.{bigquery.friendly_unique_id}" in dataset["depends_on"]
+
+    def test_platform_without_services(self):
+        """Test that API enablement can be turned off."""
+        app = Testing.app()
+        stack = TestStack(app, "test")
+
+        platform = StandardPlatform(
+            stack,
+            "platform",
+            project_id="test-project",
+            region="us-central1",
+            env="dev",
+            prefix="myapp",
+            enable_services=False,
+        )
+
+        synth = Testing.synth(stack)
+
+        assert not platform.has_services
+        assert not Testing.to_have_resource(synth, "google_project_service")
+        with pytest.raises(ValueError):
+            _ = platform.services
+
     def test_valid_terraform_output(self):
         """Test that synthesized output is valid Terraform."""
         app = Testing.app()
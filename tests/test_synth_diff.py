@@ -0,0 +1,103 @@
+"""
+Tests for the structural synth diff tool.
+"""
+
+import json
+
+from cdktf import TerraformStack, Testing
+from cdktf_cdktf_provider_google.provider import GoogleProvider
+from infrastructure_lib import StandardPlatform
+from infrastructure_lib.synth_diff import (
+    REPLACE,
+    UPDATE,
+    changed_paths,
+    diff_synth,
+    load_stacks,
+    main,
+    strip_metadata,
+)
+
+
+def synth_platform(**cluster_overrides):
+    """Synthesize a dev StandardPlatform and return the parsed JSON."""
+    app = Testing.app()
+    stack = TerraformStack(app, "test")
+    GoogleProvider(stack, "Google", project="test-project", region="us-central1")
+    StandardPlatform(
+        stack,
+        "platform",
+        project_id="test-project",
+        region="us-central1",
+        env="dev",
+        prefix="myapp",
+        **cluster_overrides,
+    )
+    return json.loads(Testing.synth(stack))
+
+
+class TestNormalization:
+    """Tests for metadata stripping and path computation."""
+
+    def test_strip_metadata(self):
+        """Test that '//' blocks are removed at every level."""
+        value = {"//": {"metadata": {"path": "a/b"}}, "name": "x", "nested": [{"//": 1, "a": 2}]}
+        assert strip_metadata(value) == {"name": "x", "nested": [{"a": 2}]}
+
+    def test_changed_paths_nested(self):
+        """Test that nested changes produce dotted paths without list indices."""
+        old = {"node_config": {"machine_type": "a"}, "ranges": [{"cidr": "1"}]}
+        new = {"node_config": {"machine_type": "b"}, "ranges": [{"cidr": "2"}]}
+        assert changed_paths(old, new) == ["node_config.machine_type", "ranges.cidr"]
+
+
+class TestSynthDiff:
+    """Tests for change classification on real synthesized stacks."""
+
+    def test_no_changes(self):
+        """Test that identical synth outputs produce no changes."""
+        assert diff_synth({"s": synth_platform()}, {"s": synth_platform()}) == []
+
+    def test_machine_type_forces_replacement(self):
+        """Test that changing the node pool machine type is a replacement."""
+        changes = diff_synth(
+            {"s": synth_platform()}, {"s": synth_platform(machine_type="e2-standard-4")}
+        )
+        assert len(changes) == 1
+        assert changes[0].resource_type == "google_container_node_pool"
+        assert changes[0].action == REPLACE
+        assert changes[0].force_new_attributes == ["node_config.machine_type"]
+
+    def test_autoscaling_is_in_place(self):
+        """Test that changing autoscaling bounds is an in-place update."""
+        changes = diff_synth({"s": synth_platform()}, {"s": synth_platform(max_nodes=5)})
+        assert [c.action for c in changes] == [UPDATE]
+        assert changes[0].attributes == ["autoscaling.max_node_count"]
+
+    def test_bigquery_dataset_location_forces_replacement(self):
+        """Test that moving a BigQuery dataset is a replacement."""
+        old = {
+            "resource": {"google_bigquery_dataset": {"ds": {"dataset_id": "a", "location": "US"}}}
+        }
+        new = {
+            "resource": {"google_bigquery_dataset": {"ds": {"dataset_id": "a", "location": "EU"}}}
+        }
+        changes = diff_synth({"s": old}, {"s": new})
+        assert [c.action for c in changes] == [REPLACE]
+        assert changes[0].force_new_attributes == ["location"]
+
+    def test_depends_on_is_ignored(self):
+        """Test that a depends_on-only change is not reported."""
+        old = {"resource": {"google_dns_record_set": {"r": {"name": "a.", "depends_on": []}}}}
+        new = {"resource": {"google_dns_record_set": {"r": {"name": "a.", "depends_on": ["x"]}}}}
+        assert diff_synth({"s": old}, {"s": new}) == []
+
+    def test_cli_detailed_exitcode(self, tmp_path, capsys):
+        """Test the CLI on cdktf.out style directories."""
+        for name, synth in (("old", synth_platform()), ("new", synth_platform(disk_size=80))):
+            stack_dir = tmp_path / name / "stacks" / "test"
+            stack_dir.mkdir(parents=True)
+            (stack_dir / "cdk.tf.json").write_text(json.dumps(synth))
+
+        assert set(load_stacks(tmp_path / "old")) == {"test"}
+        assert main([str(tmp_path / "old"), str(tmp_path / "new"), "--detailed-exitcode"]) == 2
+        assert "forces replacement: node_config.disk_size_gb" in capsys.readouterr().out
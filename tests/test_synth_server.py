@@ -0,0 +1,132 @@
+"""
+Tests for the persistent synth server.
+"""
+
+import json
+import os
+
+import pytest
+from infrastructure_lib.synth_server import LIBRARY_DIR, SynthServer
+
+
+def write_fleet(path, platforms):
+    """Write a fleet spec and bump its mtime so the server sees the change."""
+    path.write_text(json.dumps({"platforms": platforms}))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+DEV = {"project_id": "acme-dev", "region": "us-central1", "env": "dev", "prefix": "shop"}
+PROD = {"project_id": "acme-prod", "region": "us-central1", "env": "prod", "prefix": "shop"}
+
+
+class TestFleetMode:
+    """Tests for incremental fleet synthesis."""
+
+    def test_first_run_synthesizes_all(self, tmp_path):
+        """Test that every platform becomes a stack with a manifest entry."""
+        fleet = tmp_path / "fleet.json"
+        write_fleet(fleet, [DEV, PROD])
+        server = SynthServer(tmp_path / "out", fleet=fleet)
+
+        run = server.run_once()
+
+        assert sorted(run.synthesized) == ["shop-dev", "shop-prod"]
+        manifest = json.loads((tmp_path / "out" / "manifest.json").read_text())
+        assert sorted(manifest["stacks"]) == ["shop-dev", "shop-prod"]
+        assert (tmp_path / "out" / "stacks" / "shop-prod" / "cdk.tf.json").exists()
+
+    def test_only_changed_stacks_resynthesized(self, tmp_path):
+        """Test that editing one platform re-synthesizes only that stack."""
+        fleet = tmp_path / "fleet.json"
+        write_fleet(fleet, [DEV, PROD])
+        server = SynthServer(tmp_path / "out", fleet=fleet)
+        server.run_once()
+
+        write_fleet(fleet, [DEV, {**PROD, "cluster_overrides": {"max_nodes": 20}}])
+        changed = server.poll()
+        run = server.run_once(changed)
+
+        assert changed == [fleet]
+        assert run.synthesized == ["shop-prod"]
+        assert run.unchanged == ["shop-dev"]
+        synth = json.loads((tmp_path / "out" / "stacks" / "shop-prod" / "cdk.tf.json").read_text())
+        pool = next(iter(synth["resource"]["google_container_node_pool"].values()))
+        assert pool["autoscaling"]["max_node_count"] == 20
+        manifest = json.loads((tmp_path / "out" / "manifest.json").read_text())
+        assert sorted(manifest["stacks"]) == ["shop-dev", "shop-prod"]
+
+    def test_removed_platform_deleted(self, tmp_path):
+        """Test that platforms removed from the spec are removed from the output."""
+        fleet = tmp_path / "fleet.json"
+        write_fleet(fleet, [DEV, PROD])
+        server = SynthServer(tmp_path / "out", fleet=fleet)
+        server.run_once()
+
+        write_fleet(fleet, [DEV])
+        run = server.run_once(server.poll())
+
+        assert run.removed == ["shop-prod"]
+        assert run.synthesized == []
+        assert not (tmp_path / "out" / "stacks" / "shop-prod").exists()
+        manifest = json.loads((tmp_path / "out" / "manifest.json").read_text())
+        assert list(manifest["stacks"]) == ["shop-dev"]
+
+    def test_duplicate_names_rejected(self, tmp_path):
+        """Test that two platforms with the same prefix/env are rejected."""
+        fleet = tmp_path / "fleet.json"
+        write_fleet(fleet, [DEV, {**DEV, "project_id": "other"}])
+
+        with pytest.raises(ValueError):
+            SynthServer(tmp_path / "out", fleet=fleet).run_once()
+
+
+APP = """
+from cdktf import App, TerraformStack
+from cdktf_cdktf_provider_google.provider import GoogleProvider
+from infrastructure_lib import StandardVPC, DevProfile
+
+app = App(outdir={outdir!r})
+stack = TerraformStack(app, "network")
+GoogleProvider(stack, "Google", project="acme-dev", region="us-central1")
+profile = DevProfile("acme-dev", "us-central1", "dev", "shop")
+StandardVPC(stack, "vpc", config=profile.get_network_config(cidr={cidr!r}))
+app.synth()
+"""
+
+
+class TestAppMode:
+    """Tests for executing an app file in-process."""
+
+    def test_unchanged_output_reported(self, tmp_path):
+        """Test that re-running an app reports stacks with identical output as unchanged."""
+        outdir = tmp_path / "out"
+        app = tmp_path / "app.py"
+        app.write_text(APP.format(outdir=str(outdir), cidr="10.0.0.0/16"))
+        server = SynthServer(outdir, app=app)
+
+        assert server.run_once().synthesized == ["network"]
+        assert server.run_once().unchanged == ["network"]
+
+        app.write_text(APP.format(outdir=str(outdir), cidr="10.1.0.0/16"))
+        assert server.run_once(server.poll()).synthesized == ["network"]
+
+
+class TestWatching:
+    """Tests for file polling."""
+
+    def test_poll_reports_nothing_without_changes(self, tmp_path):
+        """Test that an idle poll is empty."""
+        fleet = tmp_path / "fleet.json"
+        write_fleet(fleet, [DEV])
+        server = SynthServer(tmp_path / "out", fleet=fleet)
+
+        assert server.poll() == []
+        assert LIBRARY_DIR / "composites.py" in server.watched_files
+
+    def test_requires_exactly_one_input(self, tmp_path):
+        """Test that fleet and app are mutually exclusive."""
+        with pytest.raises(ValueError):
+            SynthServer(tmp_path / "out")
+        with pytest.raises(ValueError):
+            SynthServer(tmp_path / "out", fleet="fleet.json", app="main.py")